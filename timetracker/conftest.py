@@ -1,8 +1,10 @@
 import os
+import timeit
 
 import factory
 import pytest
 from django.conf import settings
+from django.core.cache import cache
 from django.test import RequestFactory, Client
 
 
@@ -25,6 +27,45 @@ class UserFactory(factory.django.DjangoModelFactory):
         return manager.create_user(*args, **kwargs)
 
 
+@pytest.fixture
+def benchmark_timer(capsys):
+    """
+    Fixture to get a function that times a callable and reports the
+    result.
+
+    The returned function accepts a label, the callable to time, and
+    optionally the number of calls per round, the number of rounds, and
+    a callable run before each round. It returns the fastest time per
+    call, in seconds.
+    """
+    def timer(label, func, number=10, repeat=5, setup='pass'):
+        timings = timeit.repeat(
+            func,
+            number=number,
+            repeat=repeat,
+            setup=setup,
+        )
+        best = min(timings) / number
+
+        with capsys.disabled():
+            print(f'\n{label}: {best * 1000:.3f} ms per call')
+
+        return best
+
+    return timer
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """
+    Fixture to ensure values cached by one test are not visible to other
+    tests.
+    """
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def client():
     """
@@ -0,0 +1,187 @@
+import argparse
+import builtins
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import time
+
+
+class ImportTimer:
+    """
+    Context manager recording how long each newly imported module takes
+    to import.
+
+    This provides similar information to Python's ``-X importtime``
+    option, which is not available on Python 3.6.
+    """
+
+    def __init__(self):
+        """
+        Initialize the timer with no recorded imports.
+        """
+        self.timings = []
+        self._original_import = None
+        self._original_import_module = None
+        self._stack = []
+
+    def __enter__(self):
+        """
+        Start recording imports.
+
+        Both import statements and ``importlib.import_module``, which
+        Django uses to load apps, are recorded.
+
+        Returns:
+            The timer instance.
+        """
+        self._original_import = builtins.__import__
+        self._original_import_module = importlib.import_module
+
+        builtins.__import__ = self._import
+        importlib.import_module = self._import_module
+
+        return self
+
+    def __exit__(self, *args):
+        """
+        Stop recording imports.
+        """
+        builtins.__import__ = self._original_import
+        importlib.import_module = self._original_import_module
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """
+        Handle an import statement, recording the time taken if the
+        module was not previously imported.
+        """
+        label = name
+
+        if level:
+            package = (globals or {}).get('__package__')
+            if not package:
+                return self._original_import(
+                    name,
+                    globals,
+                    locals,
+                    fromlist,
+                    level,
+                )
+
+            label = importlib.util.resolve_name('.' * level + name, package)
+
+        # Statements like 'from package import module' import a
+        # submodule of an already imported package.
+        if label in sys.modules and fromlist:
+            missing = [
+                f'{label}.{item}'
+                for item in fromlist
+                if f'{label}.{item}' not in sys.modules
+            ]
+            # Attributing the time to the first submodule is good enough
+            # for statements importing multiple submodules.
+            if missing:
+                label = missing[0]
+
+        return self._record(
+            label,
+            self._original_import,
+            name,
+            globals,
+            locals,
+            fromlist,
+            level,
+        )
+
+    def _import_module(self, name, package=None):
+        """
+        Handle a call to ``importlib.import_module``, recording the time
+        taken if the module was not previously imported.
+        """
+        if name.startswith('.'):
+            return self._original_import_module(name, package)
+
+        return self._record(name, self._original_import_module, name, package)
+
+    def _record(self, label, import_func, *args):
+        """
+        Perform an import and record the time it took.
+
+        Args:
+            label:
+                The absolute name of the module being imported.
+            import_func:
+                The function that performs the import.
+            *args:
+                The arguments to call the import function with.
+
+        Returns:
+            The result of the import function.
+        """
+        if label in sys.modules:
+            return import_func(*args)
+
+        # Time spent importing child modules is subtracted from the
+        # parent to get the time spent in the parent itself.
+        self._stack.append(0)
+        start = time.perf_counter()
+
+        try:
+            return import_func(*args)
+        finally:
+            cumulative = time.perf_counter() - start
+            children = self._stack.pop()
+
+            # Names imported with 'from package import name' may be
+            # attributes rather than modules. Their time is left to the
+            # importing module.
+            if label in sys.modules:
+                if self._stack:
+                    self._stack[-1] += cumulative
+
+                self.timings.append({
+                    'cumulative': cumulative,
+                    'module': label,
+                    'self': cumulative - children,
+                })
+
+
+def profile_import(module_name, setup=False):
+    """
+    Import a module and record the time taken by each module imported.
+
+    Args:
+        module_name:
+            The name of the module to import.
+        setup:
+            A boolean indicating if Django should be set up before the
+            module is imported. This is required for modules that use
+            the app registry, and the time taken is not recorded.
+
+    Returns:
+        A list of dictionaries containing the name of each imported
+        module, the time spent in the module itself, and the cumulative
+        time including the modules it imported, in seconds.
+    """
+    if setup:
+        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'timetracker.settings')
+
+        import django
+        django.setup()
+
+    with ImportTimer() as timer:
+        __import__(module_name)
+
+    return timer.timings
+
+
+if __name__ == '__main__':
+    # Run as a script so the import can be profiled in a fresh
+    # interpreter where no modules have been imported yet.
+    parser = argparse.ArgumentParser()
+    parser.add_argument('module')
+    parser.add_argument('--setup', action='store_true')
+    args = parser.parse_args()
+
+    json.dump(profile_import(args.module, args.setup), sys.stdout)
@@ -0,0 +1,48 @@
+from django.utils.module_loading import import_string
+
+
+class LazyView:
+    """
+    A view whose module is only imported the first time it handles a
+    request.
+
+    This keeps heavy dependencies used by a small number of views out of
+    the URLconf, so they are not loaded by processes that never serve
+    those views.
+    """
+
+    def __init__(self, view_path, csrf_exempt=False, **initkwargs):
+        """
+        Initialize the lazy view.
+
+        Args:
+            view_path:
+                The dotted path of the class based view to load.
+            csrf_exempt:
+                A boolean indicating if the view is exempt from CSRF
+                protection. This must be known before the view is loaded
+                because the CSRF middleware checks it before calling the
+                view. Django REST Framework views are always exempt
+                because they perform their own CSRF checks.
+            **initkwargs:
+                Keyword arguments to pass to the view's ``as_view``
+                method.
+        """
+        self.csrf_exempt = csrf_exempt
+        self.initkwargs = initkwargs
+        self.view_path = view_path
+
+        self._view = None
+
+    def __call__(self, request, *args, **kwargs):
+        """
+        Load the view if necessary and handle the request with it.
+
+        Returns:
+            The response from the loaded view.
+        """
+        if self._view is None:
+            view_class = import_string(self.view_path)
+            self._view = view_class.as_view(**self.initkwargs)
+
+        return self._view(request, *args, **kwargs)
@@ -0,0 +1,95 @@
+import json
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Command to profile the time taken to import a module in a fresh
+    interpreter.
+    """
+
+    help = (
+        "Profile the modules imported when loading a module, by default the "
+        "WSGI application, and list the slowest."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the command's arguments.
+
+        Args:
+            parser:
+                The parser to add arguments to.
+        """
+        parser.add_argument(
+            'module',
+            default=settings.WSGI_APPLICATION.rsplit('.', 1)[0],
+            help='The module to profile. Defaults to the WSGI module.',
+            nargs='?',
+        )
+        parser.add_argument(
+            '--limit',
+            default=20,
+            help='The number of modules to list.',
+            type=int,
+        )
+        parser.add_argument(
+            '--setup',
+            action='store_true',
+            help=(
+                'Set up Django before importing the module. This is required '
+                'for modules that use models, such as URLconfs.'
+            ),
+        )
+        parser.add_argument(
+            '--sort',
+            choices=('cumulative', 'self'),
+            default='self',
+            help=(
+                "Sort by the time spent in each module itself or including "
+                "the modules it imports."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+        """
+        # The import must happen in a new interpreter because most
+        # modules are already imported in this one.
+        command = [sys.executable, '-m', 'core.importtime', options['module']]
+        if options['setup']:
+            command.append('--setup')
+
+        result = subprocess.run(
+            command,
+            cwd=settings.BASE_DIR,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+        )
+
+        if result.returncode != 0:
+            raise CommandError(
+                f"Failed to import '{options['module']}':\n{result.stderr}",
+            )
+
+        timings = json.loads(result.stdout)
+        total = max(timing['cumulative'] for timing in timings)
+
+        self.stdout.write(
+            f"Imported {len(timings)} modules in {total * 1000:.1f} ms",
+        )
+        self.stdout.write(f"{'self (ms)':>10} {'cumulative (ms)':>16}  module")
+
+        timings.sort(key=lambda timing: timing[options['sort']], reverse=True)
+        for timing in timings[:options['limit']]:
+            self.stdout.write(
+                f"{timing['self'] * 1000:>10.1f} "
+                f"{timing['cumulative'] * 1000:>16.1f}  "
+                f"{timing['module']}"
+            )
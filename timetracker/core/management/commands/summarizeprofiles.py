@@ -0,0 +1,90 @@
+import io
+import pstats
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+from core import profiling
+
+
+class Command(BaseCommand):
+    """
+    Command to summarize the request profiles saved by the profiling
+    middleware.
+    """
+
+    help = (
+        "List the functions and queries that took the most time across the "
+        "requests captured by the profiling middleware."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the command's arguments.
+
+        Args:
+            parser:
+                The parser to add arguments to.
+        """
+        parser.add_argument(
+            '--directory',
+            default=settings.PROFILING_DIRECTORY,
+            help=(
+                'The directory containing the captured profiles. Defaults to '
+                'the PROFILING_DIRECTORY setting.'
+            ),
+        )
+        parser.add_argument(
+            '--limit',
+            default=20,
+            help='The number of functions and queries to list.',
+            type=int,
+        )
+        parser.add_argument(
+            '--sort',
+            choices=('cumulative', 'tottime'),
+            default='cumulative',
+            help=(
+                "Sort functions by the time spent in them including or "
+                "excluding the functions they call."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+        """
+        profiles, details = profiling.load_captures(options['directory'])
+        if not profiles:
+            raise CommandError(
+                f"There are no captured profiles in '{options['directory']}'.",
+            )
+
+        durations = sorted(
+            request_details['duration'] for request_details in details
+        )
+        self.stdout.write(
+            f"Summarizing {len(profiles)} captured request(s), taking "
+            f"{durations[len(durations) // 2] * 1000:.1f} ms at the median "
+            f"and {durations[-1] * 1000:.1f} ms at most.",
+        )
+
+        self.stdout.write('')
+        self.stdout.write('Functions:')
+        # The command's output wrapper appends a newline to each write,
+        # which doesn't suit the way 'pstats' prints.
+        output = io.StringIO()
+        stats = pstats.Stats(*profiles, stream=output)
+        stats.strip_dirs().sort_stats(options['sort'])
+        stats.print_stats(options['limit'])
+        self.stdout.write(output.getvalue())
+
+        self.stdout.write('Queries:')
+        self.stdout.write(f"{'total (ms)':>11} {'count':>7}  sql")
+        queries = profiling.summarize_queries(details, options['limit'])
+        for query in queries:
+            self.stdout.write(
+                f"{query['total_duration'] * 1000:>11.1f} "
+                f"{query['count']:>7}  "
+                f"{query['sql']}"
+            )
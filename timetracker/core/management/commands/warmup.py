@@ -0,0 +1,26 @@
+from django.core.management import BaseCommand
+
+from core import warmup
+
+
+class Command(BaseCommand):
+    """
+    Command to compile templates, import forms, and populate the URL
+    resolver, reporting how long each step takes.
+    """
+
+    help = (
+        "Compile the site's templates, import forms, and populate the URL "
+        "resolver. Because these caches are held in memory, this is mainly "
+        "useful for verifying templates compile and measuring the work "
+        "saved by setting 'DJANGO_WARMUP_ENABLED'."
+    )
+
+    def handle(self, *args, **kwargs):
+        """
+        Execute the command.
+        """
+        for name, count, duration in warmup.warm_up():
+            self.stdout.write(f'{name}: {count} in {duration * 1000:.1f} ms')
+
+        self.stdout.write(self.style.SUCCESS('Warmup complete.'))
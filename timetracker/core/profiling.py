@@ -0,0 +1,287 @@
+import cProfile
+import glob
+import json
+import logging
+import os
+import random
+import time
+import uuid
+from collections import defaultdict
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+
+logger = logging.getLogger(__name__)
+
+
+# The suffixes of the files storing the profile and the request details
+# of each capture. Both files of a capture share the same name.
+PROFILE_SUFFIX = '.prof'
+DETAILS_SUFFIX = '.json'
+
+
+class QueryRecorder:
+    """
+    Database execution wrapper recording each query and its duration.
+
+    Queries are recorded with their parameter placeholders rather than
+    their values, so repeated queries can be grouped together.
+    """
+
+    def __init__(self):
+        """
+        Initialize the recorder with no recorded queries.
+        """
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        """
+        Execute a query and record how long it took.
+        """
+        start = time.perf_counter()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append({
+                'alias': context['connection'].alias,
+                'duration': time.perf_counter() - start,
+                'sql': sql,
+            })
+
+
+def rotate_captures(directory, max_captures):
+    """
+    Remove the oldest captures from a directory.
+
+    Args:
+        directory:
+            The directory containing the captures.
+        max_captures:
+            The number of captures to keep.
+
+    Returns:
+        The number of captures that were removed.
+    """
+    details = sorted(glob.glob(os.path.join(directory, '*' + DETAILS_SUFFIX)))
+    stale = details[:max(len(details) - max_captures, 0)]
+
+    for path in stale:
+        stem = path[:-len(DETAILS_SUFFIX)]
+
+        for stale_path in (path, stem + PROFILE_SUFFIX):
+            try:
+                os.remove(stale_path)
+            except FileNotFoundError:
+                # Another process rotated the capture first.
+                pass
+
+    return len(stale)
+
+
+def save_capture(directory, profiler, details, max_captures):
+    """
+    Save a profile and the details of the request it was captured from.
+
+    Args:
+        directory:
+            The directory to save the capture in. It is created if it
+            does not exist.
+        profiler:
+            The ``cProfile.Profile`` instance that profiled the request.
+        details:
+            A JSON serializable dictionary describing the request.
+        max_captures:
+            The number of captures to keep in the directory.
+
+    Returns:
+        The path of the saved profile.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    # Names sort by capture time, which rotation relies on.
+    stem = os.path.join(
+        directory,
+        f'{time.time():017.6f}-{uuid.uuid4().hex[:8]}',
+    )
+
+    profiler.dump_stats(stem + PROFILE_SUFFIX)
+    with open(stem + DETAILS_SUFFIX, 'w') as f:
+        json.dump(details, f)
+
+    rotate_captures(directory, max_captures)
+
+    return stem + PROFILE_SUFFIX
+
+
+def load_captures(directory):
+    """
+    Load the captures saved in a directory.
+
+    Args:
+        directory:
+            The directory containing the captures.
+
+    Returns:
+        A tuple containing a list of the paths of the saved profiles and
+        a list of the details of each captured request.
+    """
+    profiles = []
+    details = []
+
+    pattern = os.path.join(directory, '*' + DETAILS_SUFFIX)
+
+    for path in sorted(glob.glob(pattern)):
+        profile = path[:-len(DETAILS_SUFFIX)] + PROFILE_SUFFIX
+        if not os.path.exists(profile):
+            continue
+
+        with open(path) as f:
+            details.append(json.load(f))
+        profiles.append(profile)
+
+    return profiles, details
+
+
+def summarize_queries(details, limit=None):
+    """
+    Combine the queries of several captured requests.
+
+    Args:
+        details:
+            The details of the captured requests.
+        limit:
+            The maximum number of queries to return.
+
+    Returns:
+        A list of dictionaries containing the ``sql``, ``count``, and
+        ``total_duration`` of each distinct query, with the queries that
+        took the longest in total first.
+    """
+    totals = defaultdict(lambda: {'count': 0, 'total_duration': 0.0})
+
+    for request_details in details:
+        for query in request_details.get('queries', ()):
+            total = totals[query['sql']]
+            total['count'] += 1
+            total['total_duration'] += query['duration']
+
+    summary = sorted(
+        (dict(sql=sql, **total) for sql, total in totals.items()),
+        key=lambda query: query['total_duration'],
+        reverse=True,
+    )
+
+    return summary[:limit]
+
+
+class ProfilingMiddleware:
+    """
+    Profile a sample of requests and save the slow ones.
+
+    Requests are profiled if a staff user sends the ``PROFILING_HEADER``
+    header, or at random with a probability of ``PROFILING_SAMPLE_RATE``.
+    Profiled requests taking at least ``PROFILING_SLOW_MS`` milliseconds,
+    and every request profiled on demand, are saved to
+    ``PROFILING_DIRECTORY`` along with the SQL they executed.
+
+    The middleware removes itself unless ``PROFILING_ENABLED`` is set, so
+    it costs nothing when profiling is off.
+    """
+
+    def __init__(self, get_response):
+        """
+        Initialize the middleware.
+
+        Args:
+            get_response:
+                A function to get the response from the next middleware
+                or the view itself.
+
+        Raises:
+            MiddlewareNotUsed:
+                If profiling is disabled.
+        """
+        if not settings.PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """
+        Process a request, profiling it if it is selected.
+
+        Returns:
+            The response from either the view or the next middleware.
+        """
+        requested = self.is_requested(request)
+        if not requested and random.random() >= settings.PROFILING_SAMPLE_RATE:
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        recorder = QueryRecorder()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+            duration = time.perf_counter() - start
+
+        if requested or duration * 1000 >= settings.PROFILING_SLOW_MS:
+            details = {
+                'duration': duration,
+                'method': request.method,
+                'path': request.path,
+                'queries': recorder.queries,
+                'status_code': response.status_code,
+                'time': time.time(),
+            }
+
+            try:
+                path = save_capture(
+                    settings.PROFILING_DIRECTORY,
+                    profiler,
+                    details,
+                    settings.PROFILING_MAX_CAPTURES,
+                )
+            except OSError:
+                logger.exception('Failed to save profile of %s', request.path)
+            else:
+                logger.info(
+                    'Saved profile of %s %s taking %.0fms to %s',
+                    request.method,
+                    request.path,
+                    duration * 1000,
+                    path,
+                )
+
+        return response
+
+    @staticmethod
+    def is_requested(request):
+        """
+        Determine if a request asks to be profiled.
+
+        Args:
+            request:
+                The request to check.
+
+        Returns:
+            A boolean indicating if the request includes the profiling
+            header and was made by a staff user.
+        """
+        if settings.PROFILING_HEADER not in request.META:
+            return False
+
+        user = getattr(request, 'user', None)
+
+        return bool(user is not None and user.is_staff)
@@ -1,11 +1,82 @@
+import functools
+
 from django import template
-from django.urls import reverse
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.urls import get_script_prefix, get_urlconf, reverse
 from django.utils.html import format_html
 
 
 register = template.Library()
 
 
+HTML_FORMAT_STR = '<li class="nav-item"><a class="{}" href="{}">{}</a></li>'
+
+
+@functools.lru_cache(maxsize=1024)
+def cached_reverse(url_name, url_args=(), urlconf=None, script_prefix='/'):
+    """
+    Reverse a URL, memoizing the result.
+
+    The URLconf and script prefix are accepted so that they become part
+    of the cache key, since both affect the reversed URL.
+
+    Args:
+        url_name:
+            The name of the URL to reverse.
+        url_args:
+            A tuple of arguments used to reverse the URL.
+        urlconf:
+            The URLconf to reverse the URL with. Defaults to the
+            ``ROOT_URLCONF`` setting.
+        script_prefix:
+            The script prefix that was active when the URL was
+            reversed.
+
+    Returns:
+        The reversed URL.
+    """
+    return reverse(url_name, urlconf=urlconf, args=url_args)
+
+
+# Typed so that safe strings are not conflated with plain strings that
+# would be escaped.
+@functools.lru_cache(maxsize=1024, typed=True)
+def render_nav_link(link_text, url, is_active):
+    """
+    Render the HTML for a navbar link, memoizing the result.
+
+    Args:
+        link_text:
+            The text to display in the navigation link.
+        url:
+            The URL the link points to.
+        is_active:
+            A boolean indicating if the link points to the current page.
+
+    Returns:
+        An HTML snippet containing the code for the navbar link.
+    """
+    link_classes = 'nav-link active' if is_active else 'nav-link'
+
+    return format_html(HTML_FORMAT_STR, link_classes, url, link_text)
+
+
+@receiver(setting_changed)
+def clear_nav_cache(setting, **kwargs):
+    """
+    Clear the memoized URLs when the URLconf is changed.
+
+    Args:
+        setting:
+            The name of the setting that was changed.
+        **kwargs:
+            Additional information about the changed setting.
+    """
+    if setting == 'ROOT_URLCONF':
+        cached_reverse.cache_clear()
+
+
 @register.simple_tag(takes_context=True)
 def nav_link(context, link_text, url_name, *url_args):
     """
@@ -28,11 +99,16 @@ def nav_link(context, link_text, url_name, *url_args):
         An HTML snippet containing the code for the navbar link.
     """
     current_path = context['request'].path
-    url = reverse(url_name, *url_args)
 
-    link_classes = 'nav-link' if current_path != url else 'nav-link active'
-    html_format_str = (
-        '<li class="nav-item"><a class="{}" href="{}">{}</a></li>'
-    )
+    try:
+        url = cached_reverse(
+            url_name,
+            url_args,
+            get_urlconf(),
+            get_script_prefix(),
+        )
+    except TypeError:
+        # The URL arguments are not hashable, so they can't be cached.
+        url = reverse(url_name, args=url_args)
 
-    return format_html(html_format_str, link_classes, url, link_text)
+    return render_nav_link(link_text, url, current_path == url)
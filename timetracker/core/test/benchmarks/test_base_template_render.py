@@ -0,0 +1,53 @@
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.template.loader import get_template
+
+from core.templatetags import nav_helpers
+
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+def render_base(request_factory):
+    """
+    Fixture to get a function that renders the base template.
+    """
+    template = get_template('base.html')
+    request = request_factory.get('/')
+    request.user = AnonymousUser()
+
+    return lambda: template.render({}, request)
+
+
+def test_base_template_render(benchmark_timer, render_base):
+    """
+    Measure the time to render the base template that wraps every page
+    with and without memoized navigation links.
+    """
+    def uncached():
+        nav_helpers.cached_reverse.cache_clear()
+        nav_helpers.render_nav_link.cache_clear()
+        render_base()
+
+    render_base()
+
+    benchmark_timer('base template (uncached)', uncached)
+    benchmark_timer('base template (cached)', render_base)
+
+    # Once memoized, rendering the navigation should neither reverse
+    # URLs nor build link HTML again.
+    with mock.patch.object(
+            nav_helpers,
+            'reverse',
+            wraps=nav_helpers.reverse) as reverse, \
+            mock.patch.object(
+                nav_helpers,
+                'format_html',
+                wraps=nav_helpers.format_html) as format_html:
+        render_base()
+
+    assert not reverse.called
+    assert not format_html.called
@@ -0,0 +1,77 @@
+from unittest import mock
+
+import pytest
+from django.template import engines
+from django.template.base import Template
+from django.urls import clear_url_caches, reverse
+
+from core import warmup
+from core.templatetags import nav_helpers
+
+
+pytestmark = pytest.mark.benchmark
+
+
+def reset_process_caches():
+    """
+    Reset the in-memory caches that are populated as a process serves
+    its first requests.
+    """
+    for loader in engines['django'].engine.template_loaders:
+        if hasattr(loader, 'reset'):
+            loader.reset()
+
+    clear_url_caches()
+    nav_helpers.cached_reverse.cache_clear()
+    nav_helpers.render_nav_link.cache_clear()
+
+
+def warm_process_caches():
+    """
+    Reset the process caches and then warm them up.
+    """
+    reset_process_caches()
+    warmup.warm_up()
+
+
+def count_compiled_templates(client, url, setup):
+    """
+    Count the templates compiled while serving a request after running
+    a setup function.
+    """
+    setup()
+
+    with mock.patch.object(
+            Template,
+            'compile_nodelist',
+            autospec=True,
+            side_effect=Template.compile_nodelist) as compile_nodelist:
+        client.get(url)
+
+    return compile_nodelist.call_count
+
+
+@pytest.mark.parametrize('url_name', ['account:login', 'home'])
+def test_first_request(benchmark_timer, client, db, url_name):
+    """
+    Measure the latency of the first request served by a process with
+    and without warming it up, and check that a warmed up process does
+    not compile any templates.
+    """
+    url = reverse(url_name)
+
+    benchmark_timer(
+        f'first request to {url} (cold)',
+        lambda: client.get(url),
+        number=1,
+        setup=reset_process_caches,
+    )
+    benchmark_timer(
+        f'first request to {url} (warmed up)',
+        lambda: client.get(url),
+        number=1,
+        setup=warm_process_caches,
+    )
+
+    assert count_compiled_templates(client, url, reset_process_caches) > 0
+    assert count_compiled_templates(client, url, warm_process_caches) == 0
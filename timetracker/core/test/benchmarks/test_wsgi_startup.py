@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from django.conf import settings
+
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_wsgi_startup(benchmark_timer):
+    """
+    Measure the time for a new interpreter to load the WSGI application
+    and its URLconf, beyond the time to start the interpreter itself.
+    """
+    env = os.environ.copy()
+    env.setdefault('DJANGO_SECRET_KEY', 'test')
+    command = [
+        sys.executable,
+        '-c',
+        'import timetracker.wsgi, timetracker.urls',
+    ]
+
+    def start():
+        subprocess.run(command, check=True, cwd=settings.BASE_DIR, env=env)
+
+    def start_interpreter():
+        subprocess.run([sys.executable, '-c', 'pass'], check=True)
+
+    benchmark_timer('interpreter startup', start_interpreter, number=1)
+    benchmark_timer('WSGI application startup', start, number=1)
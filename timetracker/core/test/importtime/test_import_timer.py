@@ -0,0 +1,71 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+
+from core import importtime
+
+
+def test_import_timer_nested(monkeypatch, tmp_path):
+    """
+    The timer should record each newly imported module, excluding the
+    time spent in child imports from a module's own time.
+    """
+    (tmp_path / 'timer_parent.py').write_text('import timer_child\n')
+    (tmp_path / 'timer_child.py').write_text('VALUE = 1\n')
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        timings = importtime.profile_import('timer_parent')
+    finally:
+        sys.modules.pop('timer_child', None)
+        sys.modules.pop('timer_parent', None)
+
+    by_module = {timing['module']: timing for timing in timings}
+    parent = by_module['timer_parent']
+    child = by_module['timer_child']
+
+    assert set(by_module) == {'timer_child', 'timer_parent'}
+    assert parent['cumulative'] >= child['cumulative']
+    assert parent['self'] == parent['cumulative'] - child['cumulative']
+
+
+# Loads the WSGI application and its URLconf, resolves an API URL as the
+# first request to a process would, and prints the imported modules.
+STARTUP_SCRIPT = """
+import json
+import sys
+
+import timetracker.wsgi
+from django.urls import resolve, reverse
+
+resolve(reverse('vms:api:dialogflow'))
+json.dump(sorted(sys.modules), sys.stdout)
+"""
+
+
+def test_wsgi_startup_skips_optional_dependencies():
+    """
+    Loading the WSGI application and URLconf should not import
+    dependencies that are only needed to serve the API or send email.
+    """
+    env = os.environ.copy()
+    env['DJANGO_SES_ENABLED'] = 'true'
+    env.setdefault('DJANGO_SECRET_KEY', 'test')
+
+    result = subprocess.run(
+        [sys.executable, '-c', STARTUP_SCRIPT],
+        check=True,
+        cwd=settings.BASE_DIR,
+        env=env,
+        stdout=subprocess.PIPE,
+    )
+    modules = set(json.loads(result.stdout))
+
+    assert 'timetracker.urls' in modules
+    assert 'vms.api.urls' in modules
+    assert 'boto' not in modules
+    assert 'django_ses' not in modules
+    assert 'rest_framework.generics' not in modules
@@ -0,0 +1,36 @@
+from unittest import mock
+
+from core.lazy import LazyView
+
+
+def test_call_loads_view_once(request_factory):
+    """
+    The view should be imported and instantiated on the first request
+    and reused for later requests.
+    """
+    view_class = mock.Mock(name='Mock view class')
+    view = LazyView('foo.BarView', baz='qux')
+    request = request_factory.get('/')
+
+    with mock.patch(
+            'core.lazy.import_string',
+            return_value=view_class) as mock_import:
+        view(request, 1)
+        response = view(request, 2)
+
+    assert mock_import.call_count == 1
+    assert mock_import.call_args[0] == ('foo.BarView',)
+    assert view_class.as_view.call_args[1] == {'baz': 'qux'}
+    assert view_class.as_view.return_value.call_args[0] == (request, 2)
+    assert response == view_class.as_view.return_value.return_value
+
+
+def test_csrf_exempt():
+    """
+    The view's CSRF exemption should be available before it is loaded.
+    """
+    with mock.patch('core.lazy.import_string') as mock_import:
+        assert LazyView('foo.BarView', csrf_exempt=True).csrf_exempt
+        assert not LazyView('foo.BarView').csrf_exempt
+
+    assert mock_import.call_count == 0
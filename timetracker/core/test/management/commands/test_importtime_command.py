@@ -0,0 +1,28 @@
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+
+def test_importtime():
+    """
+    The command should list the slowest modules imported when loading
+    the WSGI application.
+    """
+    output = StringIO()
+
+    call_command('importtime', '--limit', '3', stdout=output)
+
+    lines = output.getvalue().splitlines()
+
+    assert lines[0].startswith('Imported')
+    # A summary and header line followed by the requested modules
+    assert len(lines) == 5
+
+
+def test_importtime_invalid_module():
+    """
+    If the module can't be imported, an error should be raised.
+    """
+    with pytest.raises(CommandError):
+        call_command('importtime', 'does.not.exist', stdout=StringIO())
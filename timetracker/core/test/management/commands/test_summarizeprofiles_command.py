@@ -0,0 +1,51 @@
+import cProfile
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from core import profiling
+
+
+def test_summarizeprofiles(tmpdir):
+    """
+    The command should list the functions and queries from the captured
+    profiles.
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    sorted(range(100))
+    profiler.disable()
+
+    for duration in (0.1, 0.3):
+        profiling.save_capture(
+            str(tmpdir),
+            profiler,
+            {
+                'duration': duration,
+                'queries': [{'duration': 0.01, 'sql': 'SELECT 1'}],
+            },
+            10,
+        )
+    output = StringIO()
+
+    call_command(
+        'summarizeprofiles',
+        '--directory',
+        str(tmpdir),
+        stdout=output,
+    )
+
+    value = output.getvalue()
+
+    assert value.startswith('Summarizing 2 captured request(s)')
+    assert 'sorted' in value
+    assert value.splitlines()[-1].split() == ['20.0', '2', 'SELECT', '1']
+
+
+def test_summarizeprofiles_no_captures(tmpdir):
+    """
+    If there are no captured profiles, an error should be raised.
+    """
+    with pytest.raises(CommandError):
+        call_command('summarizeprofiles', '--directory', str(tmpdir))
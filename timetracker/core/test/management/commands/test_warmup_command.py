@@ -0,0 +1,15 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+
+def test_warmup():
+    """
+    The command should report the result of each warmup step.
+    """
+    output = StringIO()
+
+    call_command('warmup', stdout=output)
+
+    assert 'templates:' in output.getvalue()
+    assert 'Warmup complete.' in output.getvalue()
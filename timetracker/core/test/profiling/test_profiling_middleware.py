@@ -0,0 +1,155 @@
+from unittest import mock
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.http import HttpResponse
+
+from core import profiling
+
+
+@pytest.fixture
+def profiling_settings(settings, tmpdir):
+    """
+    Fixture to enable profiling, saving captures to a temporary
+    directory.
+    """
+    settings.PROFILING_DIRECTORY = str(tmpdir.join('profiles'))
+    settings.PROFILING_ENABLED = True
+    settings.PROFILING_MAX_CAPTURES = 2
+    settings.PROFILING_SAMPLE_RATE = 0
+    settings.PROFILING_SLOW_MS = 60 * 1000
+
+    return settings
+
+
+def make_request(request_factory, user=None, **extra):
+    """
+    Build a request made by a user.
+    """
+    request = request_factory.get('/some/path/', **extra)
+    request.user = user or AnonymousUser()
+
+    return request
+
+
+def view(request):
+    """
+    A view that executes a query.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT 1')
+
+    return HttpResponse('OK')
+
+
+def test_disabled(settings):
+    """
+    The middleware should remove itself if profiling is disabled.
+    """
+    settings.PROFILING_ENABLED = False
+
+    with pytest.raises(MiddlewareNotUsed):
+        profiling.ProfilingMiddleware(view)
+
+
+@pytest.mark.django_db
+def test_requested_by_staff(profiling_settings, request_factory, user_factory):
+    """
+    Requests from staff users with the profiling header should be saved
+    along with their queries.
+    """
+    middleware = profiling.ProfilingMiddleware(view)
+    request = make_request(
+        request_factory,
+        user_factory(is_staff=True),
+        HTTP_X_PROFILE='1',
+    )
+
+    response = middleware(request)
+
+    profiles, details = profiling.load_captures(
+        profiling_settings.PROFILING_DIRECTORY,
+    )
+
+    assert response.status_code == 200
+    assert len(profiles) == 1
+    assert details[0]['path'] == '/some/path/'
+    assert 'SELECT 1' in [query['sql'] for query in details[0]['queries']]
+
+
+@pytest.mark.django_db
+def test_requested_by_non_staff(
+        profiling_settings,
+        request_factory,
+        user_factory):
+    """
+    The profiling header should be ignored for users who are not staff.
+    """
+    middleware = profiling.ProfilingMiddleware(view)
+    request = make_request(request_factory, user_factory(), HTTP_X_PROFILE='1')
+
+    with mock.patch('core.profiling.cProfile.Profile') as mock_profile:
+        middleware(request)
+
+    assert not mock_profile.called
+    assert profiling.load_captures(
+        profiling_settings.PROFILING_DIRECTORY,
+    ) == ([], [])
+
+
+@pytest.mark.django_db
+def test_sampled_fast_request(profiling_settings, request_factory):
+    """
+    Sampled requests that are faster than the threshold should not be
+    saved.
+    """
+    profiling_settings.PROFILING_SAMPLE_RATE = 1
+    middleware = profiling.ProfilingMiddleware(view)
+
+    middleware(make_request(request_factory))
+
+    assert profiling.load_captures(
+        profiling_settings.PROFILING_DIRECTORY,
+    ) == ([], [])
+
+
+@pytest.mark.django_db
+def test_sampled_slow_request(profiling_settings, request_factory):
+    """
+    Sampled requests that are slower than the threshold should be saved,
+    keeping only the most recent captures.
+    """
+    profiling_settings.PROFILING_SAMPLE_RATE = 1
+    profiling_settings.PROFILING_SLOW_MS = 0
+    middleware = profiling.ProfilingMiddleware(view)
+
+    for _ in range(3):
+        middleware(make_request(request_factory))
+
+    profiles, details = profiling.load_captures(
+        profiling_settings.PROFILING_DIRECTORY,
+    )
+
+    assert len(profiles) == 2
+    assert len(details) == 2
+
+
+def test_summarize_queries():
+    """
+    Identical queries should be combined and sorted by total duration.
+    """
+    details = [
+        {'queries': [
+            {'duration': 0.1, 'sql': 'A'},
+            {'duration': 0.5, 'sql': 'B'},
+        ]},
+        {'queries': [{'duration': 0.2, 'sql': 'A'}]},
+    ]
+
+    summary = profiling.summarize_queries(details)
+
+    assert [query['sql'] for query in summary] == ['B', 'A']
+    assert summary[1]['count'] == 2
+    assert summary[1]['total_duration'] == pytest.approx(0.3)
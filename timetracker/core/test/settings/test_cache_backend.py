@@ -0,0 +1,36 @@
+import runpy
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from timetracker import settings
+
+
+SETTINGS_PATH = settings.__file__
+
+
+def test_unknown_cache_backend(monkeypatch):
+    """
+    An unknown cache backend should be reported along with the valid
+    choices.
+    """
+    monkeypatch.setenv('DJANGO_CACHE_BACKEND', 'memcached')
+
+    with pytest.raises(ImproperlyConfigured) as excinfo:
+        runpy.run_path(SETTINGS_PATH)
+
+    assert "'memcached'" in str(excinfo.value)
+    assert 'file, locmem, redis' in str(excinfo.value)
+
+
+def test_cache_backend_case_insensitive(monkeypatch):
+    """
+    Cache backends should be selectable regardless of case.
+    """
+    monkeypatch.setenv('DJANGO_CACHE_BACKEND', 'File')
+
+    result = runpy.run_path(SETTINGS_PATH)
+
+    assert result['CACHES']['default']['BACKEND'] == (
+        'django.core.cache.backends.filebased.FileBasedCache'
+    )
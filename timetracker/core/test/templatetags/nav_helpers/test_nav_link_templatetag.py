@@ -1,7 +1,10 @@
+from unittest import mock
+
 from django.test import RequestFactory
 from django.urls import reverse
 from django.utils.html import format_html
 
+from core.templatetags import nav_helpers
 from core.templatetags.nav_helpers import nav_link
 
 
@@ -44,3 +47,34 @@ def test_nav_link_different_page():
     expected = format_html(HTML_FORMAT_STR, 'nav-link', url, link_text)
 
     assert nav_link(context, link_text, url_name) == expected
+
+
+def test_nav_link_reverse_cached():
+    """
+    Reversing the same URL multiple times should only resolve it once.
+    """
+    nav_helpers.cached_reverse.cache_clear()
+    factory = RequestFactory()
+    context = {
+        'request': factory.get('/'),
+    }
+
+    with mock.patch(
+            'core.templatetags.nav_helpers.reverse',
+            return_value='/') as mock_reverse:
+        nav_link(context, 'Home', 'home')
+        nav_link(context, 'Home', 'home')
+
+    assert mock_reverse.call_count == 1
+
+
+def test_nav_link_urlconf_changed(settings):
+    """
+    Changing the URLconf should clear the memoized URLs.
+    """
+    nav_helpers.cached_reverse('home')
+    assert nav_helpers.cached_reverse.cache_info().currsize > 0
+
+    settings.ROOT_URLCONF = 'core.urls'
+
+    assert nav_helpers.cached_reverse.cache_info().currsize == 0
@@ -0,0 +1,63 @@
+import copy
+
+from django.template import engines
+
+from core import warmup
+
+
+def test_compile_templates(settings):
+    """
+    Compiling the templates should store them in the cached template
+    loader.
+    """
+    # The cached loader is not used in debug mode, so enable it
+    # explicitly.
+    templates = copy.deepcopy(settings.TEMPLATES)
+    loaders = templates[0]['OPTIONS']['loaders']
+    if loaders[0][0] != 'django.template.loaders.cached.Loader':
+        templates[0]['OPTIONS']['loaders'] = [
+            ('django.template.loaders.cached.Loader', loaders),
+        ]
+    settings.TEMPLATES = templates
+
+    loader = engines['django'].engine.template_loaders[0]
+
+    count = warmup.compile_templates()
+
+    assert count == len(warmup.get_template_names())
+    assert 'base.html' in loader.get_template_cache
+
+
+def test_get_template_names():
+    """
+    The templates to compile should include project templates, app
+    templates, and the crispy forms template pack.
+    """
+    names = warmup.get_template_names()
+
+    assert 'base.html' in names
+    assert 'index.html' in names
+    assert 'registration/login.html' in names
+    assert 'vms/client-detail.html' in names
+    assert 'bootstrap4/field.html' in names
+
+
+def test_populate_url_resolver():
+    """
+    Populating the URL resolver should include namespaced URLs.
+    """
+    count = warmup.populate_url_resolver()
+
+    # At least the names in the 'vms' and 'account' namespaces.
+    assert count > 20
+
+
+def test_warm_up():
+    """
+    Warming up should run and report on each step.
+    """
+    results = warmup.warm_up()
+
+    assert [name for name, _, _ in results] == [
+        name for name, _ in warmup.WARMUP_STEPS
+    ]
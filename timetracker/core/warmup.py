@@ -0,0 +1,165 @@
+import importlib
+import logging
+import os
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.template import engines
+from django.template.loader import get_template
+from django.urls import get_resolver
+from django.utils.module_loading import module_has_submodule
+
+
+logger = logging.getLogger(__name__)
+
+
+# The apps whose templates and forms are loaded during warmup.
+WARMUP_APPS = ('account', 'core', 'vms')
+
+
+def _find_templates(directory):
+    """
+    Find the names of all templates in a directory.
+
+    Args:
+        directory:
+            The directory to search.
+
+    Returns:
+        A list of template names relative to the provided directory.
+    """
+    names = []
+
+    for root, _, files in os.walk(directory):
+        for filename in files:
+            path = os.path.join(root, filename)
+            names.append(os.path.relpath(path, directory).replace(os.sep, '/'))
+
+    return sorted(names)
+
+
+def get_template_names():
+    """
+    Get the names of the templates to compile during warmup.
+
+    This includes the project level templates, the templates of each app
+    in ``WARMUP_APPS``, and the templates of the active crispy forms
+    template pack.
+
+    Returns:
+        A list of template names.
+    """
+    names = []
+
+    for directory in engines['django'].dirs:
+        names.extend(_find_templates(directory))
+
+    for label in WARMUP_APPS:
+        app_dir = apps.get_app_config(label).path
+        names.extend(_find_templates(os.path.join(app_dir, 'templates')))
+
+    crispy_dir = os.path.join(
+        apps.get_app_config('crispy_forms').path,
+        'templates',
+    )
+    pack_dir = os.path.join(crispy_dir, settings.CRISPY_TEMPLATE_PACK)
+    names.extend(
+        f'{settings.CRISPY_TEMPLATE_PACK}/{name}'
+        for name in _find_templates(pack_dir)
+    )
+
+    return names
+
+
+def compile_templates():
+    """
+    Compile every warmup template so the cached template loader holds
+    them in memory.
+
+    Returns:
+        The number of templates that were compiled.
+    """
+    names = get_template_names()
+
+    for name in names:
+        get_template(name)
+
+    return len(names)
+
+
+def import_forms():
+    """
+    Import the forms module of each app in ``WARMUP_APPS``.
+
+    Returns:
+        The number of modules that were imported.
+    """
+    count = 0
+
+    for label in WARMUP_APPS:
+        module = apps.get_app_config(label).module
+
+        if module_has_submodule(module, 'forms'):
+            importlib.import_module(f'{module.__name__}.forms')
+            count += 1
+
+    return count
+
+
+def _populate_resolver(resolver):
+    """
+    Populate the lookup tables of a resolver and its namespaces.
+
+    Args:
+        resolver:
+            The resolver to populate.
+
+    Returns:
+        The number of URL names that can be reversed with the resolver.
+    """
+    count = sum(1 for key in resolver.reverse_dict if isinstance(key, str))
+
+    for _, sub_resolver in resolver.namespace_dict.values():
+        count += _populate_resolver(sub_resolver)
+
+    return count
+
+
+def populate_url_resolver():
+    """
+    Populate the URL resolver's lookup tables.
+
+    Returns:
+        The number of URL names that can be reversed.
+    """
+    return _populate_resolver(get_resolver())
+
+
+WARMUP_STEPS = (
+    ('forms', import_forms),
+    ('templates', compile_templates),
+    ('urls', populate_url_resolver),
+)
+
+
+def warm_up():
+    """
+    Perform the work that would otherwise be done by the first requests
+    served by a process.
+
+    Returns:
+        A list of tuples containing the name of each step, the number of
+        items it processed, and the number of seconds it took.
+    """
+    results = []
+
+    for name, step in WARMUP_STEPS:
+        start = time.perf_counter()
+        count = step()
+        duration = time.perf_counter() - start
+
+        logger.info('Warmed up %d %s in %.3fs', count, name, duration)
+        results.append((name, count, duration))
+
+    return results
@@ -12,6 +12,8 @@ https://docs.djangoproject.com/en/2.1/ref/settings/
 
 import os
 
+from django.core.exceptions import ImproperlyConfigured
+
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -67,6 +69,7 @@ MIDDLEWARE = [
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'account.middleware.TimezoneMiddleware',
+    'core.profiling.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'timetracker.urls'
@@ -75,7 +78,6 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -83,12 +85,51 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            'loaders': [
+                'django.template.loaders.filesystem.Loader',
+                'django.template.loaders.app_directories.Loader',
+            ],
         },
     },
 ]
 
+# Outside of debug mode, compiled templates are kept in memory for the
+# lifetime of the process. See 'WARMUP_ENABLED' for precompiling them
+# when the process starts.
+if not DEBUG:
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        (
+            'django.template.loaders.cached.Loader',
+            TEMPLATES[0]['OPTIONS']['loaders'],
+        ),
+    ]
+
 WSGI_APPLICATION = 'timetracker.wsgi.application'
 
+# If enabled, the WSGI application compiles templates, populates the
+# URL resolver, and imports forms when it is loaded rather than on the
+# first requests served by each process.
+WARMUP_ENABLED = os.getenv('DJANGO_WARMUP_ENABLED', 'false').lower() == 'true'
+
+
+# Profiling
+
+# If enabled, a sample of requests are profiled and the slow ones are
+# saved along with the SQL they executed. Staff users can profile a
+# request on demand by sending an 'X-Profile' header. Saved profiles are
+# summarized by the 'summarizeprofiles' command.
+PROFILING_ENABLED = (
+    os.getenv('DJANGO_PROFILING_ENABLED', 'false').lower() == 'true'
+)
+PROFILING_DIRECTORY = os.getenv(
+    'DJANGO_PROFILING_DIRECTORY',
+    os.path.join(BASE_DIR, 'profiles'),
+)
+PROFILING_HEADER = 'HTTP_X_PROFILE'
+PROFILING_MAX_CAPTURES = int(os.getenv('DJANGO_PROFILING_MAX_CAPTURES', 100))
+PROFILING_SAMPLE_RATE = float(os.getenv('DJANGO_PROFILING_SAMPLE_RATE', 0))
+PROFILING_SLOW_MS = int(os.getenv('DJANGO_PROFILING_SLOW_MS', 500))
+
 
 # Database
 # https://docs.djangoproject.com/en/2.1/ref/settings/#databases
@@ -173,6 +214,88 @@ STATICFILES_DIRS = [
 MEDIA_ROOT = os.environ.get('DJANGO_MEDIA_ROOT', None)
 
 
+# Cache Settings
+# https://docs.djangoproject.com/en/2.1/topics/cache/
+
+# The local memory cache is per-process, so deployments running
+# multiple workers should use the file based cache or Redis to share
+# invalidations between processes. The Redis backend requires the
+# optional 'django-redis' package.
+
+CACHE_BACKENDS = {
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'redis': 'django_redis.cache.RedisCache',
+}
+
+CACHE_BACKEND = os.getenv('DJANGO_CACHE_BACKEND', 'locmem').lower()
+CACHE_LOCATION = os.getenv('DJANGO_CACHE_LOCATION', '')
+
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f'Unknown DJANGO_CACHE_BACKEND {CACHE_BACKEND!r}. Valid choices '
+        f'are: {", ".join(sorted(CACHE_BACKENDS))}.'
+    )
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND],
+        'KEY_PREFIX': 'timetracker',
+        'LOCATION': CACHE_LOCATION,
+    },
+}
+
+# The default number of seconds that values cached by the vms app are
+# kept for. Cached values are also invalidated whenever the models they
+# are derived from change.
+VMS_CACHE_TIMEOUT = int(os.getenv('DJANGO_VMS_CACHE_TIMEOUT', 60 * 60))
+
+
+# The number of hours after which open time records are closed by the
+# 'closestaletimerecords' command, for clients that do not specify
+# their own maximum shift length.
+VMS_MAX_SHIFT_HOURS = int(os.getenv('DJANGO_VMS_MAX_SHIFT_HOURS', 16))
+
+
+# Overtime
+
+# The number of hours worked in a day or a week after which time counts
+# as overtime in pay computations. A value of 0 disables the limit.
+VMS_DAILY_OVERTIME_HOURS = int(os.getenv('DJANGO_VMS_DAILY_OVERTIME_HOURS', 0))
+VMS_WEEKLY_OVERTIME_HOURS = int(
+    os.getenv('DJANGO_VMS_WEEKLY_OVERTIME_HOURS', 40),
+)
+
+
+# The default number of minutes that the duration of each time record
+# is rounded to when computing billable time. Clients can override the
+# value in the admin.
+VMS_ROUNDING_BLOCK_MINUTES = int(
+    os.getenv('DJANGO_VMS_ROUNDING_BLOCK_MINUTES', 15),
+)
+
+
+# Time Record Change Log
+
+# The number of days that every entry in the time record change log is
+# kept for. Older entries are removed by the
+# 'compacttimerecordchanges' command once a later change to the same
+# time record exists. Consumers that sync less often than this still
+# receive the latest state of every changed record.
+VMS_CHANGE_LOG_RETENTION_DAYS = int(
+    os.getenv('DJANGO_VMS_CHANGE_LOG_RETENTION_DAYS', 30),
+)
+
+
+# Performance Logging
+
+# The probability that each timed operation in the vms app, such as
+# clocking in or computing total hours, is logged to the 'vms.perf'
+# logger with its duration and query count. A value of 0 disables the
+# logging, and 1 logs every operation.
+VMS_PERF_SAMPLE_RATE = float(os.getenv('DJANGO_VMS_PERF_SAMPLE_RATE', 0))
+
+
 # Login/Logout URLs
 
 LOGIN_REDIRECT_URL = 'vms:dashboard'
@@ -259,10 +382,19 @@ CRISPY_TEMPLATE_PACK = 'bootstrap4'
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
+    'formatters': {
+        'json': {
+            '()': 'vms.perf.JSONFormatter',
+        },
+    },
     'handlers': {
         'console': {
             'class': 'logging.StreamHandler',
         },
+        'json_console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'json',
+        },
     },
     'loggers': {
         # Root logger
@@ -276,10 +408,21 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        'core': {
+            'handlers': ['console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
         'vms': {
             'handlers': ['console'],
             'level': 'INFO',
             'propagate': False,
         },
+        # Timing spans, emitted as JSON
+        'vms.perf': {
+            'handlers': ['json_console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
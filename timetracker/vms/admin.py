@@ -1,7 +1,7 @@
 from django.contrib import admin
-from django.utils.translation import ugettext_lazy as _
+from django.utils.translation import ugettext_lazy as _, ungettext
 
-from vms import models
+from vms import models, paginators
 
 
 @admin.register(models.Client)
@@ -20,6 +20,12 @@ class ClientAdmin(admin.ModelAdmin):
                 'fields': ('email', 'phone_number', 'notes'),
             },
         ),
+        (
+            _('Time Tracking'),
+            {
+                'fields': ('max_shift_hours', 'rounding_block_minutes'),
+            },
+        ),
         (
             _('Detailed Information'),
             {
@@ -39,6 +45,7 @@ class ClientAdminAdmin(admin.ModelAdmin):
     date_hierarchy = 'time_created'
     fields = ('client', 'user', 'time_created')
     list_display = ('user', 'client', 'time_created')
+    list_select_related = ('client', 'user')
     readonly_fields = ('time_created',)
     search_fields = ('client__name', 'user__name')
 
@@ -49,6 +56,7 @@ class ClientAdminInviteAdmin(admin.ModelAdmin):
     date_hierarchy = 'time_created'
     fields = ('client', 'email', 'token', 'time_created')
     list_display = ('client', 'email', 'time_created')
+    list_select_related = ('client',)
     readonly_fields = ('time_created', 'token')
     search_fields = ('client__name', 'email', 'token')
 
@@ -58,12 +66,14 @@ class ClientJobAdmin(admin.ModelAdmin):
     autocomplete_fields = ('client',)
     fields = ('client', 'name', 'pay_rate', 'description', 'slug')
     list_display = ('name', 'client', 'pay_rate')
+    list_select_related = ('client',)
     readonly_fields = ('slug',)
     search_fields = ('client__name', 'name', 'slug')
 
 
 @admin.register(models.Employee)
 class EmployeeAdmin(admin.ModelAdmin):
+    actions = ('activate', 'approve', 'deactivate')
     autocomplete_fields = ('client', 'user')
     date_hierarchy = 'time_created'
     fieldsets = (
@@ -103,6 +113,12 @@ class EmployeeAdmin(admin.ModelAdmin):
         'time_created',
     )
     list_filter = ('is_active',)
+    list_select_related = (
+        'client',
+        'staffing_agency',
+        'supervisor__user',
+        'user',
+    )
     readonly_fields = ('time_created', 'time_updated')
     search_fields = (
         'client__name',
@@ -130,6 +146,105 @@ class EmployeeAdmin(admin.ModelAdmin):
             return "-"
     supervisor_name.admin_order_field = 'supervisor__user__name'
 
+    def activate(self, request, queryset):
+        """
+        Activate the selected employees.
+
+        Args:
+            request:
+                The request performing the action.
+            queryset:
+                The selected employees.
+        """
+        count = queryset.set_active(True)
+        self.message_user(request, ungettext(
+            'Activated %(count)d employee.',
+            'Activated %(count)d employees.',
+            count,
+        ) % {'count': count})
+    activate.short_description = _('Activate selected employees')
+
+    def approve(self, request, queryset):
+        """
+        Approve and activate the selected employees that have not been
+        approved yet.
+
+        Args:
+            request:
+                The request performing the action.
+            queryset:
+                The selected employees.
+        """
+        count = queryset.approve()
+        self.message_user(request, ungettext(
+            'Approved %(count)d employee.',
+            'Approved %(count)d employees.',
+            count,
+        ) % {'count': count})
+    approve.short_description = _('Approve selected employees')
+
+    def deactivate(self, request, queryset):
+        """
+        Deactivate the selected employees.
+
+        Args:
+            request:
+                The request performing the action.
+            queryset:
+                The selected employees.
+        """
+        count = queryset.set_active(False)
+        self.message_user(request, ungettext(
+            'Deactivated %(count)d employee.',
+            'Deactivated %(count)d employees.',
+            count,
+        ) % {'count': count})
+    deactivate.short_description = _('Deactivate selected employees')
+
+
+class PayPeriodSummaryInline(admin.TabularInline):
+    can_delete = False
+    extra = 0
+    fields = ('employee', 'job', 'record_count', 'total_time', 'earnings')
+    model = models.PayPeriodSummary
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(models.PayPeriod)
+class PayPeriodAdmin(admin.ModelAdmin):
+    autocomplete_fields = ('client',)
+    date_hierarchy = 'start'
+    fields = ('client', 'start', 'end', 'time_closed', 'closed_by')
+    inlines = (PayPeriodSummaryInline,)
+    list_display = ('client', 'start', 'end', 'time_closed')
+    list_select_related = ('client',)
+    readonly_fields = ('time_closed', 'closed_by')
+    search_fields = ('client__name',)
+
+    def get_readonly_fields(self, request, obj=None):
+        """
+        Prevent the bounds of closed pay periods from being changed,
+        since their summaries are frozen.
+
+        Args:
+            request:
+                The request being processed.
+            obj:
+                The pay period being edited, if any.
+
+        Returns:
+            The names of the fields that cannot be edited.
+        """
+        readonly_fields = super().get_readonly_fields(request, obj)
+
+        if obj is not None and obj.is_closed:
+            return ('client', 'start', 'end') + tuple(readonly_fields)
+
+        return readonly_fields
+
 
 @admin.register(models.StaffingAgency)
 class StaffingAgencyAdmin(admin.ModelAdmin):
@@ -147,6 +262,12 @@ class StaffingAgencyAdmin(admin.ModelAdmin):
                 'fields': ('email', 'phone_number', 'notes'),
             },
         ),
+        (
+            _('Billing'),
+            {
+                'fields': ('markup_percent',),
+            },
+        ),
         (
             _('Detailed Information'),
             {
@@ -166,12 +287,14 @@ class StaffingAgencyAdminAdmin(admin.ModelAdmin):
     date_hierarchy = 'time_created'
     fields = ('agency', 'user', 'time_created')
     list_display = ('user', 'agency', 'time_created')
+    list_select_related = ('agency', 'user')
     readonly_fields = ('time_created',)
     search_fields = ('agency__name', 'user__name')
 
 
 @admin.register(models.StaffingAgencyEmployee)
 class StaffingAgencyEmployeeAdmin(admin.ModelAdmin):
+    actions = ('approve',)
     autocomplete_fields = ('agency', 'approved_by', 'user')
     date_hierarchy = 'time_created'
     fieldsets = (
@@ -196,14 +319,62 @@ class StaffingAgencyEmployeeAdmin(admin.ModelAdmin):
         'time_approved',
     )
     list_filter = ('is_approved',)
+    list_select_related = ('agency', 'user')
     readonly_fields = ('time_created',)
     search_fields = ('agency__name', 'approved_by__user__name', 'user__name')
 
+    def approve(self, request, queryset):
+        """
+        Approve the selected staffing agency employees.
+
+        Args:
+            request:
+                The request performing the action.
+            queryset:
+                The selected staffing agency employees.
+        """
+        count = queryset.approve()
+        self.message_user(request, ungettext(
+            'Approved %(count)d staffing agency employee.',
+            'Approved %(count)d staffing agency employees.',
+            count,
+        ) % {'count': count})
+    approve.short_description = _('Approve selected staffing agency employees')
+
+
+class TimeRecordStatusListFilter(admin.SimpleListFilter):
+    """
+    Filter time records by whether they have ended.
+    """
+    parameter_name = 'status'
+    title = _('status')
+
+    def lookups(self, request, model_admin):
+        return (
+            ('open', _('Open')),
+            ('closed', _('Closed')),
+        )
+
+    def queryset(self, request, queryset):
+        if self.value() == 'open':
+            return queryset.filter(time_end=None)
+
+        if self.value() == 'closed':
+            return queryset.exclude(time_end=None)
+
+        return queryset
+
+
+# The time record tables grow without bound, so their changelists avoid
+# date hierarchies, which query the distinct dates of every row, and
+# exact counts of unfiltered tables. Date filters compare against ranges
+# that indexes can serve.
+
 
 @admin.register(models.TimeRecord)
 class TimeRecordAdmin(admin.ModelAdmin):
+    actions = ('approve',)
     autocomplete_fields = ('job', 'employee')
-    date_hierarchy = 'time_start'
     fields = ('employee', 'job', 'pay_rate', 'time_start', 'time_end')
     list_display = (
         'employee',
@@ -213,18 +384,207 @@ class TimeRecordAdmin(admin.ModelAdmin):
         'time_start',
         'time_end',
     )
+    list_filter = (
+        TimeRecordStatusListFilter,
+        ('time_start', admin.DateFieldListFilter),
+    )
+    list_select_related = (
+        'employee__client',
+        'employee__staffing_agency',
+        'employee__user',
+        'job',
+    )
+    ordering = ('-time_start', '-id')
+    paginator = paginators.EstimatedCountPaginator
     search_fields = ('employee__user__name', 'job__client__name', 'job__name')
+    show_full_result_count = False
+
+    def approve(self, request, queryset):
+        """
+        Approve the selected time records that have ended and are not
+        approved yet.
+
+        Args:
+            request:
+                The request performing the action.
+            queryset:
+                The selected time records.
+        """
+        count = queryset.approve(request.user)
+        self.message_user(request, ungettext(
+            'Approved %(count)d time record.',
+            'Approved %(count)d time records.',
+            count,
+        ) % {'count': count})
+    approve.short_description = _('Approve selected time records')
 
     def client(self, obj):
         return obj.employee.client
     client.admin_order_field = 'employee__client__name'
 
+    def delete_queryset(self, request, queryset):
+        """
+        Delete the selected time records, leaving any that belong to a
+        closed pay period.
+
+        Args:
+            request:
+                The request performing the deletion.
+            queryset:
+                The selected time records.
+        """
+        super().delete_queryset(
+            request,
+            queryset.exclude(pk__in=queryset.locked().values('pk')),
+        )
+
+    def get_deleted_objects(self, objs, request):
+        """
+        Prevent time records in closed pay periods from being deleted
+        by listing them as requiring a permission nobody has.
+
+        Args:
+            objs:
+                The time records being deleted.
+            request:
+                The request performing the deletion.
+
+        Returns:
+            A tuple containing the objects to delete, the number of
+            objects of each model, the permissions that are missing,
+            and the protected objects.
+        """
+        deleted_objects, model_count, perms_needed, protected = (
+            super().get_deleted_objects(objs, request)
+        )
+
+        locked = models.TimeRecord.objects.filter(
+            pk__in=[obj.pk for obj in objs],
+        ).locked()
+        if locked.exists():
+            perms_needed = set(perms_needed)
+            perms_needed.add(_('time records in closed pay periods'))
+
+        return deleted_objects, model_count, perms_needed, protected
+
+    def has_delete_permission(self, request, obj=None):
+        """
+        Args:
+            request:
+                The request being processed.
+            obj:
+                The time record being deleted, if any.
+
+        Returns:
+            A boolean indicating if the user may delete the time record.
+            Records in closed pay periods cannot be deleted.
+        """
+        if not super().has_delete_permission(request, obj):
+            return False
+
+        if obj is None:
+            return True
+
+        locked = models.TimeRecord.objects.filter(pk=obj.pk).locked()
+
+        return not locked.exists()
+
 
 @admin.register(models.TimeRecordApproval)
 class TimeRecordApprovalAdmin(admin.ModelAdmin):
     autocomplete_fields = ('user',)
-    date_hierarchy = 'time_approved'
     fields = ('time_record', 'user', 'time_approved')
     list_display = ('time_record', 'user', 'time_approved')
+    list_filter = (('time_approved', admin.DateFieldListFilter),)
+    list_select_related = ('time_record', 'user')
+    paginator = paginators.EstimatedCountPaginator
+    raw_id_fields = ('time_record',)
     readonly_fields = ('time_approved',)
     search_fields = ('user__name',)
+    show_full_result_count = False
+
+    def delete_queryset(self, request, queryset):
+        """
+        Delete the selected approvals, leaving any whose time record
+        belongs to a closed pay period.
+
+        Args:
+            request:
+                The request performing the deletion.
+            queryset:
+                The selected approvals.
+        """
+        super().delete_queryset(
+            request,
+            queryset.exclude(
+                time_record__in=models.TimeRecord.objects.locked(),
+            ),
+        )
+
+    def has_change_permission(self, request, obj=None):
+        """
+        Args:
+            request:
+                The request being processed.
+            obj:
+                The approval being changed, if any.
+
+        Returns:
+            A boolean indicating if the user may change the approval.
+            Approvals of records in closed pay periods cannot be changed.
+        """
+        if not super().has_change_permission(request, obj):
+            return False
+
+        return obj is None or not self._is_locked(obj)
+
+    def has_delete_permission(self, request, obj=None):
+        """
+        Args:
+            request:
+                The request being processed.
+            obj:
+                The approval being deleted, if any.
+
+        Returns:
+            A boolean indicating if the user may delete the approval.
+            Approvals of records in closed pay periods cannot be deleted.
+        """
+        if not super().has_delete_permission(request, obj):
+            return False
+
+        return obj is None or not self._is_locked(obj)
+
+    @staticmethod
+    def _is_locked(obj):
+        """
+        Args:
+            obj:
+                The approval to check.
+
+        Returns:
+            A boolean indicating if the approved time record belongs to
+            a closed pay period.
+        """
+        return models.TimeRecord.objects.filter(
+            pk=obj.time_record_id,
+        ).locked().exists()
+
+
+@admin.register(models.TimeRecordChange)
+class TimeRecordChangeAdmin(admin.ModelAdmin):
+    fields = (
+        'id',
+        'action',
+        'time_record_id',
+        'employee_pk',
+        'client_id',
+        'time_created',
+    )
+    list_display = ('id', 'action', 'time_record_id', 'time_created')
+    list_filter = ('action',)
+    ordering = ('-id',)
+    paginator = paginators.EstimatedCountPaginator
+    readonly_fields = fields
+    search_fields = ('time_record_id',)
+    show_full_result_count = False
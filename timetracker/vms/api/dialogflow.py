@@ -1,9 +1,9 @@
 import logging
 
 from django.conf import settings
-from django.utils import timezone
+from django.core.exceptions import ValidationError
 
-from vms import models
+from vms import models, perf
 
 
 logger = logging.getLogger(__name__)
@@ -57,11 +57,10 @@ def clock_in(client_id, employee_id, project_id=None):
             f'Could not find job {project_id} at {employee.client.name}.'
         )
 
-    models.TimeRecord.objects.create(
-        employee=employee,
-        job=project,
-        pay_rate=project.pay_rate,
-    )
+    try:
+        employee.clock_in(project)
+    except ValidationError:
+        return 'You are already clocked in. Please clock out first.'
 
     return (
         f'Clocked in {employee.user.name} at {employee.client.name} to job '
@@ -97,9 +96,10 @@ def clock_out(client_id, employee_id):
     if not employee.is_clocked_in:
         return 'You are not clocked in, so no action was taken.'
 
-    time_record = employee.time_records.get(time_end=None)
-    time_record.time_end = timezone.now()
-    time_record.save()
+    try:
+        employee.clock_out()
+    except ValidationError:
+        return 'You are not clocked in, so no action was taken.'
 
     return 'You are now clocked out.'
 
@@ -141,6 +141,24 @@ def process(data):
         A dictionary containing the data to return to Dialogflow.
     """
     intent = data['queryResult']['intent']['name']
+
+    with perf.Span('dialogflow_intent', intent=intent):
+        return _process_intent(intent, data)
+
+
+def _process_intent(intent, data):
+    """
+    Fulfill a single Dialogflow intent.
+
+    Args:
+        intent:
+            The name of the intent to fulfill.
+        data:
+            The data received from Dialogflow.
+
+    Returns:
+        A dictionary containing the data to return to Dialogflow.
+    """
     params = data['queryResult'].get('parameters', {})
 
     if intent == settings.DIALOGFLOW_INTENTS['CLOCK_IN']:
@@ -0,0 +1,366 @@
+import abc
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination, metaclass=abc.ABCMeta):
+    """
+    Forward only pagination that resumes after the last record of the
+    previous page rather than at an offset.
+
+    Unlike offset pagination, the cost of fetching a page does not grow
+    with its position, and records inserted while a client is paging do
+    not cause other records to be skipped or repeated. Subclasses define
+    the ordering and how positions are encoded in the cursor.
+    """
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor.'
+    max_page_size = 1000
+    ordering = None
+    page_size = 100
+    page_size_query_param = 'page_size'
+
+    def __init__(self):
+        """
+        Initialize the paginator with no active page.
+        """
+        self.base_url = None
+        self.next_position = None
+
+    @abc.abstractmethod
+    def decode_cursor(self, request):
+        """
+        Get the position encoded in the request's cursor.
+
+        Args:
+            request:
+                The request being paginated.
+
+        Returns:
+            The decoded position, or ``None`` if no cursor was provided.
+
+        Raises:
+            NotFound:
+                If the cursor is malformed.
+        """
+
+    @abc.abstractmethod
+    def encode_cursor(self, record):
+        """
+        Encode the position of a record as a cursor.
+
+        Args:
+            record:
+                The last record of a page.
+
+        Returns:
+            A string identifying the position after the record.
+        """
+
+    @abc.abstractmethod
+    def filter_after(self, queryset, position):
+        """
+        Filter a queryset to the records following a position.
+
+        Args:
+            queryset:
+                The queryset to filter.
+            position:
+                The position returned by ``decode_cursor``.
+
+        Returns:
+            The records in the queryset after the given position.
+        """
+
+    def get_next_link(self):
+        """
+        Returns:
+            The URL of the next page, or ``None`` if there is no next
+            page.
+        """
+        if self.next_position is None:
+            return None
+
+        return replace_query_param(
+            self.base_url,
+            self.cursor_query_param,
+            self.next_position,
+        )
+
+    def get_page_size(self, request):
+        """
+        Get the number of records to return.
+
+        Args:
+            request:
+                The request being paginated.
+
+        Returns:
+            The requested page size, limited to ``max_page_size``, or
+            the default page size.
+        """
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if size < 1:
+            return self.page_size
+
+        return min(size, self.max_page_size)
+
+    def get_paginated_response(self, data):
+        """
+        Wrap the serialized page with pagination information.
+
+        Args:
+            data:
+                The serialized records in the page.
+
+        Returns:
+            A response containing the link to the next page and the
+            page's records.
+        """
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Get the page of records following the request's cursor.
+
+        Args:
+            queryset:
+                The records to paginate.
+            request:
+                The request being paginated.
+            view:
+                The view handling the request.
+
+        Returns:
+            A list of the records in the requested page.
+        """
+        self.base_url = request.build_absolute_uri()
+        page_size = self.get_page_size(request)
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = self.filter_after(queryset, position)
+
+        # Fetch an extra record to determine if there is another page.
+        records = list(queryset.order_by(*self.ordering)[:page_size + 1])
+
+        if len(records) > page_size:
+            records = records[:page_size]
+            self.next_position = self.encode_cursor(records[-1])
+        else:
+            self.next_position = None
+
+        return records
+
+
+class TimeRecordCursorPagination(KeysetPagination):
+    """
+    Keyset pagination of time records ordered by ``(time_start, id)``.
+    """
+    ordering = ('time_start', 'id')
+
+    def decode_cursor(self, request):
+        """
+        Get the position encoded in the request's cursor.
+
+        Args:
+            request:
+                The request being paginated.
+
+        Returns:
+            A tuple containing the ``time_start`` and ``id`` of the last
+            record of the previous page, or ``None`` if no cursor was
+            provided.
+
+        Raises:
+            NotFound:
+                If the cursor is malformed.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            time_start, pk = json.loads(
+                base64.urlsafe_b64decode(encoded.encode('ascii')).decode(),
+            )
+            time_start = parse_datetime(time_start)
+        except (binascii.Error, TypeError, UnicodeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if time_start is None:
+            raise NotFound(self.invalid_cursor_message)
+
+        return time_start, pk
+
+    def encode_cursor(self, record):
+        """
+        Encode the position of a time record as a cursor.
+
+        Args:
+            record:
+                The last time record of a page.
+
+        Returns:
+            An opaque string identifying the position after the record.
+        """
+        position = [record.time_start.isoformat(), str(record.pk)]
+
+        return base64.urlsafe_b64encode(
+            json.dumps(position).encode(),
+        ).decode('ascii')
+
+    def filter_after(self, queryset, position):
+        """
+        Filter a queryset to the time records following a position.
+
+        Args:
+            queryset:
+                The time records to filter.
+            position:
+                A tuple containing the ``time_start`` and ``id`` of the
+                last record of the previous page.
+
+        Returns:
+            The time records that start after the given position.
+        """
+        time_start, pk = position
+
+        return queryset.filter(
+            Q(time_start__gt=time_start)
+            | Q(time_start=time_start, id__gt=pk)
+        )
+
+
+class TimeRecordChangePagination(KeysetPagination):
+    """
+    Pagination of the time record change log.
+
+    The cursor is the ID of the last change processed, which consumers
+    can store to resume syncing later. The cursor of the last change in
+    each page is included in the response, even if there is no next
+    page.
+    """
+    ordering = ('id',)
+
+    def __init__(self):
+        """
+        Initialize the paginator with no active page.
+        """
+        super().__init__()
+
+        self.last_position = None
+
+    def decode_cursor(self, request):
+        """
+        Get the change ID encoded in the request's cursor.
+
+        Args:
+            request:
+                The request being paginated.
+
+        Returns:
+            The ID of the last change the consumer processed, or
+            ``None`` if no cursor was provided.
+
+        Raises:
+            NotFound:
+                If the cursor is not a non-negative integer.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            position = int(encoded)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+
+        if position < 0:
+            raise NotFound(self.invalid_cursor_message)
+
+        return position
+
+    def encode_cursor(self, record):
+        """
+        Args:
+            record:
+                The last change in a page.
+
+        Returns:
+            The change's ID as a string.
+        """
+        return str(record.id)
+
+    def filter_after(self, queryset, position):
+        """
+        Args:
+            queryset:
+                The changes to filter.
+            position:
+                The ID of the last change processed.
+
+        Returns:
+            The changes made after the given change.
+        """
+        return queryset.filter(id__gt=position)
+
+    def get_paginated_response(self, data):
+        """
+        Wrap the serialized page with pagination information.
+
+        Args:
+            data:
+                The serialized changes in the page.
+
+        Returns:
+            A response containing the cursor to resume syncing from, the
+            link to the next page, and the page's changes.
+        """
+        return Response(OrderedDict([
+            ('cursor', self.last_position),
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Get the page of changes following the request's cursor.
+
+        Args:
+            queryset:
+                The changes to paginate.
+            request:
+                The request being paginated.
+            view:
+                The view handling the request.
+
+        Returns:
+            A list of the changes in the requested page.
+        """
+        records = super().paginate_queryset(queryset, request, view)
+
+        if records:
+            self.last_position = self.encode_cursor(records[-1])
+        else:
+            self.last_position = request.query_params.get(
+                self.cursor_query_param,
+            )
+
+        return records
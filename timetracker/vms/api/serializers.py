@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from vms.api.dialogflow import process
+from vms.models import TimeRecord, TimeRecordChange
 
 
 class IntentSerializer(serializers.Serializer):
@@ -29,3 +30,78 @@ class DialogflowWebhookSerializer(serializers.Serializer):
 
     def save(self, **kwargs):
         self.validated_data.update(process(self.validated_data))
+
+
+class TimeRecordFilterSerializer(serializers.Serializer):
+    """
+    Serializer to validate the query parameters used to filter the list
+    of time records.
+    """
+    approved = serializers.NullBooleanField(required=False)
+    client = serializers.IntegerField(required=False)
+    employee = serializers.IntegerField(required=False)
+    job = serializers.IntegerField(required=False)
+    updated_since = serializers.DateTimeField(required=False)
+
+
+class TimeRecordSerializer(serializers.ModelSerializer):
+    """
+    Serializer for listing time records.
+
+    Related objects are represented by their identifiers so that the
+    records can be serialized without additional queries.
+    """
+    approved = serializers.BooleanField(read_only=True, source='is_approved')
+    client = serializers.IntegerField(
+        read_only=True,
+        source='employee.client_id',
+    )
+    employee_id = serializers.IntegerField(
+        read_only=True,
+        source='employee.employee_id',
+    )
+    job_name = serializers.CharField(
+        allow_null=True,
+        read_only=True,
+        source='job.name',
+    )
+    time_approved = serializers.DateTimeField(
+        allow_null=True,
+        read_only=True,
+        source='approval.time_approved',
+    )
+
+    class Meta:
+        fields = (
+            'id',
+            'client',
+            'employee_id',
+            'job',
+            'job_name',
+            'pay_rate',
+            'time_start',
+            'time_end',
+            'time_updated',
+            'approved',
+            'time_approved',
+        )
+        model = TimeRecord
+        read_only_fields = fields
+
+
+class TimeRecordChangeSerializer(serializers.ModelSerializer):
+    """
+    Serializer for listing the changes made to time records.
+    """
+    time_record = TimeRecordSerializer(allow_null=True, read_only=True)
+
+    class Meta:
+        fields = (
+            'id',
+            'action',
+            'time_created',
+            'time_record_id',
+            'time_record',
+        )
+        model = TimeRecordChange
+        read_only_fields = fields
@@ -1,15 +1,33 @@
 from django.urls import path
 
-from vms.api import views
+from core.lazy import LazyView
 
 
 app_name = 'vms_api'
 
 
+# The API views are loaded lazily so Django REST Framework is only
+# imported by processes that actually serve API requests.
 urlpatterns = [
     path(
         'dialogflow/',
-        views.DialogflowFulfillmentView.as_view(),
+        LazyView(
+            'vms.api.views.DialogflowFulfillmentView',
+            csrf_exempt=True,
+        ),
         name='dialogflow',
     ),
+    path(
+        'time-records/',
+        LazyView('vms.api.views.TimeRecordListView', csrf_exempt=True),
+        name='time-record-list',
+    ),
+    path(
+        'time-records/changes/',
+        LazyView(
+            'vms.api.views.TimeRecordChangeListView',
+            csrf_exempt=True,
+        ),
+        name='time-record-change-list',
+    ),
 ]
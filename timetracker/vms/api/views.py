@@ -1,7 +1,253 @@
-from rest_framework import generics
+import hashlib
 
+from django.db.models import Q
+from django.utils.cache import parse_etags
+from rest_framework import generics, permissions, status
+from rest_framework.response import Response
+
+from vms import mixins, models
 from vms.api import serializers
+from vms.api.pagination import (
+    TimeRecordChangePagination,
+    TimeRecordCursorPagination,
+)
+
+
+def get_time_records():
+    """
+    Get the time records serialized by the API.
+
+    Returns:
+        A queryset containing all time records, with the related objects
+        used by ``TimeRecordSerializer`` selected and other fields
+        deferred.
+    """
+    return models.TimeRecord.objects.select_related(
+        'approval',
+        'employee',
+        'job',
+    ).only(
+        'approval__time_approved',
+        'employee__client_id',
+        'employee__employee_id',
+        'id',
+        'job__name',
+        'pay_rate',
+        'time_end',
+        'time_start',
+        'time_updated',
+    )
+
+
+def get_visible_employees(user):
+    """
+    Get the employees whose time records a user may view.
+
+    Args:
+        user:
+            The user requesting the time records.
+
+    Returns:
+        A queryset containing the primary keys of the employees the user
+        is, manages through a staffing agency, or supervises as a client
+        admin. Filtering on this subquery rather than joining the admin
+        tables avoids duplicate results without needing ``DISTINCT``.
+    """
+    return models.Employee.objects.filter(
+        Q(user=user)
+        | Q(staffing_agency__admin__user=user)
+        | Q(client__admin__user=user),
+    ).values('pk')
 
 
 class DialogflowFulfillmentView(generics.CreateAPIView):
     serializer_class = serializers.DialogflowWebhookSerializer
+
+
+class TimeRecordChangeListView(generics.ListAPIView):
+    """
+    List the changes made to the time records visible to the requesting
+    user.
+
+    Changes are listed in the order they were made. Each change includes
+    the current state of its time record, so consumers can sync by
+    storing the returned cursor and requesting the changes after it.
+    """
+    pagination_class = TimeRecordChangePagination
+    permission_classes = (permissions.IsAuthenticated,)
+    serializer_class = serializers.TimeRecordChangeSerializer
+
+    def get_queryset(self):
+        """
+        Get the changes to list.
+
+        Returns:
+            A queryset containing the changes to time records belonging
+            to clients the requesting user administers or to employees
+            visible to the user.
+        """
+        user = self.request.user
+        clients = models.Client.objects.filter(admin__user=user).values('pk')
+
+        return models.TimeRecordChange.objects.filter(
+            Q(client_id__in=clients)
+            | Q(employee_pk__in=get_visible_employees(user)),
+        )
+
+    def paginate_queryset(self, queryset):
+        """
+        Get a page of changes with their time records attached.
+
+        Args:
+            queryset:
+                The changes to paginate.
+
+        Returns:
+            A list of changes whose ``time_record`` attribute contains
+            the current state of the changed record, or ``None`` if the
+            record has been deleted.
+        """
+        changes = super().paginate_queryset(queryset)
+
+        # Fetch every record in the page with a single query.
+        time_records = get_time_records().in_bulk(
+            {change.time_record_id for change in changes},
+        )
+        for change in changes:
+            change.time_record = time_records.get(change.time_record_id)
+
+        return changes
+
+
+class TimeRecordListView(mixins.DateRangeMixin, generics.ListAPIView):
+    """
+    List the time records of the employees visible to the requesting
+    user.
+
+    Records are ordered by start time and paginated with a cursor. The
+    list can be filtered by client, employee, job, approval status,
+    date range, and by the time records were last changed, which allows
+    clients to sync incrementally.
+    """
+    pagination_class = TimeRecordCursorPagination
+    permission_classes = (permissions.IsAuthenticated,)
+    serializer_class = serializers.TimeRecordSerializer
+
+    def get_filters(self):
+        """
+        Get the validated filters from the request's query parameters.
+
+        Returns:
+            A dictionary containing the filters that were provided.
+
+        Raises:
+            ValidationError:
+                If any of the filters are invalid.
+        """
+        serializer = serializers.TimeRecordFilterSerializer(
+            data=self.request.query_params,
+        )
+        serializer.is_valid(raise_exception=True)
+
+        return serializer.validated_data
+
+    def get_queryset(self):
+        """
+        Get the time records to list.
+
+        Returns:
+            A queryset containing the time records visible to the
+            requesting user, filtered by the query parameters.
+        """
+        queryset = get_time_records().filter(
+            employee__in=get_visible_employees(self.request.user),
+        )
+
+        filters = self.get_filters()
+
+        if filters.get('approved') is not None:
+            queryset = queryset.filter(
+                approval__isnull=not filters['approved'],
+            )
+
+        if 'client' in filters:
+            queryset = queryset.filter(employee__client_id=filters['client'])
+
+        if 'employee' in filters:
+            queryset = queryset.filter(
+                employee__employee_id=filters['employee'],
+            )
+
+        if 'job' in filters:
+            queryset = queryset.filter(job_id=filters['job'])
+
+        if 'updated_since' in filters:
+            # Approving a record does not modify the record itself.
+            queryset = queryset.filter(
+                Q(time_updated__gte=filters['updated_since'])
+                | Q(approval__time_approved__gte=filters['updated_since']),
+            )
+
+        return self.filter_by_date(queryset)
+
+    def get_etag(self, records):
+        """
+        Compute an entity tag identifying the state of a page.
+
+        Args:
+            records:
+                The time records in the page.
+
+        Returns:
+            A quoted string that changes whenever a record in the page,
+            or the page that follows it, changes. Besides the record's
+            update time, the digest covers the serialized fields of
+            related objects, which can change without updating the
+            record.
+        """
+        digest = hashlib.md5()
+
+        for record in records:
+            time_approved = (
+                record.approval.time_approved if record.is_approved else None
+            )
+            job_name = record.job.name if record.job_id else None
+            digest.update(
+                (
+                    f'{record.pk}:{record.time_updated}:{time_approved}:'
+                    f'{record.employee.client_id}:'
+                    f'{record.employee.employee_id}:{job_name};'
+                ).encode(),
+            )
+
+        digest.update(str(self.paginator.get_next_link()).encode())
+
+        return f'"{digest.hexdigest()}"'
+
+    def list(self, request, *args, **kwargs):
+        """
+        List a page of time records.
+
+        If the ``If-None-Match`` header matches the current state of the
+        page, a "304 Not Modified" response is returned without
+        serializing the records.
+
+        Args:
+            request:
+                The request being handled.
+
+        Returns:
+            A response containing the requested page of time records.
+        """
+        records = self.paginate_queryset(self.get_queryset())
+        etag = self.get_etag(records)
+
+        if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            serializer = self.get_serializer(records, many=True)
+            response = self.get_paginated_response(serializer.data)
+
+        response['ETag'] = etag
+
+        return response
@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+
+
+class VmsConfig(AppConfig):
+    """
+    Configuration for the vms app.
+    """
+    name = 'vms'
+
+    def ready(self):
+        """
+        Connect the app's signal handlers.
+        """
+        from vms import signals  # noqa
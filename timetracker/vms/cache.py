@@ -0,0 +1,174 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+logger = logging.getLogger(__name__)
+
+
+CLIENT_NAMESPACE = 'client'
+EMPLOYEE_NAMESPACE = 'employee'
+
+
+def _initial_version():
+    """
+    Get a version number for a namespace that has no version stored.
+
+    A namespace's version may be evicted from the cache while values
+    stored under it are not. Starting from the current time rather than
+    a constant ensures those stale values are never reachable again.
+
+    Returns:
+        An integer that is larger than any previously issued version.
+    """
+    return int(time.time() * 1000)
+
+
+def _version_key(namespace, pk):
+    """
+    Get the cache key that the version of a namespace is stored under.
+
+    Args:
+        namespace:
+            The type of namespace, eg ``CLIENT_NAMESPACE``.
+        pk:
+            The primary key of the object owning the namespace.
+
+    Returns:
+        The key holding the namespace's current version.
+    """
+    return f'vms:{namespace}:{pk}:version'
+
+
+def get_version(namespace, pk):
+    """
+    Get the current version of a namespace.
+
+    Args:
+        namespace:
+            The type of namespace, eg ``CLIENT_NAMESPACE``.
+        pk:
+            The primary key of the object owning the namespace.
+
+    Returns:
+        The namespace's current version.
+    """
+    key = _version_key(namespace, pk)
+    version = cache.get(key)
+
+    if version is None:
+        # Use 'add' so concurrent processes agree on a single version.
+        cache.add(key, _initial_version(), timeout=None)
+        version = cache.get(key)
+
+    return version
+
+
+def make_key(namespace, pk, *parts):
+    """
+    Build a versioned cache key within a namespace.
+
+    Args:
+        namespace:
+            The type of namespace, eg ``CLIENT_NAMESPACE``.
+        pk:
+            The primary key of the object owning the namespace.
+        *parts:
+            Additional values identifying the cached value within the
+            namespace.
+
+    Returns:
+        A cache key that changes whenever the namespace is invalidated.
+    """
+    version = get_version(namespace, pk)
+    suffix = ':'.join(str(part) for part in parts)
+
+    return f'vms:{namespace}:{pk}:{version}:{suffix}'
+
+
+def get_or_set(namespace, pk, parts, default, timeout=None):
+    """
+    Get a value from the cache, computing and storing it if necessary.
+
+    Args:
+        namespace:
+            The type of namespace, eg ``CLIENT_NAMESPACE``.
+        pk:
+            The primary key of the object owning the namespace.
+        parts:
+            An iterable of values identifying the cached value within
+            the namespace.
+        default:
+            A callable used to compute the value if it is not cached.
+        timeout:
+            The number of seconds to cache the value for. Defaults to
+            the ``VMS_CACHE_TIMEOUT`` setting.
+
+    Returns:
+        The cached or newly computed value.
+    """
+    if timeout is None:
+        timeout = settings.VMS_CACHE_TIMEOUT
+
+    key = make_key(namespace, pk, *parts)
+
+    return cache.get_or_set(key, default, timeout)
+
+
+def invalidate(namespace, pk):
+    """
+    Invalidate every value cached within a namespace.
+
+    Rather than deleting each key, the namespace's version is bumped so
+    existing entries become unreachable and expire on their own.
+
+    Args:
+        namespace:
+            The type of namespace, eg ``CLIENT_NAMESPACE``.
+        pk:
+            The primary key of the object owning the namespace.
+    """
+    key = _version_key(namespace, pk)
+
+    try:
+        cache.incr(key)
+    except ValueError:
+        # There is no stored version, so there is nothing reachable to
+        # invalidate. We still store a fresh version to guard against
+        # values stored under an evicted version.
+        cache.set(key, _initial_version(), timeout=None)
+
+    logger.debug('Invalidated cache namespace %s %s', namespace, pk)
+
+
+def invalidate_client(client_id):
+    """
+    Invalidate the values cached for a client.
+
+    Args:
+        client_id:
+            The ID of the client whose cache should be invalidated.
+    """
+    invalidate(CLIENT_NAMESPACE, client_id)
+
+
+def invalidate_employee(employee_id, client_id=None):
+    """
+    Invalidate the values cached for an employee.
+
+    Because most client level values are aggregated from employee data,
+    the employee's client is also invalidated if provided.
+
+    Args:
+        employee_id:
+            The primary key of the employee whose cache should be
+            invalidated.
+        client_id:
+            The ID of the client the employee works for.
+    """
+    invalidate(EMPLOYEE_NAMESPACE, employee_id)
+
+    if client_id is not None:
+        invalidate_client(client_id)
@@ -0,0 +1,421 @@
+import json
+import logging
+import queue
+import select
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+
+
+logger = logging.getLogger(__name__)
+
+
+CLOCK_IN = 'clock-in'
+CLOCK_OUT = 'clock-out'
+
+# The number of seconds between comments sent to idle streams. These
+# keep proxies from closing the connection and let the server notice
+# clients that have disconnected.
+HEARTBEAT_INTERVAL = 15
+
+# The number of events buffered for each subscriber. A subscriber that
+# falls this far behind is disconnected and has to reconnect.
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# The number of seconds a stream stays open. Each open stream occupies a
+# worker, so watchers have to choose to resume once it expires.
+STREAM_DURATION = 10 * 60
+
+# The PostgreSQL notification channel clock events are sent through so
+# they reach the watchers connected to every process.
+NOTIFY_CHANNEL = 'vms_clock_events'
+
+# The number of seconds the notification listener waits before
+# reconnecting after losing its database connection.
+RECONNECT_DELAY = 5
+
+
+# Placed on the queue of a subscriber that is dropped for not keeping
+# up with the events published to it.
+OVERFLOW = object()
+
+
+class EventBroker:
+    """
+    In-process publish/subscribe fan-out of events grouped by channel.
+
+    Publishing an event places it on the queue of every subscriber of
+    its channel, so a single notification serves any number of open
+    streams. The broker lives in memory, so events raised by other
+    processes are relayed to it by a ``NotificationListener``.
+    """
+
+    def __init__(self, queue_size=SUBSCRIBER_QUEUE_SIZE):
+        """
+        Initialize a broker with no subscribers.
+
+        Args:
+            queue_size:
+                The maximum number of events buffered for each
+                subscriber.
+        """
+        self.queue_size = queue_size
+
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def publish(self, channel, event):
+        """
+        Send an event to every subscriber of a channel.
+
+        Args:
+            channel:
+                The channel to publish the event to.
+            event:
+                The event to publish.
+
+        Returns:
+            The number of subscribers the event was sent to.
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                logger.warning(
+                    'Dropping slow subscriber of channel %r',
+                    channel,
+                )
+                self._remove(channel, subscriber)
+                # Wake the subscriber so it notices it was dropped.
+                with subscriber.mutex:
+                    subscriber.queue.clear()
+                subscriber.put_nowait(OVERFLOW)
+
+        return len(subscribers)
+
+    def subscriber_count(self, channel):
+        """
+        Args:
+            channel:
+                The channel to count the subscribers of.
+
+        Returns:
+            The number of subscribers to the channel.
+        """
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+    @contextmanager
+    def subscribe(self, channel):
+        """
+        Subscribe to the events of a channel.
+
+        Args:
+            channel:
+                The channel to subscribe to.
+
+        Yields:
+            A queue that receives the events published to the channel.
+            ``OVERFLOW`` is placed on the queue if the subscriber is
+            dropped for not keeping up.
+        """
+        subscriber = queue.Queue(self.queue_size)
+
+        with self._lock:
+            self._subscribers[channel].add(subscriber)
+
+        try:
+            yield subscriber
+        finally:
+            self._remove(channel, subscriber)
+
+    def _remove(self, channel, subscriber):
+        """
+        Remove a subscriber from a channel.
+        """
+        with self._lock:
+            subscribers = self._subscribers.get(channel)
+            if subscribers is None:
+                return
+
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._subscribers[channel]
+
+
+class NotificationListener:
+    """
+    Relay the events sent as PostgreSQL notifications to a broker.
+
+    The listener runs in a daemon thread with its own database
+    connection, started when the first stream of a process opens. Each
+    process receives a single notification per event regardless of how
+    many of its streams are watching, and the broker fans it out from
+    there.
+    """
+
+    def __init__(
+            self,
+            broker,
+            channel=NOTIFY_CHANNEL,
+            using=DEFAULT_DB_ALIAS):
+        """
+        Create a listener that has not started.
+
+        Args:
+            broker:
+                The broker to publish the received events to.
+            channel:
+                The notification channel to listen on.
+            using:
+                The alias of the database to listen to.
+        """
+        self.broker = broker
+        self.channel = channel
+        self.using = using
+
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def dispatch(self, payload):
+        """
+        Publish the event contained in a notification.
+
+        Args:
+            payload:
+                The JSON payload of the notification, containing the
+                ``channel`` and ``event`` to publish.
+        """
+        try:
+            message = json.loads(payload)
+            channel, event = message['channel'], message['event']
+        except (KeyError, TypeError, ValueError):
+            logger.warning('Ignoring malformed clock event %r', payload)
+            return
+
+        self.broker.publish(channel, event)
+
+    def ensure_started(self):
+        """
+        Start listening if the database supports notifications and the
+        listener is not already running.
+        """
+        if connections[self.using].vendor != 'postgresql':
+            return
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    daemon=True,
+                    name='vms-clock-events',
+                    target=self._run,
+                )
+                self._thread.start()
+
+    def _listen(self):
+        """
+        Listen for notifications until the connection fails.
+        """
+        db = connections[self.using]
+        with db.cursor() as cursor:
+            cursor.execute(f'LISTEN {self.channel}')
+
+        raw = db.connection
+        while True:
+            # Wake up periodically so a dead connection is noticed.
+            readable, _, _ = select.select([raw], [], [], 60)
+            if not readable:
+                with db.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                continue
+
+            raw.poll()
+            while raw.notifies:
+                self.dispatch(raw.notifies.pop(0).payload)
+
+    def _run(self):
+        """
+        Listen for notifications, reconnecting if the connection fails.
+        """
+        while True:
+            try:
+                self._listen()
+            except Exception:
+                logger.exception('Lost the clock event listener connection')
+                connections[self.using].close()
+                time.sleep(RECONNECT_DELAY)
+
+
+clock_events = EventBroker()
+clock_event_listener = NotificationListener(clock_events)
+
+
+def client_channel(client_id):
+    """
+    Args:
+        client_id:
+            The ID of a client.
+
+    Returns:
+        The name of the channel that receives the clock events of the
+        client's employees.
+    """
+    return f'client:{client_id}:clock'
+
+
+def clock_event(event_type, time_record):
+    """
+    Build a clock event for a time record.
+
+    Args:
+        event_type:
+            Either ``CLOCK_IN`` or ``CLOCK_OUT``.
+        time_record:
+            The time record that was opened or closed.
+
+    Returns:
+        A dictionary describing the event.
+    """
+    employee = time_record.employee
+
+    return {
+        'employee_id': employee.employee_id,
+        'employee_name': employee.user.name,
+        'job': time_record.job.name if time_record.job else None,
+        'time': (
+            time_record.time_end
+            if event_type == CLOCK_OUT
+            else time_record.time_start
+        ),
+        'time_record': time_record.id,
+        'type': event_type,
+    }
+
+
+def format_event(event_type, data):
+    """
+    Format an event as a server-sent event message.
+
+    Args:
+        event_type:
+            The name of the event.
+        data:
+            The JSON serializable data of the event.
+
+    Returns:
+        The message to write to the event stream.
+    """
+    payload = json.dumps(data, cls=DjangoJSONEncoder)
+
+    return f'event: {event_type}\ndata: {payload}\n\n'
+
+
+def publish_clock_event(event_type, time_record):
+    """
+    Publish a clock event to the watchers of a time record's client.
+
+    On PostgreSQL the event is sent as a notification so the watchers
+    connected to every process receive it. Otherwise it is published to
+    this process's broker directly.
+
+    Args:
+        event_type:
+            Either ``CLOCK_IN`` or ``CLOCK_OUT``.
+        time_record:
+            The time record that was opened or closed.
+    """
+    channel = client_channel(time_record.employee.client_id)
+
+    if connection.vendor != 'postgresql':
+        # Avoid building the event if nobody is watching.
+        if clock_events.subscriber_count(channel):
+            clock_events.publish(channel, clock_event(event_type, time_record))
+        return
+
+    payload = json.dumps(
+        {'channel': channel, 'event': clock_event(event_type, time_record)},
+        cls=DjangoJSONEncoder,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_notify(%s, %s)', [NOTIFY_CHANNEL, payload])
+
+
+def stream_clock_events(
+        client,
+        heartbeat=HEARTBEAT_INTERVAL,
+        broker=clock_events,
+        duration=STREAM_DURATION):
+    """
+    Generate the server-sent event stream of a client's clock events.
+
+    The stream begins with a ``snapshot`` event listing the employees
+    who are currently clocked in, followed by an event for each clock in
+    and clock out. After ``duration`` seconds an ``expired`` event is
+    sent and the stream ends.
+
+    Args:
+        client:
+            The client whose events are streamed.
+        heartbeat:
+            The number of seconds to wait for an event before sending a
+            keep-alive comment.
+        broker:
+            The broker to receive events from.
+        duration:
+            The number of seconds to stream events for.
+
+    Yields:
+        The messages of the event stream.
+    """
+    if broker is clock_events:
+        clock_event_listener.ensure_started()
+
+    with broker.subscribe(client_channel(client.id)) as subscriber:
+        # Subscribe before taking the snapshot so no events are missed.
+        TimeRecord = apps.get_model('vms', 'TimeRecord')
+        open_records = TimeRecord.objects.open().filter(
+            employee__client=client,
+        ).values_list(
+            'employee__employee_id',
+            'employee__user__name',
+        ).order_by().distinct()
+        snapshot = format_event('snapshot', [
+            {'employee_id': employee_id, 'employee_name': name}
+            for employee_id, name in open_records
+        ])
+
+        # Streams stay open for a long time but only need the database
+        # for the snapshot, so don't hold on to the connection.
+        if not connection.in_atomic_block:
+            connection.close()
+
+        yield snapshot
+
+        deadline = time.monotonic() + duration
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                yield format_event('expired', {})
+                return
+
+            try:
+                event = subscriber.get(timeout=min(heartbeat, remaining))
+            except queue.Empty:
+                yield ': keep-alive\n\n'
+                continue
+
+            if event is OVERFLOW:
+                # The client reconnects automatically and receives a
+                # new snapshot.
+                yield format_event('overflow', {})
+                return
+
+            yield format_event(event['type'], event)
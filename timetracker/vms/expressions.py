@@ -0,0 +1,246 @@
+import datetime
+
+from django.conf import settings
+from django.db import NotSupportedError
+from django.db.models import (
+    DateTimeField,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    Func,
+    IntegerField,
+    Value,
+)
+from django.db.models.functions import Coalesce
+from django.db.models.functions.datetime import TimezoneMixin
+
+
+class RoundDuration(Func):
+    """
+    Round a duration to the nearest multiple of a block of seconds.
+
+    This performs the same rounding as ``time_utils.round_time_worked``
+    in the database, so rounded durations can be annotated, aggregated,
+    filtered, and sorted on without loading each row.
+    """
+    output_field = DurationField()
+
+    def __init__(self, duration, block_size, **extra):
+        """
+        Create the expression.
+
+        Args:
+            duration:
+                An expression producing the duration to round.
+            block_size:
+                An expression producing the block size to round to, in
+                seconds.
+        """
+        super().__init__(duration, block_size, **extra)
+
+    def _compile_parts(self, compiler, connection):
+        """
+        Compile the duration and block size expressions.
+
+        Returns:
+            A tuple containing the SQL of the duration, its parameters,
+            the SQL of the block size, and its parameters.
+        """
+        duration, block_size = self.get_source_expressions()
+        duration_sql, duration_params = compiler.compile(duration)
+        block_sql, block_params = compiler.compile(block_size)
+
+        return duration_sql, duration_params, block_sql, block_params
+
+    def as_postgresql(self, compiler, connection):
+        duration_sql, duration_params, block_sql, block_params = (
+            self._compile_parts(compiler, connection)
+        )
+        sql = (
+            f"(FLOOR((EXTRACT(EPOCH FROM {duration_sql}) + {block_sql} / 2.0) "
+            f"/ {block_sql}) * {block_sql} * INTERVAL '1 second')"
+        )
+
+        return sql, (
+            duration_params + block_params + block_params + block_params
+        )
+
+    def as_sqlite(self, compiler, connection):
+        # Durations are stored as integers of microseconds, so integer
+        # division drops the remainder.
+        duration_sql, duration_params, block_sql, block_params = (
+            self._compile_parts(compiler, connection)
+        )
+        sql = (
+            f"((({duration_sql}) + ({block_sql}) * 500000) "
+            f"/ (({block_sql}) * 1000000) * ({block_sql}) * 1000000)"
+        )
+
+        return sql, (
+            duration_params + block_params + block_params + block_params
+        )
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(
+            f'Rounding durations is not supported on {connection.vendor}.',
+        )
+
+
+class NextLocalMidnight(TimezoneMixin, Func):
+    """
+    Get the first midnight in a time zone after a datetime.
+
+    The datetime is first moved to roughly noon of its local day by
+    adding the difference between noon and its local time of day, then
+    midnight is found by adding the time remaining in the day after
+    that. A daylight saving time transition between midnight and the
+    datetime shifts the first step by the length of the transition, but
+    the result stays within the same day, and transitions do not occur
+    between noon and midnight, so the midnight found is exact.
+    """
+    output_field = DateTimeField()
+
+    def __init__(self, expression, tzinfo=None, **extra):
+        """
+        Create the expression.
+
+        Args:
+            expression:
+                An expression producing an aware datetime.
+            tzinfo:
+                The time zone to find midnight in. Defaults to the
+                current time zone.
+        """
+        self.tzinfo = tzinfo
+
+        super().__init__(expression, **extra)
+
+    def _compile_midnight(self, compiler, connection, move_sql):
+        """
+        Compile the expression.
+
+        Args:
+            compiler:
+                The compiler of the query.
+            connection:
+                The database connection.
+            move_sql:
+                A function accepting the SQL of a datetime, the SQL of
+                its local time of day, and a time of day in seconds, and
+                returning the SQL of the datetime moved to that time of
+                day.
+
+        Returns:
+            A tuple containing the SQL of the midnight and its
+            parameters.
+        """
+        sql, params = compiler.compile(self.get_source_expressions()[0])
+        tzname = self.get_tzname()
+
+        noon = move_sql(
+            sql,
+            connection.ops.datetime_cast_time_sql(sql, tzname),
+            12 * 60 * 60,
+        )
+        midnight = move_sql(
+            noon,
+            connection.ops.datetime_cast_time_sql(noon, tzname),
+            24 * 60 * 60,
+        )
+
+        # Each step repeats the SQL it moves, so the datetime appears
+        # four times.
+        return midnight, params * 4
+
+    def as_postgresql(self, compiler, connection):
+        def move_sql(sql, local_time, seconds):
+            return (
+                f"({sql} + ({seconds} - EXTRACT(EPOCH FROM {local_time})) "
+                f"* INTERVAL '1 second')"
+            )
+
+        return self._compile_midnight(compiler, connection, move_sql)
+
+    def as_sqlite(self, compiler, connection):
+        # Django's SQLite functions work with datetimes as strings and
+        # durations as integers of microseconds.
+        def move_sql(sql, local_time, seconds):
+            return (
+                f"django_format_dtdelta('+', {sql}, "
+                f"{seconds * 1000000} - "
+                f"django_time_diff({local_time}, '00:00:00'))"
+            )
+
+        return self._compile_midnight(compiler, connection, move_sql)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        raise NotSupportedError(
+            f'Finding midnight is not supported on {connection.vendor}.',
+        )
+
+
+def duration_expression():
+    """
+    Returns:
+        An expression producing the duration of a time record. Records
+        that have not ended produce ``NULL``.
+    """
+    return ExpressionWrapper(
+        F('time_end') - F('time_start'),
+        output_field=DurationField(),
+    )
+
+
+def rounding_block_expression(client_path='employee__client'):
+    """
+    Get an expression producing the rounding block of a client.
+
+    Args:
+        client_path:
+            The lookup path from the queried model to the client.
+
+    Returns:
+        An expression producing the client's rounding block in seconds,
+        or the site wide default if the client does not specify one.
+    """
+    return ExpressionWrapper(
+        Coalesce(
+            F(f'{client_path}__rounding_block_minutes'),
+            Value(settings.VMS_ROUNDING_BLOCK_MINUTES),
+        ) * Value(60),
+        output_field=IntegerField(),
+    )
+
+
+def local_midnight_expression(days, tz, field='time_start'):
+    """
+    Get an expression producing a local midnight following a datetime.
+
+    Each midnight is found from roughly noon of the previous day rather
+    than by nesting ``NextLocalMidnight``, so the SQL does not grow with
+    the number of days and days shortened or lengthened by daylight
+    saving time are respected.
+
+    Args:
+        days:
+            The number of midnights after the datetime, starting at 1
+            for the first midnight after it.
+        tz:
+            The time zone that midnight is determined in.
+        field:
+            The name of the datetime field.
+
+    Returns:
+        An expression producing the midnight beginning the ``days``th
+        local day after the one containing the datetime.
+    """
+    first = NextLocalMidnight(field, tz)
+    if days == 1:
+        return first
+
+    noon = ExpressionWrapper(
+        first + datetime.timedelta(hours=24 * (days - 2) + 12),
+        output_field=DateTimeField(),
+    )
+
+    return NextLocalMidnight(noon, tz)
@@ -1,10 +1,11 @@
+import datetime
 import logging
 
 from django import forms
 from django.utils import timezone
 from django.utils.translation import ugettext as _, ugettext_lazy
 
-from vms import models
+from vms import models, perf, roster
 
 
 logger = logging.getLogger(__name__)
@@ -156,12 +157,12 @@ class ClockInForm(forms.Form):
     def save(self):
         """
         Save the form to create a new time record.
+
+        Raises:
+            ValidationError:
+                If the employee clocked in after the form was validated.
         """
-        record = models.TimeRecord.objects.create(
-            employee=self.employee,
-            pay_rate=self.cleaned_data.get('job').pay_rate,
-            **self.cleaned_data,
-        )
+        record = self.employee.clock_in(self.cleaned_data.get('job'))
         logger.info('Created time record %r', record)
 
 
@@ -202,11 +203,13 @@ class ClockOutForm(forms.Form):
     def save(self):
         """
         Complete the employee's open time record.
-        """
-        record = self.employee.time_records.get(time_end=None)
-        record.time_end = timezone.now()
-        record.save()
 
+        Raises:
+            ValidationError:
+                If the employee clocked out after the form was
+                validated.
+        """
+        record = self.employee.clock_out()
         logger.info('Completed time record %r', record)
 
 
@@ -284,6 +287,182 @@ class EmployeeApprovalForm(forms.Form):
         self.employee.save()
 
 
+class EmployeeBulkApprovalForm(forms.Form):
+    """
+    Form to approve several of a client's pending employees at once and
+    assign them a supervisor.
+    """
+    employees = forms.ModelMultipleChoiceField(
+        queryset=None,
+        widget=forms.CheckboxSelectMultiple,
+    )
+    supervisor = forms.ModelChoiceField(queryset=None)
+
+    def __init__(self, admin, *args, **kwargs):
+        """
+        Initialize the form with the admin doing the approval.
+
+        Args:
+            admin:
+                The client admin doing the approval. Only employees of
+                their client can be approved.
+            *args:
+                Positional arguments for the base form class.
+            **kwargs:
+                Keyword arguments for the base form class.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.admin = admin
+        client = admin.client
+
+        self.fields['employees'].queryset = client.employees.filter(
+            time_approved=None,
+        )
+        self.fields['supervisor'].queryset = client.admins.select_related(
+            'client',
+            'user',
+        )
+
+    def save(self):
+        """
+        Approve the selected employees and assign their supervisor using
+        a single update.
+
+        Returns:
+            The number of employees that were approved.
+        """
+        return self.cleaned_data['employees'].approve(
+            self.admin,
+            supervisor=self.cleaned_data['supervisor'],
+        )
+
+
+class PayPeriodCloseForm(forms.Form):
+    """
+    Form to close a pay period.
+    """
+
+    def __init__(self, pay_period, user, *args, **kwargs):
+        """
+        Initialize the form with the pay period being closed.
+
+        Args:
+            pay_period:
+                The pay period to close.
+            user:
+                The user closing the pay period.
+            *args:
+                Positional arguments for the base form class.
+            **kwargs:
+                Keyword arguments for the base form class.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.pay_period = pay_period
+        self.user = user
+
+    def clean(self):
+        """
+        Validate that the pay period can be closed.
+        """
+        self.pay_period.validate_closable()
+
+    def save(self):
+        """
+        Close the pay period.
+
+        Raises:
+            ValidationError:
+                If the pay period cannot be closed.
+        """
+        self.pay_period.close(self.user)
+
+
+class PayPeriodCreateForm(forms.Form):
+    """
+    Form to create a pay period for a client.
+
+    The period covers whole days in the current time zone, including
+    the end date.
+    """
+    end_date = forms.DateField(
+        help_text=ugettext_lazy('The last day of the pay period.'),
+        label=ugettext_lazy('End Date'),
+    )
+    start_date = forms.DateField(
+        help_text=ugettext_lazy('The first day of the pay period.'),
+        label=ugettext_lazy('Start Date'),
+    )
+
+    field_order = ('start_date', 'end_date')
+
+    def __init__(self, client, *args, **kwargs):
+        """
+        Initialize the form with the client the period is for.
+
+        Args:
+            client:
+                The client to create the pay period for.
+            *args:
+                Positional arguments for the base form class.
+            **kwargs:
+                Keyword arguments for the base form class.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.client = client
+        self.pay_period = None
+
+    def clean(self):
+        """
+        Build the pay period and validate it.
+
+        Returns:
+            The cleaned data.
+        """
+        cleaned_data = super().clean()
+        start_date = cleaned_data.get('start_date')
+        end_date = cleaned_data.get('end_date')
+
+        if start_date and end_date:
+            self.pay_period = models.PayPeriod(
+                client=self.client,
+                end=self._to_datetime(end_date + datetime.timedelta(days=1)),
+                start=self._to_datetime(start_date),
+            )
+
+            try:
+                self.pay_period.full_clean()
+            except forms.ValidationError as e:
+                # The model's fields differ from the form's, so report
+                # every error as a non-field error.
+                raise forms.ValidationError(e.messages)
+
+        return cleaned_data
+
+    def save(self):
+        """
+        Save the pay period.
+
+        Returns:
+            The created pay period.
+        """
+        self.pay_period.save()
+        logger.info('Created pay period %r', self.pay_period)
+
+        return self.pay_period
+
+    @staticmethod
+    def _to_datetime(date):
+        """
+        Get the aware datetime at the start of a date.
+        """
+        return timezone.make_aware(
+            datetime.datetime.combine(date, datetime.time()),
+        )
+
+
 class StaffingAgencyEmployeeCreateForm(forms.Form):
     """
     Form to create a staffing agency employee.
@@ -359,7 +538,7 @@ class StaffingAgencyEmployeeApprovalForm(forms.Form):
         """
         cleaned_data = super().clean()
 
-        if not self.admin.agency == self.employee.agency:
+        if self.admin.agency_id != self.employee.agency_id:
             raise forms.ValidationError(
                 _(
                     "The staffing agency administrator may only approve "
@@ -376,6 +555,141 @@ class StaffingAgencyEmployeeApprovalForm(forms.Form):
         self.employee.approve(self.admin)
 
 
+class StaffingAgencyEmployeeBulkApprovalForm(forms.Form):
+    """
+    Form to approve several of a staffing agency's applicants at once.
+    """
+    approve_all = forms.BooleanField(
+        label=ugettext_lazy('Approve all pending employees'),
+        required=False,
+    )
+    employees = forms.ModelMultipleChoiceField(
+        queryset=None,
+        required=False,
+        widget=forms.CheckboxSelectMultiple,
+    )
+
+    def __init__(self, admin, *args, **kwargs):
+        """
+        Initialize the form with the admin doing the approval.
+
+        Args:
+            admin:
+                The staffing agency administrator doing the approval.
+                Only applicants to their agency can be approved.
+            *args:
+                Positional arguments for the base form class.
+            **kwargs:
+                Keyword arguments for the base form class.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.admin = admin
+
+        self.fields['employees'].queryset = self.pending_employees()
+
+    def clean(self):
+        """
+        Ensure that employees were selected or all were requested.
+
+        Returns:
+            The cleaned data.
+        """
+        cleaned_data = super().clean()
+
+        if not (cleaned_data.get('approve_all')
+                or cleaned_data.get('employees')):
+            raise forms.ValidationError(
+                _('Select the employees to approve.'),
+            )
+
+        return cleaned_data
+
+    def pending_employees(self):
+        """
+        Returns:
+            A queryset containing the employees who have applied to the
+            admin's agency and not been approved yet.
+        """
+        return models.StaffingAgencyEmployee.objects.pending().filter(
+            agency_id=self.admin.agency_id,
+        )
+
+    def save(self):
+        """
+        Approve the selected employees using a single update.
+
+        Returns:
+            The number of employees that were approved.
+        """
+        if self.cleaned_data['approve_all']:
+            employees = self.pending_employees()
+        else:
+            employees = self.cleaned_data['employees']
+
+        return employees.approve(self.admin)
+
+
+class StaffingAgencyRosterUploadForm(forms.Form):
+    """
+    Form to place the workers listed in a roster file at a client.
+    """
+    client = forms.ModelChoiceField(
+        help_text=ugettext_lazy('The client to place the workers at.'),
+        label=ugettext_lazy('Client'),
+        queryset=models.Client.objects.all(),
+    )
+    roster = forms.FileField(
+        help_text=ugettext_lazy(
+            'A CSV file with "name" and "username" columns, and an optional '
+            '"timezone" column.'
+        ),
+        label=ugettext_lazy('Roster'),
+    )
+
+    def __init__(self, admin, *args, **kwargs):
+        """
+        Initialize the form with the admin uploading the roster.
+
+        Args:
+            admin:
+                The staffing agency administrator uploading the roster.
+            *args:
+                Positional arguments for the base form class.
+            **kwargs:
+                Keyword arguments for the base form class.
+        """
+        super().__init__(*args, **kwargs)
+
+        self.admin = admin
+
+    def clean_roster(self):
+        """
+        Read the rows of the uploaded roster.
+
+        Returns:
+            A list of the ``RosterRow`` instances in the roster.
+        """
+        try:
+            return roster.read_roster(self.cleaned_data['roster'])
+        except ValueError as e:
+            raise forms.ValidationError(str(e))
+
+    def save(self):
+        """
+        Import the workers listed in the roster.
+
+        Returns:
+            A ``RosterResult`` describing the outcome of the import.
+        """
+        return roster.import_roster(
+            self.admin.agency,
+            self.cleaned_data['client'],
+            self.cleaned_data['roster'],
+            admin=self.admin,
+        )
+
+
 class TimeRecordApprovalForm(forms.Form):
     """
     Form to approve a time record.
@@ -408,7 +722,8 @@ class TimeRecordApprovalForm(forms.Form):
         Returns:
             The approval instance created for the time record.
         """
-        return models.TimeRecordApproval.objects.create(
-            time_record=self.time_record,
-            user=self.approving_user,
-        )
+        with perf.Span('approve_time_record', time_record=self.time_record.id):
+            return models.TimeRecordApproval.objects.create(
+                time_record=self.time_record,
+                user=self.approving_user,
+            )
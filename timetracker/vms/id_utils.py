@@ -3,6 +3,8 @@ import secrets
 
 from django.conf import settings
 
+from vms import perf
+
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,7 @@ def generate_numeric_id(num_digits):
     return secrets.randbelow(rand_bound) + lower_bound
 
 
+@perf.timed('generate_unique_id')
 def generate_unique_id(digits, queryset, queryset_attr='id'):
     """
     Generate a unique ID for a given queryset.
@@ -83,3 +86,61 @@ def generate_unique_id(digits, queryset, queryset_attr='id'):
         attempts += 1
 
     return value
+
+
+@perf.timed('generate_unique_ids')
+def generate_unique_ids(digits, count, queryset, queryset_attr='id'):
+    """
+    Generate several IDs that are unique for a given queryset.
+
+    The values already in use are loaded with a single query, so the
+    number of queries does not grow with the number of IDs generated.
+
+    warning ..
+
+        There is still a race condition between when the values are
+        returned from the function and when they are saved.
+
+    Args:
+        digits:
+            The number of digits in each returned ID.
+        count:
+            The number of IDs to generate.
+        queryset:
+            The queryset used to check for uniqueness.
+        queryset_attr:
+            The attribute of the queryset to check for uniqueness.
+            Defaults to ``id``.
+
+    Returns:
+        A list of distinct IDs that are unique for the provided
+        queryset.
+
+    Raises:
+        RuntimeError:
+            If there are not enough unused IDs with the given number of
+            digits.
+    """
+    taken = set(queryset.values_list(queryset_attr, flat=True))
+    available = 9 * 10 ** (digits - 1) - len(taken)
+
+    # Leave headroom so drawing the last IDs does not take an unbounded
+    # number of attempts.
+    if count > available // 2:
+        logger.error(
+            'Not enough unused IDs to generate %d unique IDs for %s.',
+            count,
+            queryset,
+        )
+
+        raise RuntimeError(f'Not enough unused IDs to generate {count} IDs.')
+
+    values = []
+    while len(values) < count:
+        value = generate_numeric_id(digits)
+
+        if value not in taken:
+            taken.add(value)
+            values.append(value)
+
+    return values
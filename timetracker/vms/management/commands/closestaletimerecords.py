@@ -0,0 +1,104 @@
+import datetime
+import logging
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from vms import models
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Command to clock out employees who forgot to clock out.
+    """
+
+    help = (
+        "Close the open time records that are longer than their client's "
+        "maximum shift length. Each record is closed at its start time plus "
+        "the maximum shift length."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the command's arguments.
+
+        Args:
+            parser:
+                The parser to add arguments to.
+        """
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report the number of stale records without closing them.',
+        )
+
+    def get_policies(self):
+        """
+        Get the shift length policies to apply.
+
+        Clients sharing a maximum shift length are handled together so
+        that each policy is applied with a single update.
+
+        Returns:
+            A list of tuples containing a queryset of the time records a
+            policy applies to and the maximum shift length in hours.
+        """
+        records = models.TimeRecord.objects.all()
+        hours = models.Client.objects.exclude(
+            max_shift_hours=None,
+        ).order_by(
+            'max_shift_hours',
+        ).values_list(
+            'max_shift_hours',
+            flat=True,
+        ).distinct()
+
+        policies = [
+            (records.filter(employee__client__max_shift_hours=None),
+             settings.VMS_MAX_SHIFT_HOURS),
+        ]
+        policies.extend(
+            (records.filter(employee__client__max_shift_hours=value), value)
+            for value in hours
+        )
+
+        return policies
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+        """
+        now = timezone.now()
+        total = 0
+
+        for records, hours in self.get_policies():
+            max_shift = datetime.timedelta(hours=hours)
+
+            if options['dry_run']:
+                count = records.stale(max_shift, now).count()
+            else:
+                closed = records.close_stale(max_shift, now)
+                count = len(closed)
+
+                for record_id, _, client_id in closed:
+                    logger.info(
+                        'Closed time record %s of client %s after %d hours',
+                        record_id,
+                        client_id,
+                        hours,
+                    )
+
+            if count:
+                self.stdout.write(
+                    f'{count} record(s) exceeded the {hours} hour limit.',
+                )
+            total += count
+
+        action = 'Found' if options['dry_run'] else 'Closed'
+        self.stdout.write(
+            self.style.SUCCESS(f'{action} {total} stale record(s).'),
+        )
@@ -0,0 +1,49 @@
+import datetime
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.utils import timezone
+
+from vms import models
+
+
+class Command(BaseCommand):
+    """
+    Command to remove superseded entries from the time record change
+    log.
+    """
+
+    help = (
+        "Remove entries from the time record change log that are older than "
+        "the retention period and have been superseded by a later change to "
+        "the same time record."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the command's arguments.
+
+        Args:
+            parser:
+                The parser to add arguments to.
+        """
+        parser.add_argument(
+            '--days',
+            default=settings.VMS_CHANGE_LOG_RETENTION_DAYS,
+            help=(
+                'The number of days that every change is retained for. '
+                'Defaults to the VMS_CHANGE_LOG_RETENTION_DAYS setting.'
+            ),
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+        """
+        before = timezone.now() - datetime.timedelta(days=options['days'])
+        count = models.TimeRecordChange.objects.compact(before)
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Removed {count} superseded change(s).'),
+        )
@@ -0,0 +1,52 @@
+from django.core.management import BaseCommand
+
+from vms import models
+
+
+class Command(BaseCommand):
+    """
+    Command to report time records that overlap another record of the
+    same employee.
+    """
+
+    help = (
+        "List the time records that overlap an earlier time record of the "
+        "same employee. Overlapping records are counted twice when totaling "
+        "hours worked."
+    )
+
+    def add_arguments(self, parser):
+        """
+        Add the command's arguments.
+
+        Args:
+            parser:
+                The parser to add arguments to.
+        """
+        parser.add_argument(
+            '--client',
+            help='Only check the employees of the client with this ID.',
+            type=int,
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the command.
+        """
+        records = models.TimeRecord.objects.all()
+        if options['client'] is not None:
+            records = records.filter(employee__client_id=options['client'])
+
+        count = 0
+        for record_id, other_id in records.find_overlaps():
+            self.stdout.write(f'{record_id} overlaps {other_id}')
+            count += 1
+
+        if count:
+            self.stdout.write(
+                self.style.WARNING(f'Found {count} overlapping record(s).'),
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS('No overlapping records found.'),
+            )
@@ -1,41 +1,757 @@
 import datetime
 
-from django.db import models
-from django.db.models import F, ExpressionWrapper, DurationField, Sum
+from django.apps import apps
+from django.db import connections, models, transaction
+from django.db.models import (
+    Count,
+    DurationField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    Max,
+    OuterRef,
+    Q,
+    Sum,
+)
+from django.db.models.functions import Least, TruncDay
+from django.utils import timezone
+
+from vms import cache, expressions, perf, time_utils
+
+
+def _sort_key(key):
+    """
+    Get a sort key for a tuple that may contain ``None``.
+
+    Args:
+        key:
+            The tuple to sort.
+
+    Returns:
+        A tuple that sorts ``None`` before any other value.
+    """
+    return tuple((value is not None, value) for value in key)
+
+
+class EmployeeQuerySet(models.QuerySet):
+    def _bulk_update(self, condition, **values):
+        """
+        Update the employees matching a condition with a single query.
+
+        Since bulk updates do not send signals, the caches of the
+        updated employees and their clients are invalidated here.
+
+        Args:
+            condition:
+                A ``Q`` object that employees must match to be updated.
+            **values:
+                The field values to set.
+
+        Returns:
+            The number of employees that were updated.
+        """
+        updated = list(
+            self.filter(condition).values_list('pk', 'client_id'),
+        )
+        if not updated:
+            return 0
+
+        # Applying the condition again guards against employees that
+        # were changed after they were selected.
+        count = self.model.objects.filter(
+            condition,
+            pk__in=[employee_pk for employee_pk, _ in updated],
+        ).update(
+            **values,
+        )
+
+        for employee_pk, client_id in updated:
+            cache.invalidate_employee(employee_pk, client_id)
+
+        return count
+
+    @perf.timed('approve_employees')
+    def approve(self, admin=None, supervisor=None, now=None):
+        """
+        Approve and activate the employees that have not been approved.
+
+        Args:
+            admin:
+                The client admin approving the employees, if any.
+            supervisor:
+                The client admin to assign as the supervisor of each
+                approved employee. If not provided, the employees'
+                supervisors are left unchanged.
+            now:
+                The time of the approval. Defaults to the current time.
+
+        Returns:
+            The number of employees that were approved.
+        """
+        now = now or timezone.now()
+        values = {}
+        if supervisor is not None:
+            values['supervisor'] = supervisor
+
+        return self._bulk_update(
+            Q(time_approved=None),
+            approved_by=admin,
+            is_active=True,
+            time_approved=now,
+            time_updated=now,
+            **values,
+        )
+
+    def set_active(self, is_active, now=None):
+        """
+        Activate or deactivate the employees.
+
+        Args:
+            is_active:
+                The new value of ``is_active`` for the employees.
+            now:
+                The time of the update. Defaults to the current time.
+
+        Returns:
+            The number of employees that were changed.
+        """
+        return self._bulk_update(
+            ~Q(is_active=is_active),
+            is_active=is_active,
+            time_updated=now or timezone.now(),
+        )
+
+
+EmployeeManager = EmployeeQuerySet.as_manager
+
+
+class PayPeriodQuerySet(models.QuerySet):
+    def closed(self):
+        """
+        Returns:
+            A queryset containing the pay periods that have been closed.
+        """
+        return self.exclude(time_closed=None)
+
+    def containing(self, *times):
+        """
+        Get the pay periods containing any of the given times.
+
+        Args:
+            *times:
+                The times to search for.
+
+        Returns:
+            A queryset containing the pay periods that start at or
+            before and end after any of the times.
+        """
+        query = Q()
+        for time in times:
+            query |= Q(start__lte=time, end__gt=time)
+
+        return self.filter(query)
+
+
+PayPeriodManager = PayPeriodQuerySet.as_manager
+
+
+class StaffingAgencyEmployeeQuerySet(models.QuerySet):
+    @perf.timed('approve_staffing_agency_employees')
+    def approve(self, admin=None, now=None):
+        """
+        Approve the staffing agency employees that have not been
+        approved yet, using a single update.
+
+        Args:
+            admin:
+                The staffing agency admin approving the employees, if
+                any.
+            now:
+                The time of the approval. Defaults to the current time.
+
+        Returns:
+            The number of employees that were approved.
+        """
+        return self.pending().update(
+            approved_by=admin,
+            is_approved=True,
+            time_approved=now or timezone.now(),
+        )
+
+    def pending(self):
+        """
+        Returns:
+            A queryset containing the staffing agency employees that
+            have not been approved yet.
+        """
+        return self.filter(is_approved=False)
+
+
+StaffingAgencyEmployeeManager = StaffingAgencyEmployeeQuerySet.as_manager
+
+
+# The number of days of each record that ``time_by_day`` aggregates in
+# the database before splitting the rest of longer records in Python.
+TIME_BY_DAY_QUERY_DAYS = 2
 
 
 class TimeRecordQuerySet(models.QuerySet):
-    def with_deltas(self):
+    @perf.timed('approve_time_records')
+    def approve(self, user):
+        """
+        Approve the completed time records that are not yet approved.
+
+        The records to approve are locked and selected in the same
+        transaction as their approvals, which are created in bulk.
+        Records in closed pay periods are skipped. Since bulk creation
+        does not send signals, the change log and caches are updated
+        here.
+
+        Args:
+            user:
+                The user approving the records.
+
+        Returns:
+            The number of records that were approved.
+        """
+        TimeRecordApproval = apps.get_model('vms', 'TimeRecordApproval')
+        TimeRecordChange = apps.get_model('vms', 'TimeRecordChange')
+
+        with transaction.atomic():
+            # Lock the pending records so a concurrent approval of the
+            # same records waits for this one to finish, then select them
+            # again to skip any that were approved while waiting.
+            pending_ids = list(
+                self.unlocked().filter(
+                    approval=None,
+                    time_end__isnull=False,
+                ).select_for_update(
+                    of=('self',),
+                ).values_list(
+                    'id',
+                    flat=True,
+                )
+            )
+            records = list(
+                self.model.objects.filter(
+                    approval=None,
+                    id__in=pending_ids,
+                ).values_list(
+                    'id',
+                    'employee_id',
+                    'employee__client_id',
+                )
+            )
+
+            if not records:
+                return 0
+
+            TimeRecordApproval.objects.bulk_create(
+                TimeRecordApproval(
+                    time_record_id=record_id,
+                    user=user,
+                )
+                for record_id, _, _ in records
+            )
+
+            TimeRecordChange.objects.bulk_create(
+                TimeRecordChange(
+                    action=TimeRecordChange.ACTION_APPROVED,
+                    client_id=client_id,
+                    employee_pk=employee_pk,
+                    time_record_id=record_id,
+                )
+                for record_id, employee_pk, client_id in records
+            )
+
+        for employee_pk, client_id in {(e, c) for _, e, c in records}:
+            cache.invalidate_employee(employee_pk, client_id)
+
+        return len(records)
+
+    def close_stale(self, max_shift, now=None):
+        """
+        Clock out the open records that have exceeded a shift length.
+
+        Each stale record is closed at its start time plus the maximum
+        shift length, using a single update. Records in closed pay
+        periods are skipped. Since bulk updates do not send signals, the
+        change log and caches are updated here, in the same transaction
+        as the update.
+
+        Args:
+            max_shift:
+                The maximum length of a shift as a ``datetime.timedelta``.
+            now:
+                The current time. Defaults to the current time.
+
+        Returns:
+            A list of tuples containing the ID, employee primary key,
+            and client ID of each record that was closed. Records that
+            were closed by someone else while this ran are not included.
+        """
+        TimeRecordChange = apps.get_model('vms', 'TimeRecordChange')
+        now = now or timezone.now()
+
+        with transaction.atomic():
+            # Lock the stale records so a concurrent clock out either
+            # finishes first, and the record is no longer selected, or
+            # waits until the record has been closed here.
+            closed = list(
+                self.unlocked().stale(max_shift, now).select_for_update(
+                    of=('self',),
+                ).values_list(
+                    'id',
+                    'employee_id',
+                    'employee__client_id',
+                )
+            )
+
+            if not closed:
+                return closed
+
+            # Filtering on the end time again guards against records
+            # closed after they were selected on databases without row
+            # locks.
+            updated = self.model.objects.filter(
+                id__in=[record_id for record_id, _, _ in closed],
+                time_end=None,
+            ).update(
+                time_end=F('time_start') + max_shift,
+                time_updated=now,
+            )
+
+            if updated != len(closed):
+                closed_ids = set(
+                    self.model.objects.filter(
+                        id__in=[record_id for record_id, _, _ in closed],
+                        time_end=F('time_start') + max_shift,
+                        time_updated=now,
+                    ).values_list(
+                        'id',
+                        flat=True,
+                    )
+                )
+                closed = [
+                    record for record in closed if record[0] in closed_ids
+                ]
+
+            TimeRecordChange.objects.bulk_create(
+                TimeRecordChange(
+                    action=TimeRecordChange.ACTION_UPDATED,
+                    client_id=client_id,
+                    employee_pk=employee_pk,
+                    time_record_id=record_id,
+                )
+                for record_id, employee_pk, client_id in closed
+            )
+
+        for employee_pk, client_id in {(e, c) for _, e, c in closed}:
+            cache.invalidate_employee(employee_pk, client_id)
+
+        return closed
+
+    def find_overlaps(self, chunk_size=2000):
+        """
+        Find the overlapping time records in the queryset.
+
+        The records are streamed from the database sorted by employee
+        and start time, which the ``(employee, time_start)`` index
+        provides, and compared in a single sweep.
+
+        Args:
+            chunk_size:
+                The number of records to fetch from the database at a
+                time.
+
+        Yields:
+            A tuple containing the IDs of two overlapping records of the
+            same employee.
+        """
+        records = self.order_by(
+            'employee_id',
+            'time_start',
+            'id',
+        ).values_list(
+            'id',
+            'employee_id',
+            'time_start',
+            'time_end',
+        ).iterator(chunk_size=chunk_size)
+
+        return time_utils.find_overlaps(records)
+
+    def _annotate_locked(self):
+        """
+        Annotate whether each record belongs to a closed pay period.
+
+        Returns:
+            A queryset whose records are annotated with ``is_locked``.
+        """
+        PayPeriod = apps.get_model('vms', 'PayPeriod')
+
+        return self.annotate(
+            is_locked=Exists(
+                PayPeriod.objects.closed().filter(
+                    client=OuterRef('employee__client'),
+                    end__gt=OuterRef('time_start'),
+                    start__lte=OuterRef('time_start'),
+                ),
+            ),
+        )
+
+    def locked(self):
+        """
+        Get the time records that belong to a closed pay period.
+
+        Returns:
+            A queryset containing the records that start within a
+            closed pay period of their employee's client.
+        """
+        return self._annotate_locked().filter(is_locked=True)
+
+    def open(self):
+        """
+        Get the time records that have not been completed.
+
+        Returns:
+            A queryset containing the time records without an end time,
+            ordered by start time.
+        """
+        return self.filter(time_end=None).order_by('time_start')
+
+    def overlapping(self, employee, time_start, time_end):
+        """
+        Get the time records of an employee that overlap a period.
+
+        Records without an end time are treated as extending
+        indefinitely.
+
+        Args:
+            employee:
+                The employee whose records are searched.
+            time_start:
+                The start of the period.
+            time_end:
+                The end of the period, or ``None`` if the period has not
+                ended.
+
+        Returns:
+            A queryset containing the employee's time records that
+            overlap the period.
+        """
+        queryset = self.filter(employee=employee).filter(
+            Q(time_end=None) | Q(time_end__gt=time_start),
+        )
+
+        if time_end is not None:
+            queryset = queryset.filter(time_start__lt=time_end)
+
+        return queryset
+
+    def with_deltas(self, rounded=False):
         """
         Annotate the queryset to include a delta for each time record.
 
         Because computing a delta relies on ``time_end`` being present,
         time records that have not been completed are excluded.
 
+        Args:
+            rounded:
+                A boolean indicating if each record should also be
+                annotated with its delta rounded to the rounding block
+                of the employee's client.
+
         Returns:
             A queryset annotated such that each time record has a
             ``delta`` attribute containing the delta between the
-            record's ``time_start`` and ``time_end``.
+            record's ``time_start`` and ``time_end``. If ``rounded`` is
+            true, each time record also has a ``rounded_delta``
+            attribute.
+        """
+        queryset = self.exclude(time_end=None).annotate(
+            delta=expressions.duration_expression(),
+        )
+
+        if rounded:
+            queryset = queryset.annotate(
+                rounded_delta=expressions.RoundDuration(
+                    F('delta'),
+                    expressions.rounding_block_expression(),
+                ),
+            )
+
+        return queryset
+
+    def stale(self, max_shift, now=None):
+        """
+        Get the open time records that have exceeded a shift length.
+
+        Args:
+            max_shift:
+                The maximum length of a shift as a ``datetime.timedelta``.
+            now:
+                The current time. Defaults to the current time.
+
+        Returns:
+            A queryset containing the open records that started more
+            than ``max_shift`` before ``now``.
+        """
+        now = now or timezone.now()
+
+        return self.open().filter(time_start__lt=now - max_shift)
+
+    def time_by_day(self, *fields, tz=None):
+        """
+        Get the time worked on each local day.
+
+        Records that cross midnight are split between every day they
+        span. The portion of each record on its first day is aggregated
+        with one grouped query, then the portion on each following day
+        with another, for up to ``TIME_BY_DAY_QUERY_DAYS`` days. The
+        rest of any record continuing past those days is loaded with one
+        more query and split in Python, so at most
+        ``TIME_BY_DAY_QUERY_DAYS + 1`` queries are made however long the
+        records are. Most records end on the day they start, so
+        typically one or two queries are made.
+
+        Args:
+            *fields:
+                Additional fields to group the totals by, such as
+                ``'employee_id'``.
+            tz:
+                The time zone that days are determined in. Defaults to
+                the current time zone.
+
+        Returns:
+            A list of dictionaries ordered by day, containing the
+            ``day`` as a ``datetime.date``, the value of each of the
+            provided fields, and the ``total_time`` worked as a
+            ``datetime.timedelta``. Records that have not ended are
+            ignored.
+        """
+        tz = tz or timezone.get_current_timezone()
+        records = self.exclude(time_end=None)
+
+        totals = {}
+        portion_start = F('time_start')
+
+        def add(row):
+            key = (row['day'],) + tuple(row[field] for field in fields)
+
+            if key in totals:
+                totals[key]['total_time'] += row['total_time']
+            else:
+                totals[key] = row
+
+        for days in range(1, TIME_BY_DAY_QUERY_DAYS + 1):
+            portion_end = expressions.local_midnight_expression(days, tz)
+
+            portions = records.values(
+                *fields,
+                day=TruncDay(portion_start, tzinfo=tz),
+            ).annotate(
+                continuing=Count('id', filter=Q(time_end__gt=portion_end)),
+                total_time=Sum(ExpressionWrapper(
+                    Least(F('time_end'), portion_end) - portion_start,
+                    output_field=DurationField(),
+                )),
+            ).order_by()
+
+            continuing = False
+            for row in portions:
+                continuing = continuing or row.pop('continuing') > 0
+                row['day'] = row['day'].date()
+                add(row)
+
+            if not continuing:
+                break
+
+            records = records.filter(time_end__gt=portion_end)
+            portion_start = portion_end
+        else:
+            # Records spanning more days, such as ones left open until
+            # they were swept, are rare, so splitting them in Python
+            # avoids a query for every day they span.
+            remaining = records.values(
+                *fields,
+                'time_end',
+                portion_start=portion_start,
+            )
+            for record in remaining:
+                start = record.pop('portion_start')
+                end = record.pop('time_end')
+
+                for day, total_time in time_utils.split_by_local_day(
+                        start,
+                        end,
+                        tz):
+                    add(dict(record, day=day, total_time=total_time))
+
+        return [totals[key] for key in sorted(totals, key=_sort_key)]
+
+    def time_by_week(self, *fields, tz=None):
+        """
+        Get the time worked in each week, beginning on Monday.
+
+        Args:
+            *fields:
+                Additional fields to group the totals by.
+            tz:
+                The time zone that days are determined in. Defaults to
+                the current time zone.
+
+        Returns:
+            A list of dictionaries ordered by week, containing the
+            ``week`` as the ``datetime.date`` it begins on, the value of
+            each of the provided fields, and the ``total_time`` worked.
         """
-        expression = F('time_end') - F('time_start')
-        wrapped_expression = ExpressionWrapper(expression, DurationField())
+        totals = {}
+        for row in self.time_by_day(*fields, tz=tz):
+            week = row.pop('day')
+            row['week'] = week - datetime.timedelta(days=week.weekday())
+            key = (row['week'],) + tuple(row[field] for field in fields)
+
+            if key in totals:
+                totals[key]['total_time'] += row['total_time']
+            else:
+                totals[key] = row
 
-        return self.exclude(time_end=None).annotate(delta=wrapped_expression)
+        return [totals[key] for key in sorted(totals, key=_sort_key)]
 
-    def total_time(self):
+    @perf.timed('total_time')
+    def total_time(self, rounded=False):
         """
         Get the total duration of the time records in the queryset.
 
+        Args:
+            rounded:
+                A boolean indicating if each record's duration should be
+                rounded to the rounding block of the employee's client
+                before being added up.
+
         Returns:
             The total duration of the time records in the queryset
             expressed as a ``datetime.timedelta`` instance.
         """
-        aggregate = self.with_deltas().aggregate(sum=Sum('delta'))
+        field = 'rounded_delta' if rounded else 'delta'
+        aggregate = self.with_deltas(rounded).aggregate(sum=Sum(field))
 
         if aggregate['sum'] is None:
             return datetime.timedelta(0)
 
         return aggregate['sum']
 
+    def unlocked(self):
+        """
+        Get the time records that do not belong to a closed pay period.
+
+        Bulk operations that bypass ``TimeRecord.save`` use this to
+        leave the records of closed pay periods untouched.
+
+        Returns:
+            A queryset excluding the records that start within a closed
+            pay period of their employee's client.
+        """
+        return self._annotate_locked().filter(is_locked=False)
+
 
 TimeRecordManager = TimeRecordQuerySet.as_manager
+
+
+# The key of the advisory lock serializing the allocation of change log
+# IDs on PostgreSQL.
+CHANGE_LOG_LOCK_ID = 0x766d73636867
+
+
+class TimeRecordChangeQuerySet(models.QuerySet):
+    def _lock_sequence(self):
+        """
+        Wait for other transactions adding to the change log to finish.
+
+        Sequence values are allocated when rows are inserted but become
+        visible when their transaction commits, so concurrent
+        transactions can commit IDs out of order. A consumer reading the
+        log in between would advance past the ID that is not yet visible
+        and never see it. Holding a transaction level lock from the
+        first insert until commit means IDs are allocated in commit
+        order.
+
+        The lock is global rather than per client because a single feed
+        can span clients, such as the feed of a staffing agency admin.
+        This serializes the commits of every transaction that changes a
+        time record, so the lock is taken as late as possible: log
+        entries are added after the change they record, leaving only the
+        commit itself to wait on the lock.
+
+        SQLite holds a database lock for the duration of each write
+        transaction, so IDs are already allocated in commit order.
+
+        This must be called inside a transaction.
+        """
+        connection = connections[self.db]
+
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT pg_advisory_xact_lock(%s)',
+                    [CHANGE_LOG_LOCK_ID],
+                )
+
+    def bulk_create(self, *args, **kwargs):
+        """
+        Add several entries to the change log in commit order.
+        """
+        self._for_write = True
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            self._lock_sequence()
+
+            return super().bulk_create(*args, **kwargs)
+
+    def create(self, **kwargs):
+        """
+        Add an entry to the change log in commit order.
+        """
+        self._for_write = True
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            self._lock_sequence()
+
+            return super().create(**kwargs)
+
+    def compact(self, before):
+        """
+        Remove superseded entries from the change log.
+
+        An entry is superseded if a later entry exists for the same time
+        record. Since consumers fetch the current state of each changed
+        record, a consumer resuming from any position still ends up with
+        the same state after compaction, but has fewer entries to
+        process.
+
+        Args:
+            before:
+                Only entries created before this time are removed.
+
+        Returns:
+            The number of entries that were removed.
+        """
+        latest = self.model.objects.values(
+            'time_record_id',
+        ).annotate(
+            latest_id=Max('id'),
+        ).values(
+            'latest_id',
+        )
+
+        deleted, _ = self.filter(
+            time_created__lt=before,
+        ).exclude(
+            id__in=latest,
+        ).delete()
+
+        return deleted
+
+
+TimeRecordChangeManager = TimeRecordChangeQuerySet.as_manager
@@ -0,0 +1,39 @@
+# Generated by Django 2.1.3 on 2026-10-19 00:22
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def default_time_updated(apps, schema_editor):
+    """
+    Use the last known modification time of existing time records rather
+    than the time of the migration.
+    """
+    TimeRecord = apps.get_model('vms', 'TimeRecord')
+    TimeRecord.objects.update(
+        time_updated=Coalesce('time_end', 'time_start'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vms', '0012_clientadmininvite'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='timerecord',
+            name='time_updated',
+            field=models.DateTimeField(auto_now=True, help_text='The last time the time record was modified.', verbose_name='last update time'),
+        ),
+        migrations.AddIndex(
+            model_name='timerecord',
+            index=models.Index(fields=['time_start', 'id'], name='vms_timerec_start_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timerecord',
+            index=models.Index(fields=['time_updated'], name='vms_timerec_updated_idx'),
+        ),
+        migrations.RunPython(default_time_updated, migrations.RunPython.noop),
+    ]
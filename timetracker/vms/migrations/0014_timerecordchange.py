@@ -0,0 +1,29 @@
+# Generated by Django 2.1.3 on 2026-10-19 00:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vms', '0013_timerecord_time_updated'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimeRecordChange',
+            fields=[
+                ('action', models.CharField(choices=[('approved', 'Approved'), ('created', 'Created'), ('deleted', 'Deleted'), ('unapproved', 'Unapproved'), ('updated', 'Updated')], help_text='The type of change made to the time record.', max_length=16, verbose_name='action')),
+                ('client_id', models.PositiveIntegerField(help_text='The ID of the client the time record belongs to.', verbose_name='client ID')),
+                ('employee_pk', models.PositiveIntegerField(help_text='The primary key of the employee who owns the record.', verbose_name='employee primary key')),
+                ('id', models.BigAutoField(help_text='The position of the change in the change log.', primary_key=True, serialize=False, verbose_name='ID')),
+                ('time_created', models.DateTimeField(auto_now_add=True, db_index=True, help_text='The time the change was made.', verbose_name='creation time')),
+                ('time_record_id', models.UUIDField(db_index=True, help_text='The ID of the time record that was changed.', verbose_name='time record ID')),
+            ],
+            options={
+                'verbose_name': 'time record change',
+                'verbose_name_plural': 'time record changes',
+                'ordering': ('id',),
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 2.1.3 on 2026-10-19 00:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vms', '0014_timerecordchange'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='timerecord',
+            index=models.Index(fields=['time_end', 'employee'], name='vms_timerec_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timerecordchange',
+            index=models.Index(fields=['client_id', 'id'], name='vms_timerecchg_client_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.1.3 on 2026-10-19 00:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vms', '0015_open_record_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='timerecord',
+            index=models.Index(fields=['employee', 'time_start'], name='vms_timerec_emp_start_idx'),
+        ),
+    ]
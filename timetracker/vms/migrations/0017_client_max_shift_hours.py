@@ -0,0 +1,18 @@
+# Generated by Django 2.1.3 on 2026-10-19 00:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vms', '0016_timerecord_employee_start_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='max_shift_hours',
+            field=models.PositiveSmallIntegerField(blank=True, help_text='The number of hours after which employees who forgot to clock out are clocked out automatically. If not specified, the site wide default is used.', null=True, verbose_name='maximum shift length'),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 2.1.3 on 2026-10-19 00:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('vms', '0017_client_max_shift_hours'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PayPeriod',
+            fields=[
+                ('end', models.DateTimeField(help_text='The end of the pay period. Time records starting at or after this time are not included.', verbose_name='end')),
+                ('id', models.UUIDField(default=uuid.uuid4, help_text='A unique identifier for the pay period.', primary_key=True, serialize=False, unique=True, verbose_name='ID')),
+                ('start', models.DateTimeField(help_text='The start of the pay period. Time records starting at or after this time are included.', verbose_name='start')),
+                ('time_closed', models.DateTimeField(blank=True, help_text='The time the pay period was closed.', null=True, verbose_name='close time')),
+                ('time_created', models.DateTimeField(auto_now_add=True, help_text='The time the pay period was created.', verbose_name='creation time')),
+                ('client', models.ForeignKey(help_text='The client the pay period belongs to.', on_delete=django.db.models.deletion.CASCADE, related_name='pay_periods', related_query_name='pay_period', to='vms.Client', verbose_name='client')),
+                ('closed_by', models.ForeignKey(blank=True, help_text='The user who closed the pay period.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='closed_pay_periods', related_query_name='closed_pay_period', to=settings.AUTH_USER_MODEL, verbose_name='closed by')),
+            ],
+            options={
+                'verbose_name': 'pay period',
+                'verbose_name_plural': 'pay periods',
+                'ordering': ('client', '-start'),
+            },
+        ),
+        migrations.CreateModel(
+            name='PayPeriodSummary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('earnings', models.DecimalField(decimal_places=2, help_text='The total earnings for the time worked.', max_digits=13, verbose_name='earnings')),
+                ('record_count', models.PositiveIntegerField(help_text='The number of time records summarized.', verbose_name='record count')),
+                ('total_time', models.DurationField(help_text='The total time worked.', verbose_name='total time')),
+                ('employee', models.ForeignKey(help_text='The employee whose time records are summarized.', on_delete=django.db.models.deletion.CASCADE, related_name='pay_period_summaries', related_query_name='pay_period_summary', to='vms.Employee', verbose_name='employee')),
+                ('job', models.ForeignKey(help_text='The job the summarized time records were worked on.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pay_period_summaries', related_query_name='pay_period_summary', to='vms.ClientJob', verbose_name='client job')),
+                ('pay_period', models.ForeignKey(help_text='The pay period that the summary belongs to.', on_delete=django.db.models.deletion.CASCADE, related_name='summaries', related_query_name='summary', to='vms.PayPeriod', verbose_name='pay period')),
+            ],
+            options={
+                'verbose_name': 'pay period summary',
+                'verbose_name_plural': 'pay period summaries',
+                'ordering': ('pay_period', 'employee', 'job'),
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='payperiod',
+            unique_together={('client', 'start')},
+        ),
+    ]
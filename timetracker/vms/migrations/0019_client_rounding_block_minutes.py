@@ -0,0 +1,19 @@
+# Generated by Django 2.1.3 on 2026-10-19 00:49
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vms', '0018_payperiod'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='rounding_block_minutes',
+            field=models.PositiveSmallIntegerField(blank=True, help_text="The number of minutes that the duration of each of the client's time records is rounded to. If not specified, the site wide default is used.", null=True, validators=[django.core.validators.MinValueValidator(1)], verbose_name='rounding block'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 2.1.3 on 2026-10-19 00:53
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vms', '0019_client_rounding_block_minutes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='staffingagency',
+            name='markup_percent',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='The percentage added to the pay of employees when billing clients for their time.', max_digits=5, validators=[django.core.validators.MinValueValidator(0)], verbose_name='markup percentage'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.1.3 on 2026-10-19 01:40
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vms', '0020_staffingagency_markup_percent'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='timerecord',
+            options={'ordering': ('time_start', 'id'), 'verbose_name': 'time record', 'verbose_name_plural': 'time records'},
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.1.3 on 2026-10-19 02:33
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('vms', '0021_timerecord_ordering'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='employee',
+            unique_together={('client', 'employee_id')},
+        ),
+    ]
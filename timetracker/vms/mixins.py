@@ -1,90 +1,104 @@
 import datetime
 
+import pytz
+from django.conf import settings
+from django.shortcuts import get_object_or_404, redirect
+from django.utils import timezone
+from django.utils.functional import cached_property
+from django.views.generic.edit import FormMixin
+
 
 class DateRangeMixin(object):
     """
     Mixin providing functionality for filtering by a date range.
 
-    The starting and ending times are specified as GET parameters.
+    The starting and ending dates are specified as GET parameters and
+    both days are included in the range. The parameters are parsed once
+    per request and interpreted in the requesting user's time zone.
     """
     DATE_FMT = '%Y-%m-%d'
-    END_OFFSET = datetime.timedelta(
-        hours=23,
-        minutes=59,
-        seconds=59,
-    )
 
     context_end_date = 'end_date'
     context_start_date = 'start_date'
     end_date_param = 'end_date'
     start_date_param = 'start_date'
 
-    @property
-    def end_date(self):
+    def _parse_date(self, param):
         """
-        Returns:
-            The end date provided in the URL. If both a start and end
-            date are specified and the end date is prior to the start
-            date, the start date is returned instead.
+        Parse a date from the request's GET parameters.
+
+        Args:
+            param:
+                The name of the parameter to parse.
 
-            Note the end date is specified as a datetime so that we can
-            include results for the entire day. This results in an
-            inclusive bound which is more intuitive.
+        Returns:
+            The date provided in the parameter, or ``None`` if the
+            parameter is missing or malformed.
         """
-        date_str = self.request.GET.get(self.end_date_param)
+        date_str = self.request.GET.get(param)
 
         if not date_str:
             return None
 
         try:
-            date = datetime.datetime.strptime(
-                date_str,
-                self.DATE_FMT,
-            )
+            return datetime.datetime.strptime(date_str, self.DATE_FMT).date()
         except ValueError:
             return None
 
-        date += self.END_OFFSET
+    @cached_property
+    def dates(self):
+        """
+        Returns:
+            A tuple containing the start and end dates provided in the
+            URL, either of which may be ``None``. If the end date is
+            prior to the start date, the start date is used as the end
+            date as well.
+        """
+        start_date = self._parse_date(self.start_date_param)
+        end_date = self._parse_date(self.end_date_param)
+
+        if start_date and end_date and end_date < start_date:
+            end_date = start_date
 
-        if self.start_date and self.start_date > date:
-            return self.start_date + self.END_OFFSET
+        return start_date, end_date
 
-        return date
+    @property
+    def end_date(self):
+        """
+        Returns:
+            The last date included in the range, or ``None`` if the range
+            has no end.
+        """
+        return self.dates[1]
 
-    def filter_by_date(
-        self,
-        queryset,
-        start_attr='time_start',
-        end_attr='time_end',
-    ):
+    def filter_by_date(self, queryset, attr='time_start'):
         """
         Filter a queryset based on a date range.
 
-        If either bound is not provided, it is not restricted.
+        Records are compared using a half open range that begins at the
+        start of the first day and ends at the start of the day after
+        the end date. Only a single attribute is compared so an index
+        containing it can be used. If either bound is not provided, it
+        is not restricted.
 
         Args:
             queryset:
                 The queryset to filter.
-            start_attr:
-                The attribute on the queryset that should be compared to
-                the start time given in the URL.
-            end_attr:
-                The attribute on the queryset that should be compared to
-                the end time given in the URL.
+            attr:
+                The attribute on the queryset that should fall within
+                the range.
 
         Returns:
-            The provided queryset filtered such that no record's
-            ``start_attr`` is before the start time in the URL and no
-            record's ``end_attr`` is after the end time in the URL.
+            The provided queryset filtered such that each record's
+            ``attr`` is within the range given in the URL.
         """
-        start_filter = f'{start_attr}__gte'
-        end_filter = f'{end_attr}__lte'
+        time_start, time_end = self.time_range
 
-        if self.start_date:
-            queryset = queryset.filter(**{start_filter: self.start_date})
+        if time_start:
+            queryset = queryset.filter(**{f'{attr}__gte': time_start})
 
-        if self.end_date:
-            queryset = queryset.filter(**{end_filter: self.end_date})
+        if time_end:
+            queryset = queryset.filter(**{f'{attr}__lt': time_end})
 
         return queryset
 
@@ -106,21 +120,162 @@ class DateRangeMixin(object):
 
         return context
 
+    def get_timezone(self):
+        """
+        Returns:
+            The time zone that dates are interpreted in. This is the
+            requesting user's time zone, or the current time zone if the
+            user does not have a valid one.
+        """
+        user = getattr(self.request, 'user', None)
+
+        if user is not None and user.is_authenticated:
+            try:
+                return pytz.timezone(user.timezone)
+            except pytz.UnknownTimeZoneError:
+                pass
+
+        return timezone.get_current_timezone()
+
     @property
     def start_date(self):
         """
         Returns:
-            The start date provided in the URL as a datetime instance.
+            The first date included in the range, or ``None`` if the
+            range has no start.
         """
-        date_str = self.request.GET.get(self.start_date_param)
+        return self.dates[0]
 
-        if not date_str:
-            return None
+    @cached_property
+    def time_range(self):
+        """
+        Returns:
+            A tuple containing the aware datetimes that the range starts
+            at and ends before, either of which may be ``None``.
+        """
+        start_date, end_date = self.dates
+        tz = self.get_timezone()
 
-        try:
-            return datetime.datetime.strptime(
-                date_str,
-                self.DATE_FMT,
+        def to_datetime(date):
+            # Midnight may be skipped by a DST transition, in which case
+            # the standard time offset is used.
+            return timezone.make_aware(
+                datetime.datetime.combine(date, datetime.time()),
+                tz,
+                is_dst=False,
             )
-        except ValueError:
-            return None
+
+        return (
+            to_datetime(start_date) if start_date else None,
+            (
+                to_datetime(end_date + datetime.timedelta(days=1))
+                if end_date
+                else None
+            ),
+        )
+
+
+class FragmentCacheMixin(object):
+    """
+    Mixin providing the information required to cache template
+    fragments.
+
+    Fragments should be keyed by values that change whenever their
+    content does, such as an object's ``time_updated`` or its cache
+    namespace version from ``vms.cache``.
+    """
+    context_cache_timeout = 'cache_timeout'
+
+    def get_context_data(self, **kwargs):
+        """
+        Add the fragment cache timeout to the view's context.
+
+        Args:
+            **kwargs:
+                Keyword arguments to pass to the base method.
+
+        Returns:
+            A dictionary containing context used to render the view.
+        """
+        context = super().get_context_data(**kwargs)
+
+        context[self.context_cache_timeout] = settings.VMS_CACHE_TIMEOUT
+
+        return context
+
+
+class BulkApprovalMixin(FormMixin):
+    """
+    Mixin for a list of pending employees with a form to approve several
+    of them at once.
+
+    The requesting user must administer the organization whose slug is
+    given in the URL. The admin is looked up once per request and passed
+    to the form as ``admin``. Once the form is saved, the user is
+    redirected back to the list.
+    """
+    admin_model = None
+    organization_field = None
+    organization_slug_url_kwarg = None
+    success_url_name = None
+
+    @cached_property
+    def admin(self):
+        """
+        Returns:
+            The admin of the organization whose slug is given in the URL
+            for the requesting user.
+        """
+        return get_object_or_404(
+            self.admin_model.objects.select_related(self.organization_field),
+            user=self.request.user,
+            **{
+                f'{self.organization_field}__slug': self.kwargs.get(
+                    self.organization_slug_url_kwarg,
+                ),
+            },
+        )
+
+    def form_valid(self, form):
+        """
+        Approve the selected employees and redirect back to the list.
+
+        Args:
+            form:
+                The valid form to save.
+
+        Returns:
+            A response redirecting the user to the list of pending
+            employees.
+        """
+        form.save()
+        organization = getattr(self.admin, self.organization_field)
+
+        return redirect(
+            self.success_url_name,
+            **{self.organization_slug_url_kwarg: organization.slug},
+        )
+
+    def get_form_kwargs(self):
+        """
+        Returns:
+            A dictionary containing the keyword arguments used to
+            instantiate the view's form class.
+        """
+        kwargs = super().get_form_kwargs()
+
+        kwargs['admin'] = self.admin
+
+        return kwargs
+
+    def post(self, request, *args, **kwargs):
+        """
+        Approve the employees selected in the submitted form.
+        """
+        form = self.get_form()
+        if form.is_valid():
+            return self.form_valid(form)
+
+        self.object_list = self.get_queryset()
+
+        return self.form_invalid(form)
@@ -6,19 +6,22 @@ import uuid
 import email_utils
 from django.conf import settings
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.core.validators import MinValueValidator
+from django.db import models, transaction
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.crypto import get_random_string
+from django.utils.functional import cached_property
 from django.utils.text import slugify
 from django.utils.translation import ugettext_lazy as _, ugettext
 
-from vms import id_utils, managers
+from vms import id_utils, managers, perf
 
 
 logger = logging.getLogger(__name__)
 
 
+@perf.timed('generate_slug')
 def generate_slug(value, queryset, slug_dest='slug'):
     """
     Generate and save a unique slug for the provided instance.
@@ -75,6 +78,16 @@ class Client(models.Model):
         help_text=_('The primary email address for the client.'),
         verbose_name=_('primary email address'),
     )
+    max_shift_hours = models.PositiveSmallIntegerField(
+        blank=True,
+        help_text=_(
+            'The number of hours after which employees who forgot to clock '
+            'out are clocked out automatically. If not specified, the site '
+            'wide default is used.'
+        ),
+        null=True,
+        verbose_name=_('maximum shift length'),
+    )
     name = models.CharField(
         help_text=_('The name of the client company.'),
         max_length=100,
@@ -91,6 +104,17 @@ class Client(models.Model):
         max_length=30,
         verbose_name=_('phone number'),
     )
+    rounding_block_minutes = models.PositiveSmallIntegerField(
+        blank=True,
+        help_text=_(
+            "The number of minutes that the duration of each of the "
+            "client's time records is rounded to. If not specified, the "
+            "site wide default is used."
+        ),
+        null=True,
+        validators=[MinValueValidator(1)],
+        verbose_name=_('rounding block'),
+    )
     slug = models.SlugField(
         help_text=_('The URL slug used to look up the client.'),
         max_length=settings.SLUG_LENGTH_TOTAL,
@@ -136,10 +160,12 @@ class Client(models.Model):
         if not self.slug:
             self.slug = generate_slug(self.name, self.__class__.objects.all())
 
-    def get_absolute_url(self):
-        """
-        Get the URL of the instance's detail view.
+    # The URLs below are memoized on the instance because they are
+    # rendered repeatedly and slugs do not change once generated.
 
+    @cached_property
+    def absolute_url(self):
+        """
         Returns:
             The absolute URL of the instance's detail view.
         """
@@ -148,7 +174,16 @@ class Client(models.Model):
             kwargs={'client_slug': self.slug},
         )
 
-    @property
+    def get_absolute_url(self):
+        """
+        Get the URL of the instance's detail view.
+
+        Returns:
+            The absolute URL of the instance's detail view.
+        """
+        return self.absolute_url
+
+    @cached_property
     def job_list_url(self):
         """
         Get the URL of the client's job list.
@@ -161,7 +196,7 @@ class Client(models.Model):
             kwargs={'client_slug': self.slug},
         )
 
-    @property
+    @cached_property
     def unapproved_time_record_list_url(self):
         """
         Get the URL of the client's unapproved time record list.
@@ -417,10 +452,9 @@ class ClientJob(models.Model):
 
             raise ValidationError({'name': message})
 
-    def get_absolute_url(self):
+    @cached_property
+    def absolute_url(self):
         """
-        Get the absolute URL of the instance's detail view.
-
         Returns:
             The absolute URL of the instance's detail view.
         """
@@ -429,6 +463,15 @@ class ClientJob(models.Model):
             kwargs={'client_slug': self.client.slug, 'job_slug': self.slug},
         )
 
+    def get_absolute_url(self):
+        """
+        Get the absolute URL of the instance's detail view.
+
+        Returns:
+            The absolute URL of the instance's detail view.
+        """
+        return self.absolute_url
+
 
 class Employee(models.Model):
     """
@@ -514,8 +557,11 @@ class Employee(models.Model):
         verbose_name=_('user'),
     )
 
+    objects = managers.EmployeeManager()
+
     class Meta:
         ordering = ('time_created',)
+        unique_together = ('client', 'employee_id')
         verbose_name = _('employee')
         verbose_name_plural = _('employees')
 
@@ -531,6 +577,7 @@ class Employee(models.Model):
             f'{self.user.name} (Hired by {self.staffing_agency})'
         )
 
+    @perf.timed('approve_employee')
     def approve(self, admin):
         """
         Approve the employee's request to join the client.
@@ -549,7 +596,7 @@ class Employee(models.Model):
         self.time_approved = timezone.now()
         self.save()
 
-    @property
+    @cached_property
     def approve_url(self):
         """
         Returns:
@@ -563,7 +610,7 @@ class Employee(models.Model):
             },
         )
 
-    @property
+    @cached_property
     def clock_in_url(self):
         """
         Returns:
@@ -577,7 +624,84 @@ class Employee(models.Model):
             },
         )
 
-    @property
+    def clock_in(self, job):
+        """
+        Clock the employee in by creating an open time record.
+
+        Args:
+            job:
+                The job the employee is working on.
+
+        Returns:
+            The created time record.
+
+        Raises:
+            ValidationError:
+                If the employee is already clocked in.
+        """
+        span = perf.Span(
+            'clock_in',
+            client_id=self.client_id,
+            employee=self.pk,
+        )
+
+        with span as fields, transaction.atomic():
+            # Lock the employee so that concurrent requests cannot both
+            # create an open record.
+            Employee.objects.select_for_update().filter(pk=self.pk).exists()
+
+            if self.is_clocked_in:
+                raise ValidationError(
+                    ugettext('You are already clocked in.'),
+                    code='clocked_in',
+                )
+
+            record = TimeRecord.objects.create(
+                employee=self,
+                job=job,
+                pay_rate=job.pay_rate,
+            )
+            fields['time_record'] = record.id
+
+            return record
+
+    def clock_out(self):
+        """
+        Clock the employee out by completing their open time record.
+
+        Returns:
+            The completed time record.
+
+        Raises:
+            ValidationError:
+                If the employee is not clocked in.
+        """
+        span = perf.Span(
+            'clock_out',
+            client_id=self.client_id,
+            employee=self.pk,
+        )
+
+        with span as fields, transaction.atomic():
+            # Lock the employee so that concurrent requests cannot both
+            # complete the open record.
+            Employee.objects.select_for_update().filter(pk=self.pk).exists()
+
+            try:
+                record = self.time_records.get(time_end=None)
+            except TimeRecord.DoesNotExist:
+                raise ValidationError(
+                    ugettext('You must be clocked in to clock out.'),
+                    code='clocked_out',
+                )
+
+            record.time_end = timezone.now()
+            record.save()
+            fields['time_record'] = record.id
+
+            return record
+
+    @cached_property
     def clock_out_url(self):
         """
         Returns:
@@ -601,7 +725,8 @@ class Employee(models.Model):
         """
         return self.time_records.filter(time_end=None).exists()
 
-    def get_absolute_url(self):
+    @cached_property
+    def absolute_url(self):
         """
         Returns:
             The URL of the view for an employee of a client
@@ -614,6 +739,13 @@ class Employee(models.Model):
             },
         )
 
+    def get_absolute_url(self):
+        """
+        Returns:
+            The URL of the view for an employee of a client
+        """
+        return self.absolute_url
+
     @property
     def total_time(self):
         """
@@ -628,7 +760,18 @@ class Employee(models.Model):
         """
         Save the employee and generate an ID for them if necessary.
         """
-        if not self.employee_id:
+        if self.employee_id:
+            super().save(*args, **kwargs)
+
+            return
+
+        with transaction.atomic():
+            # Lock the client so concurrent saves and roster imports
+            # cannot allocate the same employee ID.
+            Client.objects.select_for_update().filter(
+                pk=self.client_id,
+            ).exists()
+
             query = self.__class__.objects.filter(client=self.client)
             self.employee_id = id_utils.generate_unique_id(
                 settings.EMPLOYEE_ID_LENGTH,
@@ -636,7 +779,30 @@ class Employee(models.Model):
                 queryset_attr='employee_id',
             )
 
-        super().save(*args, **kwargs)
+            super().save(*args, **kwargs)
+
+    def unique_error_message(self, model_class, unique_check):
+        """
+        Get the error for a failed uniqueness check.
+
+        Args:
+            model_class:
+                The model the check was performed for.
+            unique_check:
+                The tuple of field names that must be unique together.
+
+        Returns:
+            A ``ValidationError`` describing the failed check.
+        """
+        if unique_check == ('client', 'employee_id'):
+            return ValidationError(
+                ugettext(
+                    'Employee IDs must be unique within a client company.'
+                ),
+                code='unique_together',
+            )
+
+        return super().unique_error_message(model_class, unique_check)
 
     def validate_unique(self, exclude=None):
         """
@@ -666,6 +832,335 @@ class Employee(models.Model):
             )
 
 
+class PayPeriod(models.Model):
+    """
+    A period of time that a client pays its employees for.
+
+    Once a period is closed, the totals of its time records are stored
+    as ``PayPeriodSummary`` instances and the time records it contains
+    can no longer be modified.
+    """
+    client = models.ForeignKey(
+        'vms.Client',
+        help_text=_('The client the pay period belongs to.'),
+        on_delete=models.CASCADE,
+        related_name='pay_periods',
+        related_query_name='pay_period',
+        verbose_name=_('client'),
+    )
+    closed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        blank=True,
+        help_text=_('The user who closed the pay period.'),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name='closed_pay_periods',
+        related_query_name='closed_pay_period',
+        verbose_name=_('closed by'),
+    )
+    end = models.DateTimeField(
+        help_text=_(
+            'The end of the pay period. Time records starting at or after '
+            'this time are not included.'
+        ),
+        verbose_name=_('end'),
+    )
+    id = models.UUIDField(
+        default=uuid.uuid4,
+        help_text=_('A unique identifier for the pay period.'),
+        primary_key=True,
+        unique=True,
+        verbose_name=_('ID'),
+    )
+    start = models.DateTimeField(
+        help_text=_(
+            'The start of the pay period. Time records starting at or after '
+            'this time are included.'
+        ),
+        verbose_name=_('start'),
+    )
+    time_closed = models.DateTimeField(
+        blank=True,
+        help_text=_('The time the pay period was closed.'),
+        null=True,
+        verbose_name=_('close time'),
+    )
+    time_created = models.DateTimeField(
+        auto_now_add=True,
+        help_text=_('The time the pay period was created.'),
+        verbose_name=_('creation time'),
+    )
+
+    objects = managers.PayPeriodManager()
+
+    class Meta:
+        ordering = ('client', '-start')
+        unique_together = ('client', 'start')
+        verbose_name = _('pay period')
+        verbose_name_plural = _('pay periods')
+
+    def __str__(self):
+        """
+        Get a user readable string describing the instance.
+
+        Returns:
+            A string containing the client and dates of the pay period.
+        """
+        return (
+            f'{self.client.name} pay period from {self.start:%m/%d/%Y} to '
+            f'{self.end:%m/%d/%Y}'
+        )
+
+    @property
+    def is_closed(self):
+        """
+        Returns:
+            A boolean indicating if the pay period has been closed.
+        """
+        return self.time_closed is not None
+
+    @property
+    def time_records(self):
+        """
+        Returns:
+            A queryset containing the time records that started during
+            the pay period.
+        """
+        return TimeRecord.objects.filter(
+            employee__client=self.client_id,
+            time_start__gte=self.start,
+            time_start__lt=self.end,
+        )
+
+    def clean(self):
+        """
+        Validate the pay period.
+
+        Raises:
+            ValidationError:
+                If the period ends before it starts or overlaps another
+                of the client's pay periods.
+        """
+        # Missing bounds are reported by the field validation.
+        if self.start is None or self.end is None:
+            return
+
+        if self.end <= self.start:
+            raise ValidationError({
+                'end': ugettext('The end must be after the start.'),
+            })
+
+        overlapping = PayPeriod.objects.filter(
+            client=self.client_id,
+            end__gt=self.start,
+            start__lt=self.end,
+        ).exclude(pk=self.pk)
+
+        if overlapping.exists():
+            raise ValidationError(
+                ugettext('Pay periods of a client may not overlap.'),
+            )
+
+    def close(self, user):
+        """
+        Close the pay period, storing the totals of its time records.
+
+        Args:
+            user:
+                The user closing the pay period.
+
+        Raises:
+            ValidationError:
+                If the period is already closed, has not ended yet, or
+                contains time records that have not been completed.
+        """
+        with transaction.atomic():
+            # Lock the period so it can only be closed once.
+            period = PayPeriod.objects.select_for_update().get(pk=self.pk)
+
+            period.validate_closable()
+
+            PayPeriodSummary.objects.bulk_create(
+                PayPeriodSummary(pay_period=self, **totals)
+                for totals in self.compute_totals()
+            )
+
+            self.closed_by = user
+            self.time_closed = timezone.now()
+            self.save()
+
+        logger.info('Closed pay period %r', self)
+
+    def compute_totals(self):
+        """
+        Compute the totals of the pay period's time records.
+
+        The records are aggregated in a single query, grouped by
+        employee, job, and pay rate, and the groups of each employee and
+        job are combined.
+
+        Returns:
+            A list of dictionaries containing the ``employee_id``,
+            ``job_id``, ``record_count``, ``total_time``, and
+            ``earnings`` for each employee and job combination.
+        """
+        rows = self.time_records.with_deltas().values(
+            'employee_id',
+            'job_id',
+            'pay_rate',
+        ).annotate(
+            record_count=models.Count('id'),
+            total_time=models.Sum('delta'),
+        ).order_by(
+            'employee_id',
+            'job_id',
+            'pay_rate',
+        )
+
+        totals = {}
+        for row in rows:
+            key = (row['employee_id'], row['job_id'])
+            entry = totals.setdefault(key, {
+                'earnings': decimal.Decimal('0'),
+                'employee_id': row['employee_id'],
+                'job_id': row['job_id'],
+                'record_count': 0,
+                'total_time': datetime.timedelta(0),
+            })
+
+            hours = decimal.Decimal(row['total_time'].total_seconds()) / 3600
+            entry['earnings'] += hours * row['pay_rate']
+            entry['record_count'] += row['record_count']
+            entry['total_time'] += row['total_time']
+
+        for entry in totals.values():
+            entry['earnings'] = entry['earnings'].quantize(
+                decimal.Decimal('0.01'),
+            )
+
+        return list(totals.values())
+
+    def validate_closable(self):
+        """
+        Ensure the pay period can be closed.
+
+        Raises:
+            ValidationError:
+                If the period is already closed, has not ended yet, or
+                contains time records that have not been completed.
+        """
+        if self.is_closed:
+            raise ValidationError(
+                ugettext('This pay period is already closed.'),
+            )
+
+        if self.end > timezone.now():
+            raise ValidationError(
+                ugettext('Pay periods can only be closed once they end.'),
+            )
+
+        if self.time_records.filter(time_end=None).exists():
+            raise ValidationError(
+                ugettext(
+                    'All time records in the pay period must be completed '
+                    'before it is closed.'
+                ),
+            )
+
+    def get_absolute_url(self):
+        """
+        Returns:
+            The URL of the pay period's detail view.
+        """
+        return reverse(
+            'vms:pay-period-detail',
+            kwargs={
+                'client_slug': self.client.slug,
+                'pay_period_id': self.id,
+            },
+        )
+
+    def get_totals(self):
+        """
+        Get the totals of the pay period's time records.
+
+        Returns:
+            The stored summaries of a closed pay period, or the totals
+            computed from the time records of an open period. Each item
+            is a dictionary as returned by ``compute_totals``.
+        """
+        if self.is_closed:
+            return list(self.summaries.values(
+                'earnings',
+                'employee_id',
+                'job_id',
+                'record_count',
+                'total_time',
+            ))
+
+        return self.compute_totals()
+
+
+class PayPeriodSummary(models.Model):
+    """
+    The totals of an employee's time records for a job during a closed
+    pay period.
+    """
+    earnings = models.DecimalField(
+        decimal_places=2,
+        help_text=_('The total earnings for the time worked.'),
+        max_digits=13,
+        verbose_name=_('earnings'),
+    )
+    employee = models.ForeignKey(
+        'vms.Employee',
+        help_text=_('The employee whose time records are summarized.'),
+        on_delete=models.CASCADE,
+        related_name='pay_period_summaries',
+        related_query_name='pay_period_summary',
+        verbose_name=_('employee'),
+    )
+    job = models.ForeignKey(
+        'vms.ClientJob',
+        help_text=_('The job the summarized time records were worked on.'),
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name='pay_period_summaries',
+        related_query_name='pay_period_summary',
+        verbose_name=_('client job'),
+    )
+    pay_period = models.ForeignKey(
+        'vms.PayPeriod',
+        help_text=_('The pay period that the summary belongs to.'),
+        on_delete=models.CASCADE,
+        related_name='summaries',
+        related_query_name='summary',
+        verbose_name=_('pay period'),
+    )
+    record_count = models.PositiveIntegerField(
+        help_text=_('The number of time records summarized.'),
+        verbose_name=_('record count'),
+    )
+    total_time = models.DurationField(
+        help_text=_('The total time worked.'),
+        verbose_name=_('total time'),
+    )
+
+    class Meta:
+        ordering = ('pay_period', 'employee', 'job')
+        verbose_name = _('pay period summary')
+        verbose_name_plural = _('pay period summaries')
+
+    def __str__(self):
+        """
+        Get a user readable string describing the instance.
+
+        Returns:
+            A string containing the pay period and employee.
+        """
+        return f'{self.pay_period} summary for {self.employee}'
+
+
 class StaffingAgency(models.Model):
     """
     A company that provides employees to clients.
@@ -674,6 +1169,17 @@ class StaffingAgency(models.Model):
         help_text=_('The primary email address for the agency.'),
         verbose_name=_('primary email address'),
     )
+    markup_percent = models.DecimalField(
+        decimal_places=2,
+        default=0,
+        help_text=_(
+            'The percentage added to the pay of employees when billing '
+            'clients for their time.'
+        ),
+        max_digits=5,
+        validators=[MinValueValidator(0)],
+        verbose_name=_('markup percentage'),
+    )
     name = models.CharField(
         help_text=_('The name of the staffing agency.'),
         max_length=100,
@@ -851,6 +1357,8 @@ class StaffingAgencyEmployee(models.Model):
         verbose_name=_('user'),
     )
 
+    objects = managers.StaffingAgencyEmployeeManager()
+
     class Meta:
         unique_together = ('agency', 'user')
         verbose_name = _('staffing agency employee')
@@ -868,6 +1376,7 @@ class StaffingAgencyEmployee(models.Model):
             f"{self.user.name} contracted by {self.agency.name}"
         )
 
+    @perf.timed('approve_staffing_agency_employee')
     def approve(self, admin):
         """
         Mark the staffing agency employee as approved.
@@ -949,12 +1458,44 @@ class TimeRecord(models.Model):
         help_text=_('The start time of the work period.'),
         verbose_name=_('start time'),
     )
+    time_updated = models.DateTimeField(
+        auto_now=True,
+        help_text=_('The last time the time record was modified.'),
+        verbose_name=_('last update time'),
+    )
 
     # Use our custom manager
     objects = managers.TimeRecordManager()
 
     class Meta:
-        ordering = ('time_start',)
+        indexes = [
+            # Used to find open records. Partial indexes are not
+            # supported before Django 2.2, so closed records are also
+            # indexed.
+            models.Index(
+                fields=['time_end', 'employee'],
+                name='vms_timerec_open_idx',
+            ),
+            # Used to sweep each employee's records in order when
+            # searching for overlaps.
+            models.Index(
+                fields=['employee', 'time_start'],
+                name='vms_timerec_emp_start_idx',
+            ),
+            # Used for keyset pagination in the API.
+            models.Index(
+                fields=['time_start', 'id'],
+                name='vms_timerec_start_id_idx',
+            ),
+            # Used to find records changed since a client's last sync.
+            models.Index(
+                fields=['time_updated'],
+                name='vms_timerec_updated_idx',
+            ),
+        ]
+        # Records starting at the same time are ordered by ID so the
+        # order is deterministic and matches the API's pagination.
+        ordering = ('time_start', 'id')
         verbose_name = _('time record')
         verbose_name_plural = _('time records')
 
@@ -969,8 +1510,8 @@ class TimeRecord(models.Model):
         return (
             f'TimeRecord('
             f'id={self.id!r}, '
-            f'job_id={self.job.id if self.job else None!r}, '
-            f'employee_id={self.employee.id!r}, '
+            f'job_id={self.job_id!r}, '
+            f'employee_id={self.employee_id!r}, '
             f'time_start={self.time_start!r}, '
             f'time_end={self.time_end!r})'
         )
@@ -998,6 +1539,139 @@ class TimeRecord(models.Model):
                 )
         return f'Time Record starting at {st:%I:%M %p} on {st:%m/%d/%Y}.'
 
+    def clean(self):
+        """
+        Validate the time record.
+
+        Raises:
+            ValidationError:
+                If the record ends before it starts or overlaps another
+                of the employee's records.
+        """
+        if self.time_end and self.time_end < self.time_start:
+            raise ValidationError({
+                'time_end': ugettext(
+                    'The end time must be after the start time.',
+                ),
+            })
+
+        if self.employee_id is None:
+            return
+
+        self.validate_unlocked()
+
+        overlapping = TimeRecord.objects.overlapping(
+            self.employee_id,
+            self.time_start,
+            self.time_end,
+        ).exclude(pk=self.pk).order_by('time_start').first()
+
+        if overlapping:
+            raise ValidationError(
+                ugettext(
+                    'This time record overlaps another of the employee\'s '
+                    'time records: %(record)s'
+                ),
+                code='overlap',
+                params={'record': overlapping},
+            )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Create an instance from a database row, remembering the loaded
+        end time so that saves closing the record can be detected.
+        """
+        instance = super().from_db(db, field_names, values)
+
+        if 'time_end' in field_names:
+            instance._loaded_time_end = instance.time_end
+
+        if 'time_start' in field_names:
+            instance._loaded_time_start = instance.time_start
+
+        return instance
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete the time record.
+
+        Raises:
+            ValidationError:
+                If the record belongs to a closed pay period.
+        """
+        self.validate_unlocked()
+
+        return super().delete(*args, **kwargs)
+
+    def get_client_id(self):
+        """
+        Get the ID of the client the record's employee works for.
+
+        If the employee is not already loaded, only their client's ID is
+        fetched, and it is remembered for later calls.
+
+        Returns:
+            The ID of the client owning the time record.
+        """
+        if TimeRecord.employee.is_cached(self):
+            return self.employee.client_id
+
+        cached = getattr(self, '_client_id', None)
+        if cached is None or cached[0] != self.employee_id:
+            client_id = Employee.objects.values_list(
+                'client_id',
+                flat=True,
+            ).get(pk=self.employee_id)
+            self._client_id = (self.employee_id, client_id)
+
+        return self._client_id[1]
+
+    def save(self, *args, **kwargs):
+        """
+        Save the time record.
+
+        The record is saved in the same transaction as the change log
+        entry added by the ``post_save`` signal, so neither is stored
+        without the other.
+
+        Raises:
+            ValidationError:
+                If the record belongs, or belonged before being
+                modified, to a closed pay period.
+        """
+        self.validate_unlocked()
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+    def validate_unlocked(self):
+        """
+        Ensure the time record does not belong to a closed pay period.
+
+        Both the current start time and the start time the record was
+        loaded with are checked, so records cannot be moved into or out
+        of a closed period.
+
+        Raises:
+            ValidationError:
+                If the record belongs to a closed pay period.
+        """
+        times = {self.time_start, getattr(self, '_loaded_time_start', None)}
+        times.discard(None)
+
+        locked = PayPeriod.objects.closed().containing(*times).filter(
+            client__employee=self.employee_id,
+        )
+
+        if times and locked.exists():
+            raise ValidationError(
+                ugettext(
+                    'Time records in closed pay periods cannot be modified.'
+                ),
+                code='locked',
+            )
+
     @property
     def approval_url(self):
         """
@@ -1094,3 +1768,158 @@ class TimeRecordApproval(models.Model):
             A string containing the name of the approved time record.
         """
         return f'Approval for {self.time_record}'
+
+    def clean(self):
+        """
+        Validate the approval.
+
+        Raises:
+            ValidationError:
+                If the approved record belongs to a closed pay period.
+        """
+        if self.time_record_id is not None:
+            self.time_record.validate_unlocked()
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete the approval.
+
+        Raises:
+            ValidationError:
+                If the approved record belongs to a closed pay period.
+        """
+        self.time_record.validate_unlocked()
+
+        return super().delete(*args, **kwargs)
+
+    def save(self, *args, **kwargs):
+        """
+        Save the approval.
+
+        Like time records, the approval is saved in the same transaction
+        as its change log entry.
+
+        Raises:
+            ValidationError:
+                If the approved record belongs to a closed pay period.
+        """
+        self.time_record.validate_unlocked()
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class TimeRecordChange(models.Model):
+    """
+    An entry in the change log of time records.
+
+    Entries are ordered by their ID, which increases with each change
+    and is allocated in commit order, so downstream systems can sync by
+    requesting the changes following the last entry they processed
+    without missing entries from transactions committed later. The log
+    references time records by ID rather than foreign key so that
+    entries for deleted records are retained.
+    """
+    ACTION_APPROVED = 'approved'
+    ACTION_CREATED = 'created'
+    ACTION_DELETED = 'deleted'
+    ACTION_UNAPPROVED = 'unapproved'
+    ACTION_UPDATED = 'updated'
+
+    ACTION_CHOICES = (
+        (ACTION_APPROVED, _('Approved')),
+        (ACTION_CREATED, _('Created')),
+        (ACTION_DELETED, _('Deleted')),
+        (ACTION_UNAPPROVED, _('Unapproved')),
+        (ACTION_UPDATED, _('Updated')),
+    )
+
+    action = models.CharField(
+        choices=ACTION_CHOICES,
+        help_text=_('The type of change made to the time record.'),
+        max_length=16,
+        verbose_name=_('action'),
+    )
+    client_id = models.PositiveIntegerField(
+        help_text=_('The ID of the client the time record belongs to.'),
+        verbose_name=_('client ID'),
+    )
+    employee_pk = models.PositiveIntegerField(
+        help_text=_('The primary key of the employee who owns the record.'),
+        verbose_name=_('employee primary key'),
+    )
+    id = models.BigAutoField(
+        help_text=_('The position of the change in the change log.'),
+        primary_key=True,
+        verbose_name=_('ID'),
+    )
+    time_created = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+        help_text=_('The time the change was made.'),
+        verbose_name=_('creation time'),
+    )
+    time_record_id = models.UUIDField(
+        db_index=True,
+        help_text=_('The ID of the time record that was changed.'),
+        verbose_name=_('time record ID'),
+    )
+
+    objects = managers.TimeRecordChangeManager()
+
+    class Meta:
+        indexes = [
+            # Used to find the latest change to a client's records.
+            models.Index(
+                fields=['client_id', 'id'],
+                name='vms_timerecchg_client_idx',
+            ),
+        ]
+        ordering = ('id',)
+        verbose_name = _('time record change')
+        verbose_name_plural = _('time record changes')
+
+    def __repr__(self):
+        """
+        Get a string representation of the instance.
+
+        Returns:
+            A string containing the information required to reconstruct
+            the change.
+        """
+        return (
+            f'TimeRecordChange('
+            f'id={self.id!r}, '
+            f'action={self.action!r}, '
+            f'time_record_id={self.time_record_id!r})'
+        )
+
+    def __str__(self):
+        """
+        Get a user readable string describing the instance.
+
+        Returns:
+            A string containing the action and changed time record.
+        """
+        return f'{self.get_action_display()} time record {self.time_record_id}'
+
+    @classmethod
+    def log(cls, time_record, action):
+        """
+        Record a change to a time record.
+
+        Args:
+            time_record:
+                The time record that was changed.
+            action:
+                The type of change that was made.
+
+        Returns:
+            The created change log entry.
+        """
+        return cls.objects.create(
+            action=action,
+            client_id=time_record.get_client_id(),
+            employee_pk=time_record.employee_id,
+            time_record_id=time_record.id,
+        )
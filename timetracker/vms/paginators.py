@@ -0,0 +1,60 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that estimates the size of large unfiltered tables.
+
+    Counting every row of a large table requires a full scan on
+    PostgreSQL. When an unfiltered queryset is paginated, the planner's
+    row estimate is used instead if it is large enough that an exact
+    count is not meaningful. Filtered querysets and other databases
+    are counted exactly.
+    """
+    # Tables estimated to have fewer rows than this are counted exactly.
+    estimate_threshold = 100000
+
+    @cached_property
+    def count(self):
+        """
+        Returns:
+            The number of objects, which is estimated for large
+            unfiltered tables.
+        """
+        estimate = self.estimate_count()
+
+        if estimate is not None and estimate >= self.estimate_threshold:
+            return estimate
+
+        return super().count
+
+    def estimate_count(self):
+        """
+        Get the planner's estimate of the number of rows in the table.
+
+        Returns:
+            The estimated number of rows, or ``None`` if the objects are
+            not an unfiltered queryset on PostgreSQL.
+        """
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet) or queryset.query.where:
+            return None
+
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE relname = %s',
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+
+        return int(row[0])
@@ -0,0 +1,321 @@
+import datetime
+from array import array
+from collections import namedtuple
+
+from django.conf import settings
+from django.utils import timezone
+
+
+SECONDS_PER_HOUR = 60 * 60
+
+# The Unix epoch fell on a Thursday.
+EPOCH_WEEKDAY = 3
+EPOCH_DATE = datetime.date(1970, 1, 1)
+
+
+PayDay = namedtuple(
+    'PayDay',
+    ('date', 'worked', 'regular', 'overtime', 'billable'),
+)
+PayDay.__doc__ = """
+The time worked on a single day, in seconds.
+
+Regular and overtime always add up to the time worked. Billable time is
+the sum of the rounded durations of the records starting that day.
+"""
+
+PayWeek = namedtuple(
+    'PayWeek',
+    ('start', 'worked', 'regular', 'overtime', 'billable'),
+)
+PayWeek.__doc__ = """
+The time worked during a week beginning on ``start``, in seconds.
+"""
+
+PayHours = namedtuple('PayHours', ('days', 'weeks'))
+PayHours.__doc__ = """
+The days and weeks with time worked, in chronological order.
+"""
+
+
+def load_intervals(time_records):
+    """
+    Load the start and end times of completed time records into arrays.
+
+    Only the two timestamps of each record are fetched, and they are
+    stored as floats in contiguous arrays rather than as model
+    instances.
+
+    Args:
+        time_records:
+            A queryset of time records. Records that have not ended are
+            ignored.
+
+    Returns:
+        A tuple of two ``array.array`` instances containing the start
+        and end times of each record in seconds since the epoch, sorted
+        by start time.
+    """
+    starts = array('d')
+    ends = array('d')
+
+    rows = time_records.exclude(
+        time_end=None,
+    ).order_by(
+        'time_start',
+    ).values_list(
+        'time_start',
+        'time_end',
+    )
+
+    for time_start, time_end in rows.iterator():
+        starts.append(time_start.timestamp())
+        ends.append(time_end.timestamp())
+
+    return starts, ends
+
+
+def _day_date(day):
+    """
+    Args:
+        day:
+            The number of days since the epoch.
+
+    Returns:
+        The corresponding ``datetime.date``.
+    """
+    return EPOCH_DATE + datetime.timedelta(days=day)
+
+
+def _local_day(seconds, tz):
+    """
+    Args:
+        seconds:
+            A time in seconds since the epoch.
+        tz:
+            The time zone that days are determined in.
+
+    Returns:
+        The number of days between the epoch and the local date of the
+        time.
+    """
+    local_date = datetime.datetime.fromtimestamp(seconds, tz).date()
+
+    return (local_date - EPOCH_DATE).days
+
+
+def _day_start(day, tz):
+    """
+    Args:
+        day:
+            The number of days since the epoch.
+        tz:
+            The time zone that days are determined in.
+
+    Returns:
+        The time in seconds since the epoch at which the local day
+        begins. If midnight is skipped by a daylight saving time
+        transition, the day begins at the transition.
+    """
+    midnight = datetime.datetime.combine(_day_date(day), datetime.time())
+
+    return timezone.make_aware(midnight, tz, is_dst=False).timestamp()
+
+
+def compute_pay_hours(
+        starts,
+        ends,
+        daily_overtime_hours=None,
+        weekly_overtime_hours=None,
+        block_size=None,
+        week_start=0,
+        tz=None):
+    """
+    Split time worked into regular and overtime hours per day and week.
+
+    The intervals are processed in a single scalar pass, one Python
+    loop iteration per record, that accumulates time into per-day totals
+    and splits intervals that cross midnight between the days they span.
+    No model instances are created, but the accumulation is not
+    vectorized. Durations are measured in elapsed time, so
+    shifts spanning a daylight saving time transition are paid for the
+    time actually worked, and local time is only used to determine which
+    day each portion of a shift falls on. Daily overtime is the time
+    worked past the daily limit on each day. Weekly overtime is the
+    regular time worked past the weekly limit, assigned to the days on
+    which the limit was exceeded, so time is never counted as overtime
+    twice.
+
+    Args:
+        starts:
+            A sequence of start times in seconds since the epoch, such
+            as the one returned by ``load_intervals``.
+        ends:
+            A sequence of the corresponding end times.
+        daily_overtime_hours:
+            The number of hours per day after which time is overtime.
+            Defaults to the ``VMS_DAILY_OVERTIME_HOURS`` setting. Zero
+            disables daily overtime.
+        weekly_overtime_hours:
+            The number of hours per week after which time is overtime.
+            Defaults to the ``VMS_WEEKLY_OVERTIME_HOURS`` setting. Zero
+            disables weekly overtime.
+        block_size:
+            The block size, in seconds, that each record's duration is
+            rounded to for billing. Defaults to the
+            ``VMS_ROUNDING_BLOCK_MINUTES`` setting.
+        week_start:
+            The day that weeks begin on, where Monday is 0 and Sunday is
+            6. Defaults to Monday.
+        tz:
+            The time zone that days are determined in. Defaults to the
+            current time zone.
+
+    Returns:
+        A ``PayHours`` instance containing the days and weeks with time
+        worked.
+    """
+    if daily_overtime_hours is None:
+        daily_overtime_hours = settings.VMS_DAILY_OVERTIME_HOURS
+    if weekly_overtime_hours is None:
+        weekly_overtime_hours = settings.VMS_WEEKLY_OVERTIME_HOURS
+    if block_size is None:
+        block_size = settings.VMS_ROUNDING_BLOCK_MINUTES * 60
+
+    daily_limit = daily_overtime_hours * SECONDS_PER_HOUR
+    weekly_limit = weekly_overtime_hours * SECONDS_PER_HOUR
+    half_block = block_size / 2
+
+    tz = tz or timezone.get_current_timezone()
+
+    worked = {}
+    billable = {}
+
+    # Days vary in length around daylight saving time transitions, so
+    # the start of each local day is computed once and cached. Records
+    # are usually sorted, so most fall on the day of the previous one.
+    day_starts = {}
+
+    def day_start(day):
+        if day not in day_starts:
+            day_starts[day] = _day_start(day, tz)
+        return day_starts[day]
+
+    day = _local_day(starts[0], tz) if starts else 0
+    current_start = day_start(day)
+    current_end = day_start(day + 1)
+
+    for start, end in zip(starts, ends):
+        if current_end <= start < day_start(day + 2):
+            day += 1
+            current_start, current_end = current_end, day_start(day + 1)
+        elif not current_start <= start < current_end:
+            day = _local_day(start, tz)
+            current_start = day_start(day)
+            current_end = day_start(day + 1)
+
+        # Rounding is applied to each record as a whole and billed on
+        # the day it started.
+        duration = end - start + half_block
+        billable[day] = (
+            billable.get(day, 0) + duration - duration % block_size
+        )
+
+        segment_day = day
+        boundary = current_end
+        while start < end:
+            segment_end = end if end < boundary else boundary
+            worked[segment_day] = (
+                worked.get(segment_day, 0) + segment_end - start
+            )
+
+            start = segment_end
+            segment_day += 1
+            boundary = day_start(segment_day + 1)
+
+    days = []
+    weeks = []
+    week = None
+    week_regular = 0
+
+    for day in sorted(worked.keys() | billable.keys()):
+        day_worked = worked.get(day, 0)
+        overtime = 0
+
+        if daily_limit and day_worked > daily_limit:
+            overtime = day_worked - daily_limit
+
+        week_day = day - (day + EPOCH_WEEKDAY - week_start) % 7
+        if week is None or week[0] != week_day:
+            week = [week_day, 0, 0, 0, 0]
+            weeks.append(week)
+            week_regular = 0
+
+        regular = day_worked - overtime
+        if weekly_limit and week_regular + regular > weekly_limit:
+            excess = week_regular + regular - weekly_limit
+            regular -= excess
+            overtime += excess
+        week_regular += regular
+
+        day_billable = billable.get(day, 0)
+        days.append(
+            PayDay(_day_date(day), day_worked, regular, overtime, day_billable)
+        )
+
+        week[1] += day_worked
+        week[2] += regular
+        week[3] += overtime
+        week[4] += day_billable
+
+    return PayHours(
+        days=days,
+        weeks=[
+            PayWeek(_day_date(week_day), *totals)
+            for week_day, *totals in weeks
+        ],
+    )
+
+
+def employee_pay_hours(employee, time_start, time_end, tz=None, **kwargs):
+    """
+    Compute the regular and overtime hours of an employee for a period.
+
+    Billable time is rounded to the rounding block of the employee's
+    client, as in ``TimeRecordQuerySet.total_time``.
+
+    Args:
+        employee:
+            The employee whose time records are used.
+        time_start:
+            The start of the period. Records starting at or after this
+            time are included.
+        time_end:
+            The end of the period. Records starting before this time are
+            included.
+        tz:
+            The time zone that days are determined in. Defaults to the
+            current time zone.
+        **kwargs:
+            Additional arguments passed to ``compute_pay_hours``. If a
+            ``block_size`` is not provided, the client's rounding block
+            is used.
+
+    Returns:
+        A ``PayHours`` instance containing the employee's days and
+        weeks with time worked.
+    """
+    starts, ends = load_intervals(
+        employee.time_records.filter(
+            time_start__gte=time_start,
+            time_start__lt=time_end,
+        ),
+    )
+
+    block_minutes = (
+        employee.client.rounding_block_minutes or
+        settings.VMS_ROUNDING_BLOCK_MINUTES
+    )
+    kwargs.setdefault('block_size', block_minutes * 60)
+
+    return compute_pay_hours(starts, ends, tz=tz, **kwargs)
@@ -0,0 +1,186 @@
+import functools
+import json
+import logging
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+
+
+logger = logging.getLogger(__name__)
+
+
+_state = threading.local()
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Format log records as single line JSON objects.
+
+    Records carrying a ``span`` attribute, as emitted by ``Span``, have
+    its fields merged into the object.
+    """
+
+    def format(self, record):
+        """
+        Args:
+            record:
+                The log record to format.
+
+        Returns:
+            The record as a JSON string.
+        """
+        data = {
+            'logger': record.name,
+            'level': record.levelname,
+            'message': record.getMessage(),
+            'time': record.created,
+        }
+        data.update(getattr(record, 'span', {}))
+
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+
+        return json.dumps(data, default=str)
+
+
+class _QueryCounter:
+    """
+    Database execution wrapper counting the queries executed.
+    """
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+
+        return execute(sql, params, many, context)
+
+
+def _is_sampled():
+    """
+    Determine if a new top level span is recorded.
+
+    Nested spans follow the decision made for the outermost span, so a
+    sampled operation is always recorded in full.
+
+    Returns:
+        A boolean indicating if the span should be recorded.
+    """
+    depth = getattr(_state, 'depth', 0)
+    if depth:
+        return _state.sampled
+
+    rate = settings.VMS_PERF_SAMPLE_RATE
+
+    return rate >= 1 or (rate > 0 and random.random() < rate)
+
+
+class Span:
+    """
+    Time an operation and log its duration and query count.
+
+    A sampled span emits a single record to the ``vms.perf`` logger
+    once the operation completes, containing the span's ``name``, its
+    ``duration_ms``, the number of ``queries`` it executed on the
+    default database, its ``status``, and any additional fields. Spans
+    that are not sampled only cost a random number draw.
+
+    Spans can be used as context managers, in which case the fields can
+    be extended within the block::
+
+        with perf.Span('clock_in', client_id=client.id) as fields:
+            record = ...
+            fields['time_record'] = record.id
+
+    or as function decorators through ``timed``.
+    """
+
+    def __init__(self, name, **fields):
+        """
+        Create a span.
+
+        Args:
+            name:
+                The name identifying the operation.
+            **fields:
+                Additional JSON serializable values to log. These
+                should be identifiers rather than full objects.
+        """
+        self.name = name
+        self.fields = fields
+
+        self._counter = None
+        self._sampled = False
+        self._start = None
+        self._wrapper = None
+
+    def __enter__(self):
+        """
+        Start the span.
+
+        Returns:
+            The dictionary of additional fields to log.
+        """
+        self._sampled = _is_sampled()
+
+        _state.depth = getattr(_state, 'depth', 0) + 1
+        if _state.depth == 1:
+            _state.sampled = self._sampled
+
+        if self._sampled:
+            self._counter = _QueryCounter()
+            self._wrapper = connection.execute_wrapper(self._counter)
+            self._wrapper.__enter__()
+            self._start = time.perf_counter()
+
+        return self.fields
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Finish the span, logging it if it was sampled.
+        """
+        _state.depth -= 1
+
+        if not self._sampled:
+            return
+
+        duration = time.perf_counter() - self._start
+        self._wrapper.__exit__(exc_type, exc_value, traceback)
+
+        data = dict(self.fields)
+        data.update({
+            'duration_ms': round(duration * 1000, 3),
+            'name': self.name,
+            'queries': self._counter.count,
+            'status': 'error' if exc_type else 'ok',
+        })
+        if exc_type:
+            data['error'] = exc_type.__name__
+
+        logger.info(self.name, extra={'span': data})
+
+
+def timed(name):
+    """
+    Decorate a function so each call is timed in a span.
+
+    Args:
+        name:
+            The name of the span.
+
+    Returns:
+        A decorator for the function to time.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,296 @@
+import csv
+import datetime
+import decimal
+import itertools
+from collections import OrderedDict, namedtuple
+
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate, TruncMonth, TruncWeek
+from django.utils.translation import ugettext_lazy as _
+
+
+def _to_date(value):
+    """
+    Args:
+        value:
+            A date or datetime.
+
+    Returns:
+        The date of the provided value.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.date()
+
+    return value
+
+
+def _hours(duration):
+    """
+    Args:
+        duration:
+            A ``datetime.timedelta``.
+
+    Returns:
+        The number of hours in the duration as a ``decimal.Decimal``.
+    """
+    return decimal.Decimal(duration.total_seconds()) / 3600
+
+
+Grouping = namedtuple('Grouping', ('title', 'key', 'label', 'clean_label'))
+Grouping.__doc__ = """
+A way of grouping time records in a report.
+
+``key`` and ``label`` are expressions identifying and describing each
+group. ``clean_label`` is an optional function applied to each label.
+"""
+
+
+GROUPINGS = OrderedDict([
+    ('job', Grouping(_('Job'), F('job_id'), F('job__name'), None)),
+    (
+        'employee',
+        Grouping(
+            _('Employee'),
+            F('employee_id'),
+            F('employee__user__name'),
+            None,
+        ),
+    ),
+    (
+        'agency',
+        Grouping(
+            _('Staffing Agency'),
+            F('employee__staffing_agency_id'),
+            F('employee__staffing_agency__name'),
+            None,
+        ),
+    ),
+    (
+        'day',
+        Grouping(
+            _('Day'),
+            TruncDate('time_start'),
+            TruncDate('time_start'),
+            None,
+        ),
+    ),
+    (
+        'week',
+        Grouping(
+            _('Week'),
+            TruncWeek('time_start'),
+            TruncWeek('time_start'),
+            _to_date,
+        ),
+    ),
+])
+
+DEFAULT_GROUPING = 'job'
+
+
+def summarize_time_records(time_records, grouping=DEFAULT_GROUPING):
+    """
+    Compute the hours and earnings of time records in groups.
+
+    The records are aggregated in a single query grouped by the
+    requested grouping and pay rate, and the rows of each group are
+    combined, so the cost does not depend on the number of records
+    loaded.
+
+    Args:
+        time_records:
+            A queryset of the time records to summarize. Records that
+            have not ended are ignored.
+        grouping:
+            The name of a grouping in ``GROUPINGS``.
+
+    Returns:
+        A list of dictionaries ordered by group, each containing the
+        group's ``key`` and ``label`` along with its ``record_count``,
+        ``total_time``, ``billable_time`` rounded per record, and
+        ``earnings`` for the billable time, matching ``billing_rows``.
+
+    Raises:
+        ValueError:
+            If the grouping does not exist.
+    """
+    if grouping not in GROUPINGS:
+        raise ValueError(f'Unknown grouping {grouping!r}.')
+
+    group_by = GROUPINGS[grouping]
+
+    rows = time_records.with_deltas(rounded=True).values(
+        'pay_rate',
+        key=group_by.key,
+        label=group_by.label,
+    ).annotate(
+        billable_time=Sum('rounded_delta'),
+        record_count=Count('id'),
+        total_time=Sum('delta'),
+    ).order_by(
+        'key',
+        'pay_rate',
+    )
+
+    groups = OrderedDict()
+    for row in rows:
+        label = row['label']
+        if group_by.clean_label:
+            label = group_by.clean_label(label)
+
+        group = groups.setdefault(row['key'], {
+            'billable_time': datetime.timedelta(0),
+            'earnings': decimal.Decimal('0'),
+            'key': row['key'],
+            'label': label,
+            'record_count': 0,
+            'total_time': datetime.timedelta(0),
+        })
+
+        group['billable_time'] += row['billable_time']
+        group['earnings'] += _hours(row['billable_time']) * row['pay_rate']
+        group['record_count'] += row['record_count']
+        group['total_time'] += row['total_time']
+
+    for group in groups.values():
+        group['earnings'] = group['earnings'].quantize(decimal.Decimal('0.01'))
+
+    return list(groups.values())
+
+
+BILLING_HEADER = (
+    'Client',
+    'Job',
+    'Period Start',
+    'Records',
+    'Hours Worked',
+    'Billable Hours',
+    'Pay',
+    'Markup (%)',
+    'Amount Billed',
+)
+
+BILLING_PERIODS = OrderedDict([
+    ('day', TruncDate('time_start')),
+    ('week', TruncWeek('time_start')),
+    ('month', TruncMonth('time_start')),
+])
+
+DEFAULT_BILLING_PERIOD = 'week'
+
+
+def billing_rows(
+        time_records,
+        markup_percent,
+        period=DEFAULT_BILLING_PERIOD):
+    """
+    Generate the rows of a billing report for time records.
+
+    The records are aggregated in a single query grouped by client,
+    job, period, and pay rate. Since the results are ordered by group,
+    the rows of each group are combined as they are read, so large
+    reports are never held in memory.
+
+    Employees are billed for the time worked on each record rounded to
+    the rounding block of the client.
+
+    Args:
+        time_records:
+            A queryset of the time records to bill for. Records that
+            have not ended are ignored.
+        markup_percent:
+            The percentage added to the pay of the employees.
+        period:
+            The name of a period in ``BILLING_PERIODS``.
+
+    Yields:
+        A tuple for each client, job, and period, containing the values
+        described by ``BILLING_HEADER``.
+
+    Raises:
+        ValueError:
+            If the period does not exist.
+    """
+    if period not in BILLING_PERIODS:
+        raise ValueError(f'Unknown period {period!r}.')
+
+    cents = decimal.Decimal('0.01')
+    multiplier = 1 + decimal.Decimal(markup_percent) / 100
+
+    rows = time_records.with_deltas(rounded=True).values(
+        'employee__client_id',
+        'employee__client__name',
+        'job_id',
+        'job__name',
+        'pay_rate',
+        period_start=BILLING_PERIODS[period],
+    ).annotate(
+        billable_time=Sum('rounded_delta'),
+        record_count=Count('id'),
+        total_time=Sum('delta'),
+    ).order_by(
+        'employee__client_id',
+        'job_id',
+        'period_start',
+        'pay_rate',
+    )
+
+    groups = itertools.groupby(
+        rows.iterator(),
+        key=lambda row: (
+            row['employee__client_id'],
+            row['job_id'],
+            row['period_start'],
+        ),
+    )
+
+    for (_client_id, _job_id, period_start), group in groups:
+        group = list(group)
+        first = group[0]
+
+        pay = sum(
+            _hours(row['billable_time']) * row['pay_rate'] for row in group
+        )
+
+        yield (
+            first['employee__client__name'],
+            first['job__name'] or '',
+            _to_date(period_start).isoformat(),
+            sum(row['record_count'] for row in group),
+            sum(_hours(row['total_time']) for row in group).quantize(cents),
+            sum(_hours(row['billable_time']) for row in group).quantize(cents),
+            pay.quantize(cents),
+            markup_percent,
+            (pay * multiplier).quantize(cents),
+        )
+
+
+class _Echo:
+    """
+    File-like object that returns what is written to it rather than
+    storing it.
+    """
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(header, rows):
+    """
+    Format rows as CSV one line at a time.
+
+    Args:
+        header:
+            The column names.
+        rows:
+            An iterable of the rows to format.
+
+    Yields:
+        Each line of the CSV file.
+    """
+    writer = csv.writer(_Echo())
+
+    yield writer.writerow(header)
+
+    for row in rows:
+        yield writer.writerow(row)
@@ -0,0 +1,315 @@
+import csv
+import io
+from collections import namedtuple
+
+import pytz
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from vms import cache, id_utils, models
+
+
+REQUIRED_COLUMNS = ('name', 'username')
+
+
+RosterRow = namedtuple('RosterRow', ('line', 'name', 'username', 'timezone'))
+RosterRow.__doc__ = """
+A single worker listed in a roster file.
+
+``line`` is the line of the file the worker was listed on, and
+``timezone`` is empty if the roster does not specify one.
+"""
+
+RosterError = namedtuple('RosterError', ('line', 'message'))
+RosterError.__doc__ = """
+A problem with a roster that prevents it from being imported.
+
+``line`` is ``None`` if the problem is not caused by a single row.
+"""
+
+RosterResult = namedtuple('RosterResult', ('employees', 'errors'))
+RosterResult.__doc__ = """
+The outcome of importing a roster.
+
+If there are any errors, nothing is imported and ``employees`` is empty.
+"""
+
+
+def read_roster(roster_file):
+    """
+    Read the workers listed in a roster file.
+
+    Rosters are CSV files with a header row. The ``name`` and
+    ``username`` columns are required, and a ``timezone`` column may be
+    given.
+
+    Args:
+        roster_file:
+            A binary file containing the roster encoded as UTF-8.
+
+    Returns:
+        A list of ``RosterRow`` instances for each non-blank row.
+
+    Raises:
+        ValueError:
+            If the file cannot be decoded, is not valid CSV, or is
+            missing a required column.
+    """
+    try:
+        text = roster_file.read().decode('utf-8-sig')
+    except UnicodeDecodeError:
+        raise ValueError('The roster must be a UTF-8 encoded CSV file.')
+
+    reader = csv.DictReader(io.StringIO(text))
+
+    try:
+        return _read_rows(reader)
+    except csv.Error as e:
+        raise ValueError(f'The roster is not a valid CSV file: {e}')
+
+
+def _read_rows(reader):
+    """
+    Args:
+        reader:
+            A ``csv.DictReader`` for a roster.
+
+    Returns:
+        A list of ``RosterRow`` instances for each non-blank row.
+
+    Raises:
+        ValueError:
+            If a required column is missing.
+    """
+    columns = {
+        (column or '').strip().lower() for column in reader.fieldnames or ()
+    }
+    missing = [column for column in REQUIRED_COLUMNS if column not in columns]
+    if missing:
+        raise ValueError(
+            f'The roster is missing the columns: {", ".join(missing)}.',
+        )
+
+    rows = []
+    for row in reader:
+        values = {
+            (key or '').strip().lower(): (value or '').strip()
+            for key, value in row.items()
+            if isinstance(value, str)
+        }
+        if not any(values.values()):
+            continue
+
+        rows.append(RosterRow(
+            line=reader.line_num,
+            name=values.get('name', ''),
+            timezone=values.get('timezone', ''),
+            username=values.get('username', ''),
+        ))
+
+    return rows
+
+
+def _validate_rows(agency, client, rows):
+    """
+    Check the rows of a roster against each other and the database.
+
+    The existing users, agency employees, and client employees listed in
+    the roster are each loaded with a single query.
+
+    Args:
+        agency:
+            The staffing agency the workers are employed by.
+        client:
+            The client the workers are being placed at.
+        rows:
+            The ``RosterRow`` instances to validate.
+
+    Returns:
+        A tuple containing a list of ``RosterError`` instances and a
+        dictionary mapping the usernames of workers who already work for
+        the agency to their staffing agency employee.
+    """
+    User = get_user_model()
+    name_length = User._meta.get_field('name').max_length
+    username_length = User._meta.get_field('username').max_length
+
+    usernames = [row.username for row in rows if row.username]
+    existing_users = set(
+        User.objects.filter(
+            username__in=usernames,
+        ).values_list(
+            'username',
+            flat=True,
+        )
+    )
+    agency_employees = {
+        employee.user.username: employee
+        for employee in agency.employees.filter(
+            user__username__in=usernames,
+        ).select_related(
+            'user',
+        )
+    }
+    client_usernames = set(
+        client.employees.filter(
+            user__username__in=usernames,
+        ).values_list(
+            'user__username',
+            flat=True,
+        )
+    )
+
+    errors = []
+    seen = set()
+
+    for row in rows:
+        if not row.username:
+            errors.append(RosterError(row.line, 'A username is required.'))
+            continue
+
+        if row.username in seen:
+            message = f'{row.username} is listed more than once.'
+        elif len(row.username) > username_length:
+            message = (
+                f'Usernames may be at most {username_length} characters.'
+            )
+        elif row.username in client_usernames:
+            message = f'{row.username} already works for {client.name}.'
+        elif row.username in agency_employees:
+            message = None
+        elif row.username in existing_users:
+            message = (
+                f'The username {row.username} is taken by someone who does '
+                f'not work for {agency.name}.'
+            )
+        elif not row.name:
+            message = 'A name is required for new users.'
+        elif len(row.name) > name_length:
+            message = f'Names may be at most {name_length} characters.'
+        elif row.timezone and row.timezone not in pytz.all_timezones_set:
+            message = f'{row.timezone} is not a valid time zone.'
+        else:
+            message = None
+
+        seen.add(row.username)
+
+        if message:
+            errors.append(RosterError(row.line, message))
+
+    return errors, agency_employees
+
+
+def import_roster(agency, client, rows, admin=None):
+    """
+    Place the workers listed in a roster at a client.
+
+    Workers who do not have an account yet are given one, with an
+    unusable password, and added to the staffing agency as approved
+    employees. Every worker then applies to the client, pending the
+    client's approval.
+
+    The rows are validated up front, and if any are invalid nothing is
+    created. Otherwise the users, staffing agency employees, and client
+    employees are each created with a single bulk insert inside one
+    transaction, using employee IDs allocated ahead of time. Since bulk
+    inserts do not send signals, the client's cache is invalidated here.
+
+    Args:
+        agency:
+            The staffing agency the workers are employed by.
+        client:
+            The client the workers are being placed at.
+        rows:
+            The ``RosterRow`` instances to import.
+        admin:
+            The staffing agency admin importing the roster, who is
+            recorded as having approved new agency employees.
+
+    Returns:
+        A ``RosterResult`` containing the created employees or the
+        problems found with the roster.
+    """
+    if not rows:
+        return RosterResult([], [RosterError(None, 'The roster is empty.')])
+
+    errors, agency_employees = _validate_rows(agency, client, rows)
+    if errors:
+        return RosterResult([], errors)
+
+    User = get_user_model()
+    now = timezone.now()
+
+    new_users = []
+    new_agency_employees = []
+    for row in rows:
+        if row.username in agency_employees:
+            continue
+
+        user = User(
+            name=row.name,
+            password=make_password(None),
+            timezone=row.timezone or User._meta.get_field('timezone').default,
+            username=row.username,
+        )
+        new_users.append(user)
+        agency_employees[row.username] = models.StaffingAgencyEmployee(
+            agency=agency,
+            approved_by=admin,
+            is_approved=True,
+            time_approved=now,
+            user=user,
+        )
+        new_agency_employees.append(agency_employees[row.username])
+
+    try:
+        with transaction.atomic():
+            # Lock the client so concurrent imports cannot allocate the
+            # same employee IDs.
+            models.Client.objects.select_for_update().filter(
+                pk=client.pk,
+            ).exists()
+
+            employee_ids = id_utils.generate_unique_ids(
+                settings.EMPLOYEE_ID_LENGTH,
+                len(rows),
+                models.Employee.objects.filter(client=client),
+                queryset_attr='employee_id',
+            )
+
+            User.objects.bulk_create(new_users)
+            models.StaffingAgencyEmployee.objects.bulk_create(
+                new_agency_employees,
+            )
+            employees = models.Employee.objects.bulk_create(
+                models.Employee(
+                    client=client,
+                    employee_id=employee_id,
+                    staffing_agency=agency,
+                    user=agency_employees[row.username].user,
+                )
+                for row, employee_id in zip(rows, employee_ids)
+            )
+    except IntegrityError:
+        return RosterResult([], [
+            RosterError(
+                None,
+                'The roster conflicts with changes made while it was being '
+                'imported. Please try again.',
+            ),
+        ])
+    except RuntimeError:
+        return RosterResult([], [
+            RosterError(
+                None,
+                f'{client.name} does not have enough unused employee IDs '
+                f'for this roster.',
+            ),
+        ])
+
+    cache.invalidate_client(client.pk)
+
+    return RosterResult(employees, [])
@@ -0,0 +1,149 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from vms import cache, events, models
+
+
+# Note that bulk operations such as ``QuerySet.update`` do not send
+# these signals. Code performing bulk writes is responsible for calling
+# the invalidation helpers in ``vms.cache`` and recording changes with
+# ``TimeRecordChange.log`` itself.
+
+
+@receiver([post_delete, post_save], sender=models.Client)
+def invalidate_client(sender, instance, **kwargs):
+    """
+    Invalidate the cache for a client when it changes.
+    """
+    cache.invalidate_client(instance.pk)
+
+
+@receiver([post_delete, post_save], sender=models.ClientJob)
+def invalidate_client_job(sender, instance, **kwargs):
+    """
+    Invalidate the cache for the client owning a job when the job
+    changes.
+    """
+    cache.invalidate_client(instance.client_id)
+
+
+@receiver([post_delete, post_save], sender=models.Employee)
+def invalidate_employee(sender, instance, **kwargs):
+    """
+    Invalidate the cache for an employee and their client when the
+    employee changes.
+    """
+    cache.invalidate_employee(instance.pk, instance.client_id)
+
+
+@receiver([post_delete, post_save], sender=models.TimeRecord)
+def invalidate_time_record(sender, instance, **kwargs):
+    """
+    Invalidate the cache for the employee who owns a time record when
+    the record changes.
+    """
+    cache.invalidate_employee(instance.employee_id, instance.get_client_id())
+
+
+@receiver([post_delete, post_save], sender=models.TimeRecordApproval)
+def invalidate_time_record_approval(sender, instance, **kwargs):
+    """
+    Invalidate the cache for the employee whose time record was approved
+    when the approval changes.
+    """
+    time_record = instance.time_record
+    cache.invalidate_employee(
+        time_record.employee_id,
+        time_record.get_client_id(),
+    )
+
+
+@receiver(post_save, sender=models.TimeRecord)
+def log_time_record_save(sender, instance, created, raw=False, **kwargs):
+    """
+    Add an entry to the change log when a time record is saved.
+    """
+    if raw:
+        return
+
+    action = (
+        models.TimeRecordChange.ACTION_CREATED
+        if created
+        else models.TimeRecordChange.ACTION_UPDATED
+    )
+    models.TimeRecordChange.log(instance, action)
+
+
+@receiver(post_delete, sender=models.TimeRecord)
+def log_time_record_delete(sender, instance, **kwargs):
+    """
+    Add an entry to the change log when a time record is deleted.
+    """
+    models.TimeRecordChange.log(
+        instance,
+        models.TimeRecordChange.ACTION_DELETED,
+    )
+
+
+@receiver(post_save, sender=models.TimeRecordApproval)
+def log_time_record_approval_save(
+        sender,
+        instance,
+        created,
+        raw=False,
+        **kwargs):
+    """
+    Add an entry to the change log when a time record is approved.
+    """
+    if raw or not created:
+        return
+
+    models.TimeRecordChange.log(
+        instance.time_record,
+        models.TimeRecordChange.ACTION_APPROVED,
+    )
+
+
+@receiver(post_delete, sender=models.TimeRecordApproval)
+def log_time_record_approval_delete(sender, instance, **kwargs):
+    """
+    Add an entry to the change log when a time record's approval is
+    removed.
+    """
+    models.TimeRecordChange.log(
+        instance.time_record,
+        models.TimeRecordChange.ACTION_UNAPPROVED,
+    )
+
+
+@receiver(post_save, sender=models.TimeRecord)
+def publish_clock_event(sender, instance, created, raw=False, **kwargs):
+    """
+    Notify the watchers of a client when one of its employees clocks in
+    or out.
+
+    Creating an open time record is a clock in, and setting the end time
+    of a record that was loaded without one is a clock out. The event is
+    published once the transaction commits so watchers never see changes
+    that are rolled back.
+    """
+    if raw:
+        return
+
+    if created and instance.time_end is None:
+        event_type = events.CLOCK_IN
+    elif (
+            not created
+            and instance.time_end is not None
+            and hasattr(instance, '_loaded_time_end')
+            and instance._loaded_time_end is None):
+        event_type = events.CLOCK_OUT
+    else:
+        return
+
+    instance._loaded_time_end = instance.time_end
+
+    transaction.on_commit(
+        lambda: events.publish_clock_event(event_type, instance),
+    )
@@ -0,0 +1,53 @@
+import pytest
+from django.urls import reverse
+
+from vms import models
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize('action,is_active', [
+    ('activate', True),
+    ('deactivate', False),
+])
+def test_set_active_actions(
+        action,
+        employee_factory,
+        is_active,
+        superuser_client):
+    """
+    The activation actions should update the selected employees.
+    """
+    employees = [employee_factory(is_active=not is_active) for _ in range(2)]
+    other = employee_factory(is_active=not is_active)
+    url = reverse('admin:vms_employee_changelist')
+
+    response = superuser_client.post(url, {
+        '_selected_action': [e.pk for e in employees],
+        'action': action,
+    })
+
+    assert response.status_code == 302
+    assert models.Employee.objects.filter(is_active=is_active).count() == 2
+
+    other.refresh_from_db()
+
+    assert other.is_active is not is_active
+
+
+@pytest.mark.integration
+def test_approve_action(employee_factory, superuser_client):
+    """
+    The approve action should approve the selected employees.
+    """
+    employee = employee_factory(is_active=False)
+    url = reverse('admin:vms_employee_changelist')
+
+    response = superuser_client.post(url, {
+        '_selected_action': [employee.pk],
+        'action': 'approve',
+    })
+    employee.refresh_from_db()
+
+    assert response.status_code == 302
+    assert employee.is_active
+    assert employee.time_approved is not None
@@ -0,0 +1,60 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.integration
+def test_change_view_closed(
+        pay_period_factory,
+        superuser_client,
+        user_factory):
+    """
+    The client and bounds of a closed pay period should be read-only.
+    """
+    pay_period = pay_period_factory()
+    pay_period.close(user_factory())
+    url = reverse('admin:vms_payperiod_change', args=(pay_period.pk,))
+
+    response = superuser_client.get(url)
+    admin_form = response.context['adminform']
+
+    assert {'client', 'start', 'end'} <= set(admin_form.readonly_fields)
+
+
+@pytest.mark.integration
+def test_change_view_open(pay_period_factory, superuser_client):
+    """
+    The bounds of a pay period that is not closed should be editable.
+    """
+    pay_period = pay_period_factory()
+    url = reverse('admin:vms_payperiod_change', args=(pay_period.pk,))
+
+    response = superuser_client.get(url)
+    admin_form = response.context['adminform']
+
+    assert not {'client', 'start', 'end'} & set(admin_form.readonly_fields)
+
+
+@pytest.mark.integration
+def test_add_view_blank_end(client_factory, superuser_client):
+    """
+    Submitting a pay period without an end should report a field error
+    rather than failing while checking for overlapping periods.
+    """
+    client = client_factory()
+    url = reverse('admin:vms_payperiod_add')
+    prefix = 'summaries'
+
+    response = superuser_client.post(url, {
+        'client': client.pk,
+        'end_0': '',
+        'end_1': '',
+        'start_0': '2018-10-01',
+        'start_1': '00:00:00',
+        f'{prefix}-INITIAL_FORMS': '0',
+        f'{prefix}-MAX_NUM_FORMS': '1000',
+        f'{prefix}-MIN_NUM_FORMS': '0',
+        f'{prefix}-TOTAL_FORMS': '0',
+    })
+
+    assert response.status_code == 200
+    assert 'end' in response.context['adminform'].form.errors
@@ -0,0 +1,22 @@
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.integration
+def test_approve_action(staffing_agency_employee_factory, superuser_client):
+    """
+    The approve action should approve the selected staffing agency
+    employees.
+    """
+    employee = staffing_agency_employee_factory()
+    url = reverse('admin:vms_staffingagencyemployee_changelist')
+
+    response = superuser_client.post(url, {
+        '_selected_action': [employee.pk],
+        'action': 'approve',
+    })
+    employee.refresh_from_db()
+
+    assert response.status_code == 302
+    assert employee.is_approved
+    assert employee.time_approved is not None
@@ -0,0 +1,148 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from vms import models
+
+
+def count_changelist_queries(client, params=None):
+    """
+    Count the queries made to render the time record changelist.
+    """
+    url = reverse('admin:vms_timerecord_changelist')
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url, params or {})
+
+    assert response.status_code == 200
+
+    return len(context)
+
+
+@pytest.mark.integration
+def test_changelist_query_count(superuser_client, time_record_factory):
+    """
+    The number of queries should not grow with the number of records.
+    """
+    time_record_factory()
+    count_changelist_queries(superuser_client)
+    expected = count_changelist_queries(superuser_client)
+
+    for _ in range(5):
+        time_record_factory()
+
+    assert count_changelist_queries(superuser_client) == expected
+
+
+@pytest.mark.integration
+def test_changelist_status_filter(superuser_client, time_record_factory):
+    """
+    Filtering by status should show only open or closed records.
+    """
+    open_record = time_record_factory()
+    time_record_factory(time_end=timezone.now())
+    url = reverse('admin:vms_timerecord_changelist')
+
+    response = superuser_client.get(url, {'status': 'open'})
+
+    assert list(response.context['cl'].result_list) == [open_record]
+
+
+@pytest.mark.integration
+def test_approve_action(superuser_client, time_record_factory):
+    """
+    The approve action should approve the selected completed records.
+    """
+    records = [time_record_factory(time_end=timezone.now()) for _ in range(3)]
+    open_record = time_record_factory()
+    url = reverse('admin:vms_timerecord_changelist')
+
+    response = superuser_client.post(url, {
+        '_selected_action': [r.pk for r in records] + [open_record.pk],
+        'action': 'approve',
+    })
+
+    assert response.status_code == 302
+    assert models.TimeRecordApproval.objects.count() == 3
+    assert not models.TimeRecordApproval.objects.filter(
+        time_record=open_record,
+    ).exists()
+
+
+@pytest.fixture
+def locked_record(pay_period_factory, time_record_factory, user_factory):
+    """
+    Fixture providing a time record in a closed pay period.
+    """
+    pay_period = pay_period_factory()
+    start = pay_period.start + datetime.timedelta(days=1)
+    record = time_record_factory(
+        employee__client=pay_period.client,
+        time_end=start + datetime.timedelta(hours=1),
+        time_start=start,
+    )
+    pay_period.close(user_factory())
+
+    return record
+
+
+@pytest.mark.integration
+def test_delete_view_locked(superuser_client, locked_record):
+    """
+    Time records in closed pay periods should not be deletable from
+    their delete view.
+    """
+    url = reverse('admin:vms_timerecord_delete', args=(locked_record.pk,))
+
+    response = superuser_client.post(url, {'post': 'yes'})
+
+    assert response.status_code == 403
+    assert models.TimeRecord.objects.filter(pk=locked_record.pk).exists()
+
+
+@pytest.mark.integration
+def test_delete_action_locked(
+        superuser_client,
+        locked_record,
+        time_record_factory):
+    """
+    The delete action should refuse to delete a selection including
+    records in closed pay periods.
+    """
+    other = time_record_factory(time_end=timezone.now())
+    url = reverse('admin:vms_timerecord_changelist')
+    data = {
+        '_selected_action': [locked_record.pk, other.pk],
+        'action': 'delete_selected',
+    }
+
+    confirmation = superuser_client.post(url, data)
+    response = superuser_client.post(url, dict(data, post='yes'))
+
+    assert 'time records in closed pay periods' in confirmation.context[
+        'perms_lacking'
+    ]
+    assert response.status_code == 403
+    assert models.TimeRecord.objects.count() == 2
+
+
+@pytest.mark.integration
+def test_delete_action_unlocked(superuser_client, time_record_factory):
+    """
+    The delete action should delete records outside closed pay periods.
+    """
+    record = time_record_factory(time_end=timezone.now())
+    url = reverse('admin:vms_timerecord_changelist')
+
+    response = superuser_client.post(url, {
+        '_selected_action': [record.pk],
+        'action': 'delete_selected',
+        'post': 'yes',
+    })
+
+    assert response.status_code == 302
+    assert not models.TimeRecord.objects.exists()
@@ -0,0 +1,64 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+
+def count_changelist_queries(client):
+    """
+    Count the queries made to render the time record approval
+    changelist.
+    """
+    url = reverse('admin:vms_timerecordapproval_changelist')
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+
+    assert response.status_code == 200
+
+    return len(context)
+
+
+@pytest.mark.integration
+def test_changelist_query_count(
+        superuser_client,
+        time_record_approval_factory):
+    """
+    The number of queries should not grow with the number of approvals.
+    """
+    time_record_approval_factory()
+    count_changelist_queries(superuser_client)
+    expected = count_changelist_queries(superuser_client)
+
+    for _ in range(5):
+        time_record_approval_factory()
+
+    assert count_changelist_queries(superuser_client) == expected
+
+
+@pytest.mark.integration
+def test_delete_view_locked(
+        pay_period_factory,
+        superuser_client,
+        time_record_approval_factory,
+        user_factory):
+    """
+    Approvals of time records in closed pay periods should not be
+    deletable.
+    """
+    pay_period = pay_period_factory()
+    start = pay_period.start + datetime.timedelta(days=1)
+    approval = time_record_approval_factory(
+        time_record__employee__client=pay_period.client,
+        time_record__time_end=start + datetime.timedelta(hours=1),
+        time_record__time_start=start,
+    )
+    pay_period.close(user_factory())
+    url = reverse('admin:vms_timerecordapproval_delete', args=(approval.pk,))
+
+    response = superuser_client.post(url, {'post': 'yes'})
+
+    assert response.status_code == 403
+    assert approval.time_record.is_approved
@@ -0,0 +1,25 @@
+from django.urls import reverse
+
+
+def test_POST_unknown_intent(client, db):
+    """
+    Sending an unknown intent should return a message asking the user
+    to try again.
+    """
+    data = {
+        'queryResult': {
+            'intent': {'name': 'unknown'},
+            'parameters': {},
+        },
+    }
+
+    response = client.post(
+        reverse('vms:api:dialogflow'),
+        data,
+        content_type='application/json',
+    )
+
+    assert response.status_code == 201
+    assert response.json() == {
+        'fulfillmentText': 'Could not understand request. Please try again.',
+    }
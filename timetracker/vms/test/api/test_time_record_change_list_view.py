@@ -0,0 +1,102 @@
+from django.urls import reverse
+
+from vms import models
+
+
+URL = reverse('vms:api:time-record-change-list')
+
+
+def test_GET_anonymous(client, db):
+    """
+    Anonymous users should not be able to list changes.
+    """
+    response = client.get(URL)
+
+    assert response.status_code == 403
+
+
+def test_GET_client_admin(client, client_admin_factory, time_record_factory):
+    """
+    Client admins should see the changes to their client's records,
+    including deletions, but not the changes of other clients.
+    """
+    admin = client_admin_factory()
+    record = time_record_factory(employee__client=admin.client)
+    record_id = record.id
+    record.delete()
+    time_record_factory()
+
+    client.force_login(admin.user)
+    response = client.get(URL)
+    results = response.json()['results']
+
+    assert response.status_code == 200
+    assert [(r['time_record_id'], r['action']) for r in results] == [
+        (str(record_id), models.TimeRecordChange.ACTION_CREATED),
+        (str(record_id), models.TimeRecordChange.ACTION_DELETED),
+    ]
+    # Deleted records have no current state.
+    assert results[0]['time_record'] is None
+
+
+def test_GET_invalid_cursor(client, employee_factory):
+    """
+    A cursor that is not a change ID should return a 404 response.
+    """
+    employee = employee_factory()
+
+    client.force_login(employee.user)
+    response = client.get(URL, {'cursor': 'abc'})
+
+    assert response.status_code == 404
+
+
+def test_GET_resume(client, employee_factory, time_record_factory):
+    """
+    Requesting changes after a returned cursor should only list the
+    changes made since, along with the current state of each record.
+    """
+    employee = employee_factory()
+    record = time_record_factory(employee=employee)
+
+    client.force_login(employee.user)
+    cursor = client.get(URL).json()['cursor']
+
+    record.pay_rate = 20
+    record.save()
+    response = client.get(URL, {'cursor': cursor})
+    data = response.json()
+
+    assert [r['action'] for r in data['results']] == [
+        models.TimeRecordChange.ACTION_UPDATED,
+    ]
+    assert data['results'][0]['time_record']['pay_rate'] == '20.00'
+    assert data['cursor'] != cursor
+
+    # With no new changes, the cursor is returned unchanged.
+    assert client.get(URL, {'cursor': data['cursor']}).json() == {
+        'cursor': data['cursor'],
+        'next': None,
+        'results': [],
+    }
+
+
+def test_GET_paginate(client, employee_factory, time_record_factory):
+    """
+    Following the next links should return every change exactly once.
+    """
+    employee = employee_factory()
+    for _ in range(5):
+        time_record_factory(employee=employee)
+
+    client.force_login(employee.user)
+    ids = []
+    url = f'{URL}?page_size=2'
+    while url:
+        data = client.get(url).json()
+        ids.extend(r['id'] for r in data['results'])
+        url = data['next']
+
+    assert ids == list(
+        models.TimeRecordChange.objects.values_list('id', flat=True),
+    )
@@ -0,0 +1,221 @@
+import datetime
+
+from django.urls import reverse
+from django.utils import timezone
+
+
+URL = reverse('vms:api:time-record-list')
+
+
+def test_GET_anonymous(client, db):
+    """
+    Anonymous users should not be able to list time records.
+    """
+    response = client.get(URL)
+
+    assert response.status_code == 403
+
+
+def test_GET_client_admin(client, client_admin_factory, time_record_factory):
+    """
+    Client admins should be able to list the time records of the
+    client's employees, but not the records of other clients.
+    """
+    admin = client_admin_factory()
+    record = time_record_factory(employee__client=admin.client)
+    time_record_factory()
+
+    client.force_login(admin.user)
+    response = client.get(URL)
+
+    assert response.status_code == 200
+    assert response.json()['next'] is None
+    assert [r['id'] for r in response.json()['results']] == [str(record.id)]
+
+
+def test_GET_employee_serialization(client, time_record_factory):
+    """
+    Each record should include the identifiers of its related objects
+    and its approval status.
+    """
+    record = time_record_factory()
+
+    client.force_login(record.employee.user)
+    response = client.get(URL)
+    result = response.json()['results'][0]
+
+    assert result['approved'] is False
+    assert result['client'] == record.employee.client.id
+    assert result['employee_id'] == record.employee.employee_id
+    assert result['job'] == record.job.id
+    assert result['job_name'] == record.job.name
+    assert result['time_approved'] is None
+
+
+def test_GET_filter_approved(
+        client,
+        employee_factory,
+        time_record_approval_factory,
+        time_record_factory):
+    """
+    Records should be filterable by their approval status.
+    """
+    employee = employee_factory()
+    approval = time_record_approval_factory(time_record__employee=employee)
+    unapproved = time_record_factory(employee=employee)
+
+    client.force_login(employee.user)
+    approved_response = client.get(URL, {'approved': 'true'})
+    unapproved_response = client.get(URL, {'approved': 'false'})
+
+    assert [r['id'] for r in approved_response.json()['results']] == [
+        str(approval.time_record.id),
+    ]
+    assert [r['id'] for r in unapproved_response.json()['results']] == [
+        str(unapproved.id),
+    ]
+
+
+def test_GET_filter_invalid(client, employee_factory):
+    """
+    Invalid filters should return a 400 response.
+    """
+    employee = employee_factory()
+
+    client.force_login(employee.user)
+    response = client.get(URL, {'updated_since': 'yesterday'})
+
+    assert response.status_code == 400
+    assert 'updated_since' in response.json()
+
+
+def test_GET_filter_updated_since(
+        client,
+        employee_factory,
+        time_record_approval_factory,
+        time_record_factory):
+    """
+    Filtering by update time should include records that were modified
+    or approved after the given time.
+    """
+    employee = employee_factory()
+    old = time_record_factory(employee=employee)
+    approved = time_record_factory(employee=employee)
+    cutoff = timezone.now()
+    modified = time_record_factory(employee=employee)
+    time_record_approval_factory(time_record=approved)
+
+    client.force_login(employee.user)
+    response = client.get(URL, {'updated_since': cutoff.isoformat()})
+    ids = {r['id'] for r in response.json()['results']}
+
+    assert ids == {str(approved.id), str(modified.id)}
+    assert str(old.id) not in ids
+
+
+def test_GET_paginate(client, employee_factory, time_record_factory):
+    """
+    Following the next links should return every record exactly once,
+    even if records share a start time.
+    """
+    employee = employee_factory()
+    start = timezone.now() - datetime.timedelta(days=1)
+    records = [
+        time_record_factory(employee=employee, time_start=start)
+        for _ in range(3)
+    ] + [
+        time_record_factory(
+            employee=employee,
+            time_start=start + datetime.timedelta(hours=i),
+        )
+        for i in range(1, 3)
+    ]
+
+    client.force_login(employee.user)
+    ids = []
+    url = f'{URL}?page_size=2'
+    pages = 0
+    while url:
+        response = client.get(url)
+        ids.extend(r['id'] for r in response.json()['results'])
+        url = response.json()['next']
+        pages += 1
+
+    assert pages == 3
+    assert sorted(ids) == sorted(str(record.id) for record in records)
+    assert len(set(ids)) == len(records)
+
+
+def test_GET_invalid_cursor(client, employee_factory):
+    """
+    A malformed cursor should return a 404 response.
+    """
+    employee = employee_factory()
+
+    client.force_login(employee.user)
+    response = client.get(URL, {'cursor': 'invalid'})
+
+    assert response.status_code == 404
+
+
+def test_GET_not_modified(client, time_record_factory):
+    """
+    Sending the ETag of an unchanged page should return a 304 response,
+    and the ETag should change when a record in the page is modified.
+    """
+    record = time_record_factory()
+
+    client.force_login(record.employee.user)
+    response = client.get(URL)
+    etag = response['ETag']
+
+    cached_response = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+    record.time_end = timezone.now()
+    record.save()
+    modified_response = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert cached_response.status_code == 304
+    assert modified_response.status_code == 200
+    assert modified_response['ETag'] != etag
+
+
+def test_GET_not_modified_etag_list(client, time_record_factory):
+    """
+    The ``If-None-Match`` header should be parsed as a list of ETags
+    that are compared exactly, rather than searched for substrings.
+    """
+    record = time_record_factory()
+
+    client.force_login(record.employee.user)
+    etag = client.get(URL)['ETag']
+
+    listed_response = client.get(
+        URL,
+        HTTP_IF_NONE_MATCH=f'"other", {etag}',
+    )
+    substring_response = client.get(
+        URL,
+        HTTP_IF_NONE_MATCH=f'{etag}-stale',
+    )
+
+    assert listed_response.status_code == 304
+    assert substring_response.status_code == 200
+
+
+def test_GET_not_modified_job_renamed(client, time_record_factory):
+    """
+    Renaming the job of a record in the page should change the ETag,
+    since the job's name is serialized with the record.
+    """
+    record = time_record_factory()
+
+    client.force_login(record.employee.user)
+    etag = client.get(URL)['ETag']
+
+    record.job.name = 'Renamed Job'
+    record.job.save()
+    response = client.get(URL, HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 200
+    assert response['ETag'] != etag
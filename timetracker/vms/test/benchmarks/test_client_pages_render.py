@@ -0,0 +1,106 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache, caches
+
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+def admin_client(client, client_admin_factory, client_job_factory):
+    """
+    Fixture to get a test client logged in as the admin of a client
+    company with many jobs.
+    """
+    admin = client_admin_factory()
+    client.force_login(admin.user)
+
+    for _ in range(50):
+        client_job_factory(client=admin.client)
+
+    client.company = admin.client
+
+    return client
+
+
+def count_fragment_writes(render):
+    """
+    Count the template fragments stored in the cache by a render.
+    """
+    fragment_cache = caches['default']
+
+    with mock.patch.object(
+            fragment_cache,
+            'set',
+            wraps=fragment_cache.set) as cache_set:
+        render()
+
+    return sum(
+        1 for call in cache_set.call_args_list
+        if call[0][0].startswith('template.cache.')
+    )
+
+
+def compare_renders(benchmark_timer, label, render):
+    """
+    Time a page render with a cold and a warm fragment cache, and check
+    that the warm render serves every fragment from the cache.
+    """
+    def cold():
+        cache.clear()
+        render()
+
+    render()
+
+    benchmark_timer(f'{label} (cold cache)', cold)
+    benchmark_timer(f'{label} (warm cache)', render)
+
+    cache.clear()
+
+    assert count_fragment_writes(render) > 0
+    assert count_fragment_writes(render) == 0
+
+
+def test_client_detail_render(admin_client, benchmark_timer):
+    """
+    Measure the time to render a client's detail page as an admin.
+    """
+    url = admin_client.company.get_absolute_url()
+
+    compare_renders(
+        benchmark_timer,
+        'client detail',
+        lambda: admin_client.get(url),
+    )
+
+
+def test_client_job_list_render(admin_client, benchmark_timer):
+    """
+    Measure the time to render the job list of a client with many jobs.
+    """
+    url = admin_client.company.job_list_url
+
+    compare_renders(
+        benchmark_timer,
+        'client job list',
+        lambda: admin_client.get(url),
+    )
+
+
+def test_staffing_agency_render(
+        client,
+        benchmark_timer,
+        staffing_agency_admin_factory):
+    """
+    Measure the time to render a staffing agency's page as an admin.
+    """
+    admin = staffing_agency_admin_factory()
+    client.force_login(admin.user)
+    url = admin.agency.get_absolute_url()
+
+    compare_renders(
+        benchmark_timer,
+        'staffing agency detail',
+        lambda: client.get(url),
+    )
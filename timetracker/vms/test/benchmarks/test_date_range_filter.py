@@ -0,0 +1,58 @@
+import datetime
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from vms import mixins, models
+
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture
+def employee(time_record_factory):
+    """
+    Fixture to get an employee with a year of daily time records.
+    """
+    record = time_record_factory()
+    start = timezone.now() - datetime.timedelta(days=365)
+
+    models.TimeRecord.objects.bulk_create(
+        models.TimeRecord(
+            employee=record.employee,
+            job=record.job,
+            pay_rate=record.pay_rate,
+            time_end=start + datetime.timedelta(days=day, hours=8),
+            time_start=start + datetime.timedelta(days=day),
+        )
+        for day in range(365)
+    )
+
+    return record.employee
+
+
+def test_filter_by_date(benchmark_timer, employee, request_factory):
+    """
+    Measure the time to fetch a week of an employee's time records and
+    check that the query uses the employee and start time index.
+    """
+    end = timezone.now().date()
+    start = end - datetime.timedelta(days=6)
+
+    mixin = mixins.DateRangeMixin()
+    mixin.request = request_factory.get('/', {
+        'end_date': end.isoformat(),
+        'start_date': start.isoformat(),
+    })
+    queryset = mixin.filter_by_date(employee.time_records.all())
+
+    benchmark_timer('week of time records', lambda: list(queryset.all()))
+
+    if connection.vendor == 'sqlite':
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+            plan = ' '.join(str(row) for row in cursor.fetchall())
+
+        assert 'vms_timerec_emp_start_idx' in plan
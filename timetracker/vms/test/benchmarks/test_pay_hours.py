@@ -0,0 +1,48 @@
+import random
+from unittest import mock
+
+import pytest
+
+from vms import pay
+
+
+pytestmark = pytest.mark.benchmark
+
+
+def test_compute_pay_hours_100k(benchmark_timer):
+    """
+    Measure the time to compute the pay hours of 100,000 records.
+    """
+    generator = random.Random(0)
+    starts = []
+    ends = []
+    start = 1514764800
+
+    for _ in range(100000):
+        start += generator.randint(60 * 60, 24 * 60 * 60)
+        starts.append(start)
+        ends.append(start + generator.randint(60, 14 * 60 * 60))
+
+    def compute():
+        return pay.compute_pay_hours(
+            starts,
+            ends,
+            daily_overtime_hours=8,
+            weekly_overtime_hours=40,
+        )
+
+    benchmark_timer('pay hours (100k records)', compute, number=1)
+
+    # The time is only reported, since wall clock limits are unreliable
+    # on shared CI machines. The start of each local day is the costly
+    # part of the pass, so check it is computed once per day rather
+    # than once per record.
+    with mock.patch.object(
+            pay,
+            '_day_start',
+            wraps=pay._day_start) as day_start:
+        result = compute()
+
+    days = result.days[-1].date - result.days[0].date
+
+    assert day_start.call_count <= days.days + 3
@@ -0,0 +1,91 @@
+from unittest import mock
+
+from django.core.cache import cache as django_cache
+
+from vms import cache
+
+
+def test_get_or_set_cached():
+    """
+    If a value is already cached, the default should not be called.
+    """
+    cache.get_or_set(cache.CLIENT_NAMESPACE, 1, ('foo',), lambda: 'bar')
+    default = mock.Mock(return_value='baz')
+
+    value = cache.get_or_set(cache.CLIENT_NAMESPACE, 1, ('foo',), default)
+
+    assert value == 'bar'
+    assert default.call_count == 0
+
+
+def test_get_or_set_invalidated():
+    """
+    Invalidating a namespace should cause values to be recomputed.
+    """
+    cache.get_or_set(cache.CLIENT_NAMESPACE, 1, ('foo',), lambda: 'bar')
+    cache.invalidate(cache.CLIENT_NAMESPACE, 1)
+
+    value = cache.get_or_set(
+        cache.CLIENT_NAMESPACE,
+        1,
+        ('foo',),
+        lambda: 'baz',
+    )
+
+    assert value == 'baz'
+
+
+def test_invalidate_other_namespace():
+    """
+    Invalidating a namespace should not affect other namespaces.
+    """
+    key = cache.make_key(cache.CLIENT_NAMESPACE, 1, 'foo')
+
+    cache.invalidate(cache.CLIENT_NAMESPACE, 2)
+    cache.invalidate(cache.EMPLOYEE_NAMESPACE, 1)
+
+    assert cache.make_key(cache.CLIENT_NAMESPACE, 1, 'foo') == key
+
+
+def test_invalidate_employee_with_client():
+    """
+    Invalidating an employee should also invalidate their client if
+    one is given.
+    """
+    client_key = cache.make_key(cache.CLIENT_NAMESPACE, 1, 'foo')
+    employee_key = cache.make_key(cache.EMPLOYEE_NAMESPACE, 2, 'foo')
+
+    cache.invalidate_employee(2, client_id=1)
+
+    assert cache.make_key(cache.CLIENT_NAMESPACE, 1, 'foo') != client_key
+    assert cache.make_key(cache.EMPLOYEE_NAMESPACE, 2, 'foo') != employee_key
+
+
+def test_make_key_evicted_version():
+    """
+    If a namespace's version is evicted, values stored under the old
+    version should not be reachable.
+    """
+    version = cache.get_version(cache.CLIENT_NAMESPACE, 1)
+    key = cache.make_key(cache.CLIENT_NAMESPACE, 1, 'foo')
+    django_cache.set(key, 'bar')
+
+    django_cache.delete(cache._version_key(cache.CLIENT_NAMESPACE, 1))
+
+    with mock.patch(
+            'vms.cache._initial_version',
+            return_value=version + 1):
+        new_key = cache.make_key(cache.CLIENT_NAMESPACE, 1, 'foo')
+
+    assert new_key != key
+    assert django_cache.get(new_key) is None
+
+
+def test_make_key_parts():
+    """
+    The additional parts of the key should be included in the key.
+    """
+    key = cache.make_key(cache.EMPLOYEE_NAMESPACE, 1, 'foo', 2)
+
+    assert key.startswith('vms:employee:1:')
+    assert key.endswith(':foo:2')
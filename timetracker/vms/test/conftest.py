@@ -1,5 +1,8 @@
+import datetime
+
 import factory
 import pytest
+from django.utils import timezone
 from django.utils.text import slugify
 
 
@@ -80,6 +83,20 @@ class EmployeeFactory(factory.django.DjangoModelFactory):
         model = 'vms.Employee'
 
 
+class PayPeriodFactory(factory.django.DjangoModelFactory):
+    """
+    Factory for generating test pay periods.
+    """
+    client = factory.SubFactory('vms.test.conftest.ClientFactory')
+    end = factory.LazyAttribute(lambda o: o.start + datetime.timedelta(days=7))
+    start = factory.LazyFunction(
+        lambda: timezone.now() - datetime.timedelta(days=14),
+    )
+
+    class Meta:
+        model = 'vms.PayPeriod'
+
+
 class StaffingAgencyAdminFactory(factory.django.DjangoModelFactory):
     """
     Factory for generating test staffing agency admins.
@@ -180,6 +197,14 @@ def employee_factory(db):
     return EmployeeFactory
 
 
+@pytest.fixture
+def pay_period_factory(db):
+    """
+    Fixture to get the factory used to create pay periods.
+    """
+    return PayPeriodFactory
+
+
 @pytest.fixture
 def staffing_agency_admin_factory(db):
     """
@@ -204,6 +229,17 @@ def staffing_agency_factory(db):
     return StaffingAgencyFactory
 
 
+@pytest.fixture
+def superuser_client(client, user_factory):
+    """
+    Fixture to get a test client logged in as a superuser.
+    """
+    user = user_factory(is_staff=True, is_superuser=True)
+    client.force_login(user)
+
+    return client
+
+
 @pytest.fixture
 def time_record_approval_factory(db):
     """
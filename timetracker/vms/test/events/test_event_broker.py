@@ -0,0 +1,153 @@
+import json
+
+from vms import events
+
+
+def parse(message):
+    """
+    Parse a server-sent event message into its type and data.
+    """
+    lines = dict(line.split(': ', 1) for line in message.strip().split('\n'))
+
+    return lines['event'], json.loads(lines['data'])
+
+
+def test_publish_fan_out():
+    """
+    Publishing an event should deliver it to every subscriber of the
+    channel, and only that channel.
+    """
+    broker = events.EventBroker()
+
+    with broker.subscribe('a') as first, broker.subscribe('a') as second:
+        with broker.subscribe('b') as other:
+            count = broker.publish('a', 'event')
+
+            assert count == 2
+            assert first.get_nowait() == 'event'
+            assert second.get_nowait() == 'event'
+            assert other.empty()
+
+
+def test_publish_overflow():
+    """
+    A subscriber whose queue fills up should be dropped and notified.
+    """
+    broker = events.EventBroker(queue_size=1)
+
+    with broker.subscribe('a') as subscriber:
+        broker.publish('a', 'first')
+        broker.publish('a', 'second')
+
+        assert subscriber.get_nowait() is events.OVERFLOW
+        assert broker.subscriber_count('a') == 0
+
+
+def test_subscribe_cleanup():
+    """
+    Leaving the subscription should remove the subscriber.
+    """
+    broker = events.EventBroker()
+
+    with broker.subscribe('a'):
+        assert broker.subscriber_count('a') == 1
+
+    assert broker.subscriber_count('a') == 0
+    assert broker.publish('a', 'event') == 0
+
+
+def test_stream_clock_events(employee_factory, time_record_factory):
+    """
+    The stream should start with the employees on shift, send keep-alive
+    comments while idle, and then send published events.
+    """
+    employee = employee_factory()
+    time_record_factory(employee=employee, time_end=None)
+    broker = events.EventBroker()
+
+    stream = events.stream_clock_events(
+        employee.client,
+        heartbeat=0.01,
+        broker=broker,
+    )
+
+    assert parse(next(stream)) == ('snapshot', [{
+        'employee_id': employee.employee_id,
+        'employee_name': employee.user.name,
+    }])
+    assert next(stream) == ': keep-alive\n\n'
+
+    broker.publish(
+        events.client_channel(employee.client.id),
+        {'type': events.CLOCK_OUT, 'employee_id': employee.employee_id},
+    )
+
+    assert parse(next(stream)) == (
+        events.CLOCK_OUT,
+        {'type': events.CLOCK_OUT, 'employee_id': employee.employee_id},
+    )
+
+    stream.close()
+    channel = events.client_channel(employee.client.id)
+
+    assert broker.subscriber_count(channel) == 0
+
+
+def test_stream_clock_events_idle_employee(employee_factory):
+    """
+    Employees without any time records should not be listed as on
+    shift.
+    """
+    employee = employee_factory()
+
+    stream = events.stream_clock_events(
+        employee.client,
+        broker=events.EventBroker(),
+    )
+
+    assert parse(next(stream)) == ('snapshot', [])
+
+    stream.close()
+
+
+def test_stream_clock_events_expires(client_factory):
+    """
+    The stream should end with an expired event once its duration has
+    passed.
+    """
+    stream = events.stream_clock_events(
+        client_factory(),
+        broker=events.EventBroker(),
+        duration=0,
+    )
+    next(stream)
+
+    assert parse(next(stream)) == ('expired', {})
+    assert list(stream) == []
+
+
+def test_listener_dispatch():
+    """
+    The listener should publish the event contained in a notification
+    to its broker, ignoring malformed payloads.
+    """
+    broker = events.EventBroker()
+    listener = events.NotificationListener(broker)
+
+    with broker.subscribe('a') as subscriber:
+        listener.dispatch(json.dumps({'channel': 'a', 'event': {'x': 1}}))
+        listener.dispatch('not json')
+
+        assert subscriber.get_nowait() == {'x': 1}
+        assert subscriber.empty()
+
+
+def test_listener_not_started_without_postgresql():
+    """
+    The listener should not start on databases without notifications.
+    """
+    listener = events.NotificationListener(events.EventBroker())
+
+    listener.ensure_started()
+
+    assert listener._thread is None
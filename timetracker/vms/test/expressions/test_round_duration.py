@@ -0,0 +1,53 @@
+from unittest import mock
+
+import pytest
+from django.db import NotSupportedError
+from django.db.models import F, Value
+
+from vms import expressions
+
+
+def compile_postgresql(expression):
+    """
+    Compile an expression for PostgreSQL with its source expressions
+    replaced by placeholders, and substitute the parameters into the
+    SQL so their order can be checked.
+    """
+    sources = {
+        F('duration'): ('"duration" + %s', ['DURATION']),
+        Value(900): ('%s', ['BLOCK']),
+    }
+    compiler = mock.Mock()
+    compiler.compile.side_effect = lambda source: sources[source]
+
+    sql, params = expression.as_postgresql(compiler, mock.Mock())
+
+    assert sql.count('%s') == len(params)
+
+    return sql % tuple(params)
+
+
+def test_as_postgresql():
+    """
+    The PostgreSQL SQL should round the duration's seconds to the
+    nearest block, with each parameter in the position of its
+    placeholder.
+    """
+    expression = expressions.RoundDuration(F('duration'), Value(900))
+
+    assert compile_postgresql(expression) == (
+        '(FLOOR((EXTRACT(EPOCH FROM "duration" + DURATION) + BLOCK / 2.0) '
+        "/ BLOCK) * BLOCK * INTERVAL '1 second')"
+    )
+
+
+def test_as_sql_unsupported():
+    """
+    Databases without a specific implementation should be rejected
+    rather than given SQL that does not round.
+    """
+    expression = expressions.RoundDuration(F('duration'), Value(900))
+    connection = mock.Mock(vendor='oracle')
+
+    with pytest.raises(NotSupportedError):
+        expression.as_sql(mock.Mock(), connection)
@@ -0,0 +1,42 @@
+import datetime
+
+from vms import forms
+
+
+def test_save(client_factory):
+    """
+    Saving the form should create a pay period covering whole days,
+    including the end date.
+    """
+    client = client_factory()
+    form = forms.PayPeriodCreateForm(client, data={
+        'end_date': '2018-10-07',
+        'start_date': '2018-10-01',
+    })
+
+    assert form.is_valid()
+    pay_period = form.save()
+
+    assert pay_period.client == client
+    assert pay_period.end - pay_period.start == datetime.timedelta(days=7)
+
+
+def test_clean_overlap(client_factory):
+    """
+    Pay periods overlapping an existing period should not validate.
+    """
+    client = client_factory()
+    existing = forms.PayPeriodCreateForm(client, data={
+        'end_date': '2018-10-07',
+        'start_date': '2018-10-01',
+    })
+    assert existing.is_valid()
+    existing.save()
+
+    form = forms.PayPeriodCreateForm(client, data={
+        'end_date': '2018-10-10',
+        'start_date': '2018-10-05',
+    })
+
+    assert not form.is_valid()
+    assert form.non_field_errors()
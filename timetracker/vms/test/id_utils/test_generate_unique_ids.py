@@ -0,0 +1,47 @@
+from unittest import mock
+
+import pytest
+
+from vms import id_utils
+
+
+class MockQueryset:
+    def __init__(self, values):
+        self.values = values
+
+    def values_list(self, *fields, flat=False):
+        return self.values
+
+
+def test_generate_ids():
+    """
+    The generated IDs should be distinct and not already in use.
+    """
+    queryset = MockQueryset([10, 11, 12])
+
+    values = id_utils.generate_unique_ids(2, 20, queryset)
+
+    assert len(set(values)) == 20
+    assert not set(values) & {10, 11, 12}
+    assert all(10 <= value <= 99 for value in values)
+
+
+@mock.patch('vms.id_utils.generate_numeric_id')
+def test_generate_ids_skips_taken(mock_gen_numeric):
+    """
+    Values that are in use or already generated should be skipped.
+    """
+    mock_gen_numeric.side_effect = [42, 43, 43, 44]
+    queryset = MockQueryset([42])
+
+    assert id_utils.generate_unique_ids(2, 2, queryset) == [43, 44]
+
+
+def test_generate_ids_not_enough_space():
+    """
+    Requesting more IDs than can reasonably be generated should fail.
+    """
+    queryset = MockQueryset([])
+
+    with pytest.raises(RuntimeError):
+        id_utils.generate_unique_ids(1, 5, queryset)
@@ -0,0 +1,42 @@
+import datetime
+
+from django.core.management import call_command
+from django.utils import timezone
+
+
+def test_close_stale_records(capsys, settings, time_record_factory):
+    """
+    Records should be closed according to their client's maximum shift
+    length, or the default if the client does not specify one.
+    """
+    settings.VMS_MAX_SHIFT_HOURS = 12
+    start = timezone.now() - datetime.timedelta(hours=10)
+    default_record = time_record_factory(time_start=start)
+    custom_record = time_record_factory(
+        employee__client__max_shift_hours=8,
+        time_start=start,
+    )
+
+    call_command('closestaletimerecords')
+    default_record.refresh_from_db()
+    custom_record.refresh_from_db()
+
+    assert default_record.time_end is None
+    assert custom_record.time_end == start + datetime.timedelta(hours=8)
+    assert 'Closed 1 stale record(s).' in capsys.readouterr().out
+
+
+def test_dry_run(capsys, time_record_factory):
+    """
+    A dry run should report stale records without closing them.
+    """
+    record = time_record_factory(
+        employee__client__max_shift_hours=1,
+        time_start=timezone.now() - datetime.timedelta(hours=2),
+    )
+
+    call_command('closestaletimerecords', dry_run=True)
+    record.refresh_from_db()
+
+    assert record.time_end is None
+    assert 'Found 1 stale record(s).' in capsys.readouterr().out
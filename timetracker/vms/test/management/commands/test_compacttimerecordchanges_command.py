@@ -0,0 +1,30 @@
+from django.core.management import call_command
+
+from vms import models
+
+
+def test_compact_changes(time_record_factory):
+    """
+    The command should remove superseded changes older than the
+    retention period.
+    """
+    record = time_record_factory()
+    record.save()
+
+    call_command('compacttimerecordchanges', days=0)
+
+    assert list(
+        models.TimeRecordChange.objects.values_list('action', flat=True),
+    ) == [models.TimeRecordChange.ACTION_UPDATED]
+
+
+def test_retain_recent_changes(time_record_factory):
+    """
+    Changes newer than the retention period should be kept.
+    """
+    record = time_record_factory()
+    record.save()
+
+    call_command('compacttimerecordchanges', days=1)
+
+    assert models.TimeRecordChange.objects.count() == 2
@@ -0,0 +1,45 @@
+import datetime
+
+from django.core.management import call_command
+from django.utils import timezone
+
+
+def test_find_overlaps(capsys, time_record_factory):
+    """
+    The command should list each overlapping record.
+    """
+    start = timezone.now() - datetime.timedelta(hours=8)
+    first = time_record_factory(
+        time_end=start + datetime.timedelta(hours=4),
+        time_start=start,
+    )
+    second = time_record_factory(
+        employee=first.employee,
+        time_start=start + datetime.timedelta(hours=1),
+    )
+
+    call_command('findoverlappingtimerecords')
+    output = capsys.readouterr().out
+
+    assert f'{second.id} overlaps {first.id}' in output
+    assert 'Found 1 overlapping record(s).' in output
+
+
+def test_find_overlaps_filter_client(capsys, time_record_factory):
+    """
+    Only the records of the specified client should be checked.
+    """
+    start = timezone.now() - datetime.timedelta(hours=8)
+    first = time_record_factory(time_start=start)
+    time_record_factory(
+        employee=first.employee,
+        time_start=start + datetime.timedelta(hours=1),
+    )
+    other = time_record_factory()
+
+    call_command(
+        'findoverlappingtimerecords',
+        client=other.employee.client.id,
+    )
+
+    assert 'No overlapping records found.' in capsys.readouterr().out
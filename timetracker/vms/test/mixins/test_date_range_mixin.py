@@ -1,5 +1,8 @@
 import datetime
 
+import pytz
+from django.contrib.auth.models import AnonymousUser
+from django.utils import timezone
 from django.views.generic.base import ContextMixin
 
 from vms import mixins
@@ -31,6 +34,21 @@ class MockQueryset:
         return self
 
 
+def test_dates_parsed_once(request_factory):
+    """
+    The GET parameters should only be parsed the first time the dates
+    are accessed.
+    """
+    mixin = mixins.DateRangeMixin()
+    mixin.request = request_factory.get('/', {'start_date': '2018-11-28'})
+
+    assert mixin.start_date == datetime.date(2018, 11, 28)
+
+    mixin.request = request_factory.get('/', {'start_date': '2018-11-29'})
+
+    assert mixin.start_date == datetime.date(2018, 11, 28)
+
+
 def test_end_date(request_factory):
     """
     If an end date is provided as a GET parameter, it should be
@@ -41,14 +59,7 @@ def test_end_date(request_factory):
     mixin = mixins.DateRangeMixin()
     mixin.request = request_factory.get('/', {'end_date': date})
 
-    assert mixin.end_date == datetime.datetime(
-        2018,
-        11,
-        28,
-        23,
-        59,
-        59,
-    )
+    assert mixin.end_date == datetime.date(2018, 11, 28)
 
 
 def test_end_date_before_start_date(request_factory):
@@ -68,14 +79,7 @@ def test_end_date_before_start_date(request_factory):
         }
     )
 
-    assert mixin.end_date == datetime.datetime(
-        2018,
-        11,
-        29,
-        23,
-        59,
-        59,
-    )
+    assert mixin.end_date == datetime.date(2018, 11, 29)
 
 
 def test_end_date_malformed(request_factory):
@@ -103,8 +107,8 @@ def test_end_date_not_specified(request_factory):
 
 def test_filter_by_date_end(request_factory):
     """
-    If only an end date is provided, the queryset should be filtered by
-    the end date.
+    If only an end date is provided, the queryset should be filtered to
+    records starting before the next day.
     """
     queryset = MockQueryset()
     end = '2018-11-29'
@@ -112,10 +116,10 @@ def test_filter_by_date_end(request_factory):
     mixin = mixins.DateRangeMixin()
     mixin.request = request_factory.get('/', {'end_date': end})
 
-    result = mixin.filter_by_date(queryset, end_attr='end')
+    result = mixin.filter_by_date(queryset, attr='start')
 
     assert result.filter_kwargs == {
-        'end__lte': mixin.end_date,
+        'start__lt': timezone.make_aware(datetime.datetime(2018, 11, 30)),
     }
 
 
@@ -129,17 +133,17 @@ def test_filter_by_date_start(request_factory):
     mixin = mixins.DateRangeMixin()
     mixin.request = request_factory.get('/', {'start_date': start})
 
-    result = mixin.filter_by_date(queryset, start_attr='start')
+    result = mixin.filter_by_date(queryset, attr='start')
 
     assert result.filter_kwargs == {
-        'start__gte': mixin.start_date,
+        'start__gte': timezone.make_aware(datetime.datetime(2018, 11, 29)),
     }
 
 
 def test_filter_by_date_start_and_end(request_factory):
     """
     If an end date and start date are specified, the queryset should be
-    filtered by both.
+    filtered to a half open range covering both days.
     """
     queryset = MockQueryset()
 
@@ -155,18 +159,38 @@ def test_filter_by_date_start_and_end(request_factory):
         }
     )
 
-    result = mixin.filter_by_date(
-        queryset,
-        end_attr='end',
-        start_attr='start',
-    )
+    result = mixin.filter_by_date(queryset)
+    time_start = timezone.make_aware(datetime.datetime(2018, 11, 28))
+    time_end = timezone.make_aware(datetime.datetime(2018, 11, 30))
 
     assert result.filter_kwargs == {
-        'end__lte': mixin.end_date,
-        'start__gte': mixin.start_date,
+        'time_start__gte': time_start,
+        'time_start__lt': time_end,
     }
 
 
+def test_filter_by_date_includes_last_second(
+        request_factory,
+        time_record_factory):
+    """
+    Records starting in the last second of the end date, including open
+    records, should be included.
+    """
+    start = timezone.make_aware(datetime.datetime(2018, 11, 28, 23, 59, 59))
+    record = time_record_factory(time_start=start)
+    time_record_factory(
+        employee=record.employee,
+        time_start=start + datetime.timedelta(seconds=1),
+    )
+
+    mixin = mixins.DateRangeMixin()
+    mixin.request = request_factory.get('/', {'end_date': '2018-11-28'})
+
+    assert list(mixin.filter_by_date(record.employee.time_records.all())) == [
+        record,
+    ]
+
+
 def test_get_context_data(request_factory):
     """
     The context returned from the mixin should include the start and end
@@ -203,7 +227,7 @@ def test_start_date(request_factory):
     mixin = mixins.DateRangeMixin()
     mixin.request = request_factory.get('/', {'start_date': date})
 
-    assert mixin.start_date == datetime.datetime(2018, 11, 28)
+    assert mixin.start_date == datetime.date(2018, 11, 28)
 
 
 def test_start_date_malformed(request_factory):
@@ -227,3 +251,44 @@ def test_start_date_not_specified(request_factory):
     mixin.request = request_factory.get('/')
 
     assert mixin.start_date is None
+
+
+def test_time_range_user_timezone(request_factory, user_factory):
+    """
+    The dates should be interpreted in the requesting user's time zone.
+    """
+    user = user_factory(timezone='America/Los_Angeles')
+    tz = pytz.timezone('America/Los_Angeles')
+
+    mixin = mixins.DateRangeMixin()
+    mixin.request = request_factory.get(
+        '/',
+        {
+            'end_date': '2018-11-04',
+            'start_date': '2018-11-03',
+        },
+    )
+    mixin.request.user = user
+
+    # The range crosses the end of daylight saving time.
+    assert mixin.time_range == (
+        tz.localize(datetime.datetime(2018, 11, 3)),
+        tz.localize(datetime.datetime(2018, 11, 5)),
+    )
+
+
+def test_time_range_anonymous_user(request_factory):
+    """
+    If the user is not logged in, the current time zone should be used.
+    """
+    mixin = mixins.DateRangeMixin()
+    mixin.request = request_factory.get('/', {'start_date': '2018-11-03'})
+    mixin.request.user = AnonymousUser()
+
+    with timezone.override('America/Chicago'):
+        time_start, time_end = mixin.time_range
+
+    assert time_end is None
+    assert time_start == pytz.timezone('America/Chicago').localize(
+        datetime.datetime(2018, 11, 3),
+    )
@@ -1,5 +1,9 @@
+import datetime
+from unittest import mock
+
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 from django.urls import reverse
 from django.utils import timezone
 
@@ -42,6 +46,57 @@ def test_approve_already_approved(client_admin_factory, employee_factory):
     assert employee.time_approved == time
 
 
+def test_clock_in(client_job_factory, employee_factory):
+    """
+    Clocking in should create an open time record for the job.
+    """
+    employee = employee_factory()
+    job = client_job_factory(client=employee.client)
+
+    record = employee.clock_in(job)
+
+    assert record.employee == employee
+    assert record.job == job
+    assert record.pay_rate == job.pay_rate
+    assert record.time_end is None
+
+
+def test_clock_in_already_clocked_in(employee_factory, time_record_factory):
+    """
+    Employees who are already clocked in should not be able to clock in
+    again.
+    """
+    record = time_record_factory()
+
+    with pytest.raises(ValidationError):
+        record.employee.clock_in(record.job)
+
+    assert record.employee.time_records.count() == 1
+
+
+def test_clock_out(time_record_factory):
+    """
+    Clocking out should complete the employee's open time record.
+    """
+    record = time_record_factory()
+
+    completed = record.employee.clock_out()
+    record.refresh_from_db()
+
+    assert completed == record
+    assert record.time_end is not None
+
+
+def test_clock_out_not_clocked_in(employee_factory):
+    """
+    Employees who are not clocked in should not be able to clock out.
+    """
+    employee = employee_factory()
+
+    with pytest.raises(ValidationError):
+        employee.clock_out()
+
+
 def test_clock_in_url(employee_factory):
     """
     This property should return the URL of the view used to clock in an
@@ -93,6 +148,19 @@ def test_get_absolute_url(employee_factory):
     assert employee.get_absolute_url() == expected
 
 
+def test_get_absolute_url_memoized(employee_factory):
+    """
+    The employee's URL should only be reversed once per instance.
+    """
+    employee = employee_factory()
+
+    with mock.patch('vms.models.reverse', return_value='/foo/') as mock_rev:
+        employee.get_absolute_url()
+        employee.get_absolute_url()
+
+    assert mock_rev.call_count == 1
+
+
 def test_save_new_employee(
         client_factory,
         staffing_agency_factory,
@@ -122,6 +190,23 @@ def test_save_old_employee(employee_factory):
     assert emp.employee_id == old_id
 
 
+def test_save_duplicate_id(employee_factory, user_factory):
+    """
+    The database should reject employees sharing an ID within a client,
+    so concurrent ID allocations cannot both succeed.
+    """
+    old_emp = employee_factory()
+    new_emp = models.Employee(
+        client=old_emp.client,
+        employee_id=old_emp.employee_id,
+        staffing_agency=old_emp.staffing_agency,
+        user=user_factory(),
+    )
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        new_emp.save()
+
+
 def test_string_conversion(employee_factory):
     """
     Converting an employee to a string should return a string with the
@@ -204,3 +289,39 @@ def test_validate_unique_old_employee_unique_id(employee_factory):
     """
     emp = employee_factory()
     emp.validate_unique()
+
+
+def test_queryset_approve(employee_factory):
+    """
+    Approving a queryset should approve and activate the employees that
+    have not been approved.
+    """
+    approved_time = timezone.now() - datetime.timedelta(days=1)
+    pending = employee_factory(is_active=False)
+    approved = employee_factory(is_active=False, time_approved=approved_time)
+
+    count = models.Employee.objects.approve()
+
+    pending.refresh_from_db()
+    approved.refresh_from_db()
+
+    assert count == 1
+    assert pending.is_active
+    assert pending.time_approved is not None
+    assert not approved.is_active
+    assert approved.time_approved == approved_time
+
+
+def test_queryset_set_active(employee_factory):
+    """
+    Deactivating a queryset should only update the active employees.
+    """
+    active = employee_factory(is_active=True)
+    employee_factory(is_active=False)
+
+    count = models.Employee.objects.set_active(False)
+
+    active.refresh_from_db()
+
+    assert count == 1
+    assert not active.is_active
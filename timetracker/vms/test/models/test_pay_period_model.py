@@ -0,0 +1,304 @@
+import datetime
+import decimal
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from vms import models
+
+
+def create_record(time_record_factory, pay_period, hours, **kwargs):
+    """
+    Create a completed time record in a pay period.
+    """
+    start = pay_period.start + datetime.timedelta(days=1)
+
+    return time_record_factory(
+        employee__client=pay_period.client,
+        time_end=start + datetime.timedelta(hours=hours),
+        time_start=start,
+        **kwargs,
+    )
+
+
+def test_clean_end_before_start(pay_period_factory):
+    """
+    A pay period ending before it starts should not validate.
+    """
+    pay_period = pay_period_factory.build(
+        client=pay_period_factory().client,
+        end=timezone.now() - datetime.timedelta(days=1),
+        start=timezone.now(),
+    )
+
+    with pytest.raises(ValidationError):
+        pay_period.clean()
+
+
+def test_clean_overlap(pay_period_factory):
+    """
+    Pay periods of the same client should not overlap.
+    """
+    existing = pay_period_factory()
+    pay_period = models.PayPeriod(
+        client=existing.client,
+        end=existing.end + datetime.timedelta(days=1),
+        start=existing.end - datetime.timedelta(days=1),
+    )
+
+    with pytest.raises(ValidationError):
+        pay_period.clean()
+
+
+def test_close(pay_period_factory, time_record_factory, user_factory):
+    """
+    Closing a pay period should store the totals of each employee and
+    job, combining records with different pay rates.
+    """
+    pay_period = pay_period_factory()
+    user = user_factory()
+    record = create_record(time_record_factory, pay_period, 2, pay_rate=10)
+    create_record(
+        time_record_factory,
+        pay_period,
+        1,
+        employee=record.employee,
+        job=record.job,
+        pay_rate=20,
+    )
+    # Records outside of the period are excluded.
+    time_record_factory(
+        employee=record.employee,
+        time_end=timezone.now(),
+        time_start=timezone.now() - datetime.timedelta(hours=1),
+    )
+
+    pay_period.close(user)
+
+    assert pay_period.is_closed
+    assert pay_period.closed_by == user
+    assert list(pay_period.summaries.values(
+        'earnings',
+        'employee',
+        'job',
+        'record_count',
+        'total_time',
+    )) == [{
+        'earnings': decimal.Decimal('40.00'),
+        'employee': record.employee.pk,
+        'job': record.job.pk,
+        'record_count': 2,
+        'total_time': datetime.timedelta(hours=3),
+    }]
+
+
+def test_close_already_closed(pay_period_factory, user_factory):
+    """
+    A pay period should only be closed once.
+    """
+    pay_period = pay_period_factory()
+    pay_period.close(user_factory())
+
+    with pytest.raises(ValidationError):
+        pay_period.close(user_factory())
+
+
+def test_close_not_ended(pay_period_factory, user_factory):
+    """
+    Pay periods that have not ended cannot be closed.
+    """
+    pay_period = pay_period_factory(
+        start=timezone.now() - datetime.timedelta(days=1),
+    )
+
+    with pytest.raises(ValidationError):
+        pay_period.close(user_factory())
+
+
+def test_close_open_records(
+        pay_period_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Pay periods containing incomplete time records cannot be closed.
+    """
+    pay_period = pay_period_factory()
+    time_record_factory(
+        employee__client=pay_period.client,
+        time_start=pay_period.start,
+    )
+
+    with pytest.raises(ValidationError):
+        pay_period.close(user_factory())
+
+    assert not pay_period.summaries.exists()
+
+
+def test_get_totals_closed(
+        pay_period_factory,
+        time_record_factory,
+        user_factory):
+    """
+    The totals of a closed pay period should be read from its summaries.
+    """
+    pay_period = pay_period_factory()
+    create_record(time_record_factory, pay_period, 1)
+    pay_period.close(user_factory())
+    pay_period.summaries.update(earnings=1)
+
+    assert pay_period.get_totals()[0]['earnings'] == 1
+
+
+def test_get_totals_open(pay_period_factory, time_record_factory):
+    """
+    The totals of an open pay period should be computed from its time
+    records.
+    """
+    pay_period = pay_period_factory()
+    record = create_record(time_record_factory, pay_period, 1, pay_rate=15)
+
+    assert pay_period.get_totals() == [{
+        'earnings': decimal.Decimal('15.00'),
+        'employee_id': record.employee.pk,
+        'job_id': record.job.pk,
+        'record_count': 1,
+        'total_time': datetime.timedelta(hours=1),
+    }]
+
+
+def test_locked_time_record(
+        pay_period_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Time records in a closed pay period cannot be modified, deleted, or
+    moved out of the period.
+    """
+    pay_period = pay_period_factory()
+    record = create_record(time_record_factory, pay_period, 1)
+    pay_period.close(user_factory())
+
+    record = models.TimeRecord.objects.get(pk=record.pk)
+    record.time_start = timezone.now() - datetime.timedelta(hours=2)
+    record.time_end = timezone.now() - datetime.timedelta(hours=1)
+
+    with pytest.raises(ValidationError):
+        record.save()
+
+    with pytest.raises(ValidationError):
+        record.delete()
+
+
+def test_locked_time_record_other_client(
+        pay_period_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Closing a pay period should not lock the records of other clients.
+    """
+    pay_period = pay_period_factory()
+    pay_period.close(user_factory())
+    record = time_record_factory(time_start=pay_period.start)
+
+    record.time_end = pay_period.start + datetime.timedelta(hours=1)
+    record.save()
+
+
+def test_locked_queryset(
+        pay_period_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Only records in closed pay periods of their own client should be
+    locked.
+    """
+    closed = pay_period_factory()
+    locked = create_record(time_record_factory, closed, 1)
+    create_record(time_record_factory, pay_period_factory(), 1)
+    time_record_factory(time_start=closed.start)
+    closed.close(user_factory())
+
+    assert list(models.TimeRecord.objects.locked()) == [locked]
+
+
+def test_unlocked_queryset(
+        pay_period_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Records outside closed pay periods should be unlocked.
+    """
+    closed = pay_period_factory()
+    create_record(time_record_factory, closed, 1)
+    unlocked = create_record(time_record_factory, pay_period_factory(), 1)
+    closed.close(user_factory())
+
+    assert list(models.TimeRecord.objects.unlocked()) == [unlocked]
+
+
+def test_approve_queryset_locked(
+        pay_period_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Bulk approval should skip records in closed pay periods.
+    """
+    pay_period = pay_period_factory()
+    locked = create_record(time_record_factory, pay_period, 1)
+    pay_period.close(user_factory())
+
+    count = models.TimeRecord.objects.approve(user_factory())
+
+    assert count == 0
+    assert not models.TimeRecordApproval.objects.filter(
+        time_record=locked,
+    ).exists()
+
+
+def test_close_stale_queryset_locked(
+        pay_period_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Sweeping stale records should leave records in closed pay periods
+    untouched.
+    """
+    pay_period = pay_period_factory()
+    locked = create_record(time_record_factory, pay_period, 1)
+    pay_period.close(user_factory())
+    models.TimeRecord.objects.filter(pk=locked.pk).update(time_end=None)
+
+    closed = models.TimeRecord.objects.close_stale(
+        datetime.timedelta(hours=10),
+    )
+    locked.refresh_from_db()
+
+    assert closed == []
+    assert locked.time_end is None
+
+
+def test_approval_locked(
+        pay_period_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Records in closed pay periods should not be approved or unapproved.
+    """
+    pay_period = pay_period_factory()
+    approved = create_record(time_record_factory, pay_period, 1)
+    approval = models.TimeRecordApproval.objects.create(
+        time_record=approved,
+        user=user_factory(),
+    )
+    pending = create_record(time_record_factory, pay_period, 1)
+    pay_period.close(user_factory())
+
+    with pytest.raises(ValidationError):
+        approval.delete()
+
+    with pytest.raises(ValidationError):
+        models.TimeRecordApproval.objects.create(
+            time_record=pending,
+            user=user_factory(),
+        )
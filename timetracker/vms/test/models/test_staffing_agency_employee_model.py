@@ -1,3 +1,4 @@
+from vms import models
 
 
 def test_string_conversion(staffing_agency_employee_factory):
@@ -9,3 +10,26 @@ def test_string_conversion(staffing_agency_employee_factory):
     expected = f"{employee.user.name} contracted by {employee.agency.name}"
 
     assert str(employee) == expected
+
+
+def test_queryset_approve(
+        staffing_agency_admin_factory,
+        staffing_agency_employee_factory):
+    """
+    Approving a queryset should approve the employees that have not been
+    approved.
+    """
+    pending = staffing_agency_employee_factory()
+    staffing_agency_employee_factory(is_approved=True)
+    admin = staffing_agency_admin_factory(agency=pending.agency)
+
+    count = models.StaffingAgencyEmployee.objects.filter(
+        agency=pending.agency,
+    ).approve(admin)
+
+    pending.refresh_from_db()
+
+    assert count == 1
+    assert pending.is_approved
+    assert pending.approved_by == admin
+    assert pending.time_approved is not None
@@ -0,0 +1,100 @@
+import datetime
+from unittest import mock
+
+from django.utils import timezone
+
+from vms import managers, models
+
+
+def test_compact(time_record_factory):
+    """
+    Compacting the change log should remove old entries that have been
+    superseded, but keep the latest entry for each time record.
+    """
+    updated = time_record_factory()
+    updated.save()
+    created = time_record_factory()
+
+    compacted = models.TimeRecordChange.objects.compact(
+        timezone.now() + datetime.timedelta(seconds=1),
+    )
+    remaining = models.TimeRecordChange.objects.all()
+
+    assert compacted == 1
+    assert [(c.time_record_id, c.action) for c in remaining] == [
+        (updated.id, models.TimeRecordChange.ACTION_UPDATED),
+        (created.id, models.TimeRecordChange.ACTION_CREATED),
+    ]
+
+
+def test_compact_retention(time_record_factory):
+    """
+    Entries created after the given time should not be removed.
+    """
+    record = time_record_factory()
+    record.save()
+
+    compacted = models.TimeRecordChange.objects.compact(
+        timezone.now() - datetime.timedelta(days=1),
+    )
+
+    assert compacted == 0
+    assert models.TimeRecordChange.objects.count() == 2
+
+
+def test_create_locks_sequence(time_record_factory):
+    """
+    Adding to the change log on PostgreSQL should take the advisory lock
+    that keeps IDs in commit order.
+    """
+    record = time_record_factory()
+    connection = mock.MagicMock(vendor='postgresql')
+    cursor = connection.cursor.return_value.__enter__.return_value
+
+    with mock.patch.object(managers, 'connections', {'default': connection}):
+        models.TimeRecordChange.log(
+            record,
+            models.TimeRecordChange.ACTION_UPDATED,
+        )
+
+    cursor.execute.assert_called_once_with(
+        'SELECT pg_advisory_xact_lock(%s)',
+        [managers.CHANGE_LOG_LOCK_ID],
+    )
+
+
+def test_log(time_record_factory):
+    """
+    Logging a change should record the time record and its owners.
+    """
+    record = time_record_factory()
+    models.TimeRecordChange.objects.all().delete()
+
+    change = models.TimeRecordChange.log(
+        record,
+        models.TimeRecordChange.ACTION_UPDATED,
+    )
+
+    assert change.action == models.TimeRecordChange.ACTION_UPDATED
+    assert change.client_id == record.employee.client_id
+    assert change.employee_pk == record.employee.pk
+    assert change.time_record_id == record.id
+
+
+def test_ordering(time_record_factory):
+    """
+    Changes should be ordered by the order they were made in.
+    """
+    first = time_record_factory()
+    first_id = first.id
+    second = time_record_factory()
+    first.delete()
+
+    assert [
+        (c.time_record_id, c.action)
+        for c in models.TimeRecordChange.objects.all()
+    ] == [
+        (first_id, models.TimeRecordChange.ACTION_CREATED),
+        (second.id, models.TimeRecordChange.ACTION_CREATED),
+        (first_id, models.TimeRecordChange.ACTION_DELETED),
+    ]
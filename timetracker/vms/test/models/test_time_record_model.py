@@ -1,8 +1,81 @@
 import datetime
+from unittest import mock
 
+import pytest
+import pytz
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError
 from django.utils import timezone
 
-from vms import models
+from vms import managers, models
+
+
+def test_clean_adjacent(time_record_factory):
+    """
+    Records ending when another begins do not overlap.
+    """
+    start = timezone.now() - datetime.timedelta(hours=8)
+    end = start + datetime.timedelta(hours=4)
+    record = time_record_factory(time_end=end, time_start=start)
+
+    next_record = models.TimeRecord(
+        employee=record.employee,
+        pay_rate=record.pay_rate,
+        time_end=end + datetime.timedelta(hours=4),
+        time_start=end,
+    )
+
+    next_record.clean()
+
+
+def test_clean_end_before_start(time_record_factory):
+    """
+    A record ending before it starts should not validate.
+    """
+    now = timezone.now()
+    record = time_record_factory(
+        time_end=now - datetime.timedelta(hours=1),
+        time_start=now,
+    )
+
+    with pytest.raises(ValidationError):
+        record.clean()
+
+
+def test_clean_overlap(time_record_factory):
+    """
+    A record overlapping another of the employee's records should not
+    validate.
+    """
+    start = timezone.now() - datetime.timedelta(hours=8)
+    record = time_record_factory(
+        time_end=start + datetime.timedelta(hours=4),
+        time_start=start,
+    )
+
+    overlapping = models.TimeRecord(
+        employee=record.employee,
+        pay_rate=record.pay_rate,
+        time_end=None,
+        time_start=start + datetime.timedelta(hours=2),
+    )
+
+    with pytest.raises(ValidationError):
+        overlapping.clean()
+
+
+def test_clean_overlap_other_employee(time_record_factory):
+    """
+    Records of different employees may overlap.
+    """
+    start = timezone.now() - datetime.timedelta(hours=8)
+    time_record_factory(time_start=start)
+    record = time_record_factory(
+        time_end=start + datetime.timedelta(hours=4),
+        time_start=start,
+    )
+
+    record.clean()
 
 
 def test_is_approved_no_approval(time_record_factory):
@@ -26,6 +99,211 @@ def test_is_approved_with_approval(time_record_approval_factory):
     assert record.is_approved
 
 
+def test_queryset_approve(
+        time_record_approval_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Approving a queryset should approve each completed record without an
+    approval and log the approvals.
+    """
+    now = timezone.now()
+    user = user_factory()
+    pending = time_record_factory(time_end=now)
+    approved = time_record_approval_factory(
+        time_record__time_end=now,
+    ).time_record
+    time_record_factory()
+
+    count = models.TimeRecord.objects.approve(user)
+
+    assert count == 1
+    assert pending.approval.user == user
+    assert approved.approval.user != user
+    assert models.TimeRecordApproval.objects.count() == 2
+    assert list(
+        models.TimeRecordChange.objects.filter(
+            action=models.TimeRecordChange.ACTION_APPROVED,
+            time_record_id=pending.id,
+        ).values_list('client_id', 'employee_pk')
+    ) == [(pending.employee.client.id, pending.employee.pk)]
+
+
+def test_queryset_approve_concurrent(
+        time_record_approval_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Records approved by someone else while waiting for the lock should
+    be skipped rather than approved twice.
+    """
+    now = timezone.now()
+    user = user_factory()
+    pending = time_record_factory(time_end=now)
+    other = time_record_factory(time_end=now)
+    selected = [pending.id, other.id]
+
+    def lock_then_approve(*args, **kwargs):
+        """
+        Approve one of the pending records before the lock is acquired,
+        as a concurrent request could.
+        """
+        time_record_approval_factory(time_record=other)
+
+        return mock.Mock(**{'values_list.return_value': selected})
+
+    with mock.patch.object(
+            managers.TimeRecordQuerySet,
+            'select_for_update',
+            side_effect=lock_then_approve):
+        count = models.TimeRecord.objects.approve(user)
+
+    pending.refresh_from_db()
+    other.refresh_from_db()
+
+    assert count == 1
+    assert pending.approval.user == user
+    assert other.approval.user != user
+    assert models.TimeRecordChange.objects.filter(
+        action=models.TimeRecordChange.ACTION_APPROVED,
+        time_record_id=other.id,
+    ).count() == 1
+
+
+def test_queryset_close_stale(time_record_factory):
+    """
+    Open records longer than the maximum shift should be closed at the
+    end of the maximum shift and logged as updated.
+    """
+    now = timezone.now()
+    max_shift = datetime.timedelta(hours=10)
+    stale = time_record_factory(time_start=now - datetime.timedelta(hours=11))
+    recent = time_record_factory(time_start=now - datetime.timedelta(hours=9))
+    closed_record = time_record_factory(
+        time_end=now - datetime.timedelta(hours=1),
+        time_start=now - datetime.timedelta(hours=12),
+    )
+
+    closed = models.TimeRecord.objects.close_stale(max_shift, now)
+
+    stale.refresh_from_db()
+    recent.refresh_from_db()
+    closed_record.refresh_from_db()
+
+    assert closed == [
+        (stale.id, stale.employee.pk, stale.employee.client.id),
+    ]
+    assert stale.time_end == stale.time_start + max_shift
+    assert recent.time_end is None
+    assert models.TimeRecordChange.objects.last().time_record_id == stale.id
+    assert closed_record.time_end == now - datetime.timedelta(hours=1)
+
+
+def test_queryset_close_stale_atomic(time_record_factory):
+    """
+    If the change log cannot be updated, the records should be left
+    open.
+    """
+    now = timezone.now()
+    stale = time_record_factory(time_start=now - datetime.timedelta(hours=11))
+
+    with mock.patch.object(
+            models.TimeRecordChange.objects,
+            'bulk_create',
+            side_effect=DatabaseError):
+        with pytest.raises(DatabaseError):
+            models.TimeRecord.objects.close_stale(
+                datetime.timedelta(hours=10),
+                now,
+            )
+
+    stale.refresh_from_db()
+
+    assert stale.time_end is None
+
+
+def test_queryset_close_stale_concurrent(time_record_factory):
+    """
+    Records closed by someone else after being selected should not be
+    reported or logged as closed.
+    """
+    now = timezone.now()
+    max_shift = datetime.timedelta(hours=10)
+    stale = time_record_factory(time_start=now - datetime.timedelta(hours=11))
+    other = time_record_factory(time_start=now - datetime.timedelta(hours=12))
+    selected = list(
+        models.TimeRecord.objects.stale(max_shift, now).values_list(
+            'id',
+            'employee_id',
+            'employee__client_id',
+        )
+    )
+
+    def select_then_clock_out(*args):
+        """
+        Select the stale records, then have one of them clock out before
+        they are closed, as a concurrent request could without row
+        locks.
+        """
+        other.time_end = now
+        other.save()
+
+        return mock.Mock(**{
+            'select_for_update.return_value.values_list.return_value': (
+                selected
+            ),
+        })
+
+    with mock.patch.object(
+            managers.TimeRecordQuerySet,
+            'stale',
+            side_effect=select_then_clock_out):
+        closed = models.TimeRecord.objects.close_stale(max_shift, now)
+
+    other.refresh_from_db()
+    changes = models.TimeRecordChange.objects.filter(
+        action=models.TimeRecordChange.ACTION_UPDATED,
+    ).values_list('time_record_id', flat=True)
+
+    assert [record_id for record_id, _, _ in closed] == [stale.id]
+    assert other.time_end == now
+    assert list(changes) == [other.id, stale.id]
+
+
+def test_queryset_find_overlaps(employee_factory, time_record_factory):
+    """
+    The overlapping records of each employee should be found.
+    """
+    employee = employee_factory()
+    start = timezone.now() - datetime.timedelta(days=1)
+    hour = datetime.timedelta(hours=1)
+
+    long_shift = time_record_factory(
+        employee=employee,
+        time_end=start + 8 * hour,
+        time_start=start,
+    )
+    inside = time_record_factory(
+        employee=employee,
+        time_end=start + 3 * hour,
+        time_start=start + 2 * hour,
+    )
+    after = time_record_factory(
+        employee=employee,
+        time_end=start + 9 * hour,
+        time_start=start + 4 * hour,
+    )
+    time_record_factory(employee=employee, time_start=start + 9 * hour)
+    time_record_factory(time_end=start + 8 * hour, time_start=start)
+
+    overlaps = list(models.TimeRecord.objects.find_overlaps(chunk_size=2))
+
+    assert overlaps == [
+        (inside.id, long_shift.id),
+        (after.id, long_shift.id),
+    ]
+
+
 def test_queryset_with_deltas(time_record_factory):
     """
     This queryset method should annotate all completed time records
@@ -44,14 +322,223 @@ def test_queryset_with_deltas(time_record_factory):
 
     records = models.TimeRecord.objects.with_deltas()
 
-    # Only records with an end time should be included
-    assert list(records) == [t1, t2]
+    # Only records with an end time should be included. Records
+    # starting at the same time are ordered by ID.
+    assert list(records) == sorted([t1, t2], key=lambda record: record.pk)
 
     # Each record should be annotated with its delta
     for record in records:
         assert record.delta == record.time_end - record.time_start
 
 
+def test_queryset_with_deltas_rounded(settings, time_record_factory):
+    """
+    Each record's delta should be rounded to the nearest block of its
+    client, or the default block if the client does not specify one.
+    """
+    settings.VMS_ROUNDING_BLOCK_MINUTES = 15
+    start = timezone.now() - datetime.timedelta(hours=2)
+    default = time_record_factory(
+        time_end=start + datetime.timedelta(minutes=52, seconds=30),
+        time_start=start,
+    )
+    custom = time_record_factory(
+        time_end=start + datetime.timedelta(minutes=44),
+        time_start=start,
+    )
+    custom.employee.client.rounding_block_minutes = 30
+    custom.employee.client.save()
+
+    records = models.TimeRecord.objects.with_deltas(rounded=True)
+    rounded = {record.pk: record.rounded_delta for record in records}
+
+    assert rounded == {
+        default.pk: datetime.timedelta(hours=1),
+        custom.pk: datetime.timedelta(minutes=30),
+    }
+
+
+def test_queryset_with_deltas_rounded_filter(time_record_factory):
+    """
+    Records should be able to be filtered by their rounded delta.
+    """
+    start = timezone.now() - datetime.timedelta(hours=2)
+    short = time_record_factory(
+        time_end=start + datetime.timedelta(minutes=5),
+        time_start=start,
+    )
+    time_record_factory(
+        time_end=start + datetime.timedelta(minutes=10),
+        time_start=start,
+    )
+
+    records = models.TimeRecord.objects.with_deltas(rounded=True).filter(
+        rounded_delta=datetime.timedelta(0),
+    )
+
+    assert list(records) == [short]
+
+
+def test_queryset_time_by_day(time_record_factory):
+    """
+    Records crossing midnight in the provided time zone should be split
+    between the days they span.
+    """
+    tz = pytz.timezone('America/New_York')
+    start = tz.localize(datetime.datetime(2018, 3, 10, 22, 30))
+    record = time_record_factory(
+        time_end=start + datetime.timedelta(hours=6),
+        time_start=start,
+    )
+    time_record_factory(
+        employee=record.employee,
+        time_end=start + datetime.timedelta(hours=1),
+        time_start=start + datetime.timedelta(minutes=30),
+    )
+    time_record_factory(employee=record.employee, time_start=start)
+
+    totals = models.TimeRecord.objects.time_by_day('employee_id', tz=tz)
+
+    # The second day includes the start of daylight saving time.
+    assert totals == [
+        {
+            'day': datetime.date(2018, 3, 10),
+            'employee_id': record.employee_id,
+            'total_time': datetime.timedelta(hours=2),
+        },
+        {
+            'day': datetime.date(2018, 3, 11),
+            'employee_id': record.employee_id,
+            'total_time': datetime.timedelta(hours=4, minutes=30),
+        },
+    ]
+
+
+def test_queryset_time_by_day_query_count(
+        django_assert_num_queries,
+        time_record_factory):
+    """
+    The totals should be computed with one query for each day spanned by
+    the longest record, up to a limit that does not grow with the length
+    of the records.
+    """
+    start = pytz.utc.localize(datetime.datetime(2018, 1, 1, 9))
+    for _ in range(3):
+        time_record_factory(
+            time_end=start + datetime.timedelta(hours=8),
+            time_start=start,
+        )
+
+    with django_assert_num_queries(1):
+        models.TimeRecord.objects.time_by_day('employee_id', tz=pytz.utc)
+
+    time_record_factory(
+        time_end=start + datetime.timedelta(days=1),
+        time_start=start,
+    )
+
+    with django_assert_num_queries(2):
+        models.TimeRecord.objects.time_by_day('employee_id', tz=pytz.utc)
+
+    time_record_factory(
+        time_end=start + datetime.timedelta(days=90),
+        time_start=start,
+    )
+
+    with django_assert_num_queries(managers.TIME_BY_DAY_QUERY_DAYS + 1):
+        models.TimeRecord.objects.time_by_day('employee_id', tz=pytz.utc)
+
+
+def test_queryset_time_by_day_multiple_days(time_record_factory):
+    """
+    Records spanning several midnights should have each full day in
+    between attributed to that day.
+    """
+    tz = pytz.timezone('America/New_York')
+    start = tz.localize(datetime.datetime(2018, 3, 9, 22))
+    time_record_factory(
+        time_end=tz.localize(datetime.datetime(2018, 3, 12, 2)),
+        time_start=start,
+    )
+
+    totals = models.TimeRecord.objects.time_by_day(tz=tz)
+
+    # 2018-03-11 was shortened by the start of daylight saving time.
+    assert [(row['day'], row['total_time']) for row in totals] == [
+        (datetime.date(2018, 3, 9), datetime.timedelta(hours=2)),
+        (datetime.date(2018, 3, 10), datetime.timedelta(hours=24)),
+        (datetime.date(2018, 3, 11), datetime.timedelta(hours=23)),
+        (datetime.date(2018, 3, 12), datetime.timedelta(hours=2)),
+    ]
+
+
+def test_queryset_time_by_day_after_midnight_transition(
+        time_record_factory):
+    """
+    Records starting between midnight and a daylight saving time
+    transition should be split at the following midnight.
+    """
+    tz = pytz.timezone('America/New_York')
+    start = tz.localize(datetime.datetime(2018, 3, 11, 0, 30))
+    time_record_factory(
+        time_end=tz.localize(datetime.datetime(2018, 3, 12, 1)),
+        time_start=start,
+    )
+
+    totals = models.TimeRecord.objects.time_by_day(tz=tz)
+
+    # The clocks moved forward at 2:00 on 2018-03-11.
+    assert [(row['day'], row['total_time']) for row in totals] == [
+        (datetime.date(2018, 3, 11), datetime.timedelta(hours=22, minutes=30)),
+        (datetime.date(2018, 3, 12), datetime.timedelta(hours=1)),
+    ]
+
+
+def test_queryset_time_by_day_timezone(time_record_factory):
+    """
+    The same record should fall on different days in different time
+    zones.
+    """
+    start = pytz.utc.localize(datetime.datetime(2018, 1, 2, 2))
+    time_record_factory(
+        time_end=start + datetime.timedelta(hours=1),
+        time_start=start,
+    )
+
+    utc = models.TimeRecord.objects.time_by_day(tz=pytz.utc)
+    eastern = models.TimeRecord.objects.time_by_day(
+        tz=pytz.timezone('America/New_York'),
+    )
+
+    assert [row['day'] for row in utc] == [datetime.date(2018, 1, 2)]
+    assert [row['day'] for row in eastern] == [datetime.date(2018, 1, 1)]
+
+
+def test_queryset_time_by_week(time_record_factory):
+    """
+    Daily totals should be combined into weeks beginning on Monday.
+    """
+    # 2018-01-07 was a Sunday.
+    start = pytz.utc.localize(datetime.datetime(2018, 1, 7, 20))
+    time_record_factory(
+        time_end=start + datetime.timedelta(hours=8),
+        time_start=start,
+    )
+
+    totals = models.TimeRecord.objects.time_by_week(tz=pytz.utc)
+
+    assert totals == [
+        {
+            'week': datetime.date(2018, 1, 1),
+            'total_time': datetime.timedelta(hours=4),
+        },
+        {
+            'week': datetime.date(2018, 1, 8),
+            'total_time': datetime.timedelta(hours=4),
+        },
+    ]
+
+
 def test_queryset_total_time(time_record_factory):
     """
     This queryset method should return the sum of the deltas of each of
@@ -71,6 +558,25 @@ def test_queryset_total_time(time_record_factory):
     assert models.TimeRecord.objects.total_time() == expected
 
 
+def test_queryset_total_time_rounded(settings, time_record_factory):
+    """
+    Each record's duration should be rounded before the durations are
+    added up.
+    """
+    settings.VMS_ROUNDING_BLOCK_MINUTES = 15
+    start = timezone.now() - datetime.timedelta(hours=2)
+
+    for _ in range(3):
+        time_record_factory(
+            time_end=start + datetime.timedelta(minutes=5),
+            time_start=start,
+        )
+
+    total = models.TimeRecord.objects.total_time(rounded=True)
+
+    assert total == datetime.timedelta(0)
+
+
 def test_queryset_total_time_no_records(db):
     """
     If there are no time records, an empty timedelta should be returned.
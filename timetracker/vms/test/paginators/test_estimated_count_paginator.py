@@ -0,0 +1,39 @@
+from vms import models, paginators
+
+
+def test_count_list():
+    """
+    Objects that are not a queryset should be counted exactly.
+    """
+    paginator = paginators.EstimatedCountPaginator(list(range(5)), 2)
+
+    assert paginator.estimate_count() is None
+    assert paginator.count == 5
+
+
+def test_count_filtered(time_record_factory):
+    """
+    Filtered querysets should be counted exactly.
+    """
+    record = time_record_factory()
+    time_record_factory()
+    paginator = paginators.EstimatedCountPaginator(
+        models.TimeRecord.objects.filter(employee=record.employee),
+        10,
+    )
+
+    assert paginator.estimate_count() is None
+    assert paginator.count == 1
+
+
+def test_count_small_table(time_record_factory):
+    """
+    Tables that are not estimated to be large should be counted exactly.
+    """
+    time_record_factory()
+    paginator = paginators.EstimatedCountPaginator(
+        models.TimeRecord.objects.all(),
+        10,
+    )
+
+    assert paginator.count == 1
@@ -0,0 +1,183 @@
+import datetime
+
+import pytz
+
+from vms import pay
+
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+# 2018-01-01 was a Monday.
+MONDAY = (datetime.date(2018, 1, 1) - pay.EPOCH_DATE).days * DAY
+
+
+def compute(intervals, **kwargs):
+    """
+    Compute the pay hours of a list of ``(start, end)`` tuples, in UTC
+    unless another time zone is given.
+    """
+    kwargs.setdefault('tz', pytz.utc)
+    kwargs.setdefault('daily_overtime_hours', 0)
+    kwargs.setdefault('weekly_overtime_hours', 40)
+
+    starts = [start for start, _ in intervals]
+    ends = [end for _, end in intervals]
+
+    return pay.compute_pay_hours(starts, ends, **kwargs)
+
+
+def test_compute_pay_hours_empty():
+    """
+    If there are no intervals, there should be no days or weeks.
+    """
+    assert compute([]) == pay.PayHours(days=[], weeks=[])
+
+
+def test_compute_pay_hours_daily_overtime():
+    """
+    Time past the daily limit should be overtime.
+    """
+    start = MONDAY + 8 * HOUR
+    result = compute([(start, start + 10 * HOUR)], daily_overtime_hours=8)
+
+    assert result.days == [
+        pay.PayDay(
+            datetime.date(2018, 1, 1),
+            10 * HOUR,
+            8 * HOUR,
+            2 * HOUR,
+            10 * HOUR,
+        ),
+    ]
+
+
+def test_compute_pay_hours_midnight():
+    """
+    Intervals that cross midnight should be split between the days they
+    span, while billable time is attributed to the day they start.
+    """
+    start = MONDAY + 22 * HOUR
+    result = compute([(start, start + 4 * HOUR)])
+
+    assert [(day.date, day.worked, day.billable) for day in result.days] == [
+        (datetime.date(2018, 1, 1), 2 * HOUR, 4 * HOUR),
+        (datetime.date(2018, 1, 2), 2 * HOUR, 0),
+    ]
+
+
+def test_compute_pay_hours_dst_end():
+    """
+    Shifts spanning the end of daylight saving time should be paid for
+    the time actually elapsed.
+    """
+    tz = pytz.timezone('America/New_York')
+    start = tz.localize(datetime.datetime(2026, 11, 1)).timestamp()
+    end = tz.localize(datetime.datetime(2026, 11, 1, 8)).timestamp()
+
+    result = compute([(start, end)], daily_overtime_hours=8, tz=tz)
+
+    assert result.days == [
+        pay.PayDay(
+            datetime.date(2026, 11, 1),
+            9 * HOUR,
+            8 * HOUR,
+            HOUR,
+            9 * HOUR,
+        ),
+    ]
+
+
+def test_compute_pay_hours_dst_start_midnight():
+    """
+    Shifts crossing midnight on a day shortened by daylight saving time
+    should be split at local midnight.
+    """
+    tz = pytz.timezone('America/New_York')
+    start = tz.localize(datetime.datetime(2026, 3, 7, 22)).timestamp()
+    end = tz.localize(datetime.datetime(2026, 3, 8, 6)).timestamp()
+
+    result = compute([(start, end)], tz=tz)
+
+    assert [(day.date, day.worked) for day in result.days] == [
+        (datetime.date(2026, 3, 7), 2 * HOUR),
+        (datetime.date(2026, 3, 8), 5 * HOUR),
+    ]
+
+
+def test_compute_pay_hours_rounding():
+    """
+    The billable time of each record should be rounded individually.
+    """
+    start = MONDAY + 8 * HOUR
+    intervals = [
+        (start, start + 7 * 60),
+        (start + HOUR, start + HOUR + 8 * 60),
+    ]
+
+    result = compute(intervals)
+
+    assert result.days[0].worked == 15 * 60
+    assert result.days[0].billable == 15 * 60
+
+
+def test_compute_pay_hours_weekly_overtime():
+    """
+    Regular time past the weekly limit should be overtime, assigned to
+    the day the limit was exceeded.
+    """
+    intervals = [
+        (MONDAY + day * DAY, MONDAY + day * DAY + 9 * HOUR)
+        for day in range(5)
+    ]
+
+    result = compute(intervals)
+
+    assert [day.overtime for day in result.days] == [0, 0, 0, 0, 5 * HOUR]
+    assert result.weeks == [
+        pay.PayWeek(
+            datetime.date(2018, 1, 1),
+            45 * HOUR,
+            40 * HOUR,
+            5 * HOUR,
+            45 * HOUR,
+        ),
+    ]
+
+
+def test_compute_pay_hours_weekly_overtime_excludes_daily():
+    """
+    Time that is already daily overtime should not count towards the
+    weekly limit.
+    """
+    intervals = [
+        (MONDAY + day * DAY, MONDAY + day * DAY + 10 * HOUR)
+        for day in range(5)
+    ]
+
+    result = compute(intervals, daily_overtime_hours=8)
+
+    assert result.weeks[0].regular == 40 * HOUR
+    assert result.weeks[0].overtime == 10 * HOUR
+
+
+def test_compute_pay_hours_week_start():
+    """
+    Weeks should begin on the configured day.
+    """
+    sunday = MONDAY - DAY
+    intervals = [
+        (sunday, sunday + HOUR),
+        (MONDAY, MONDAY + HOUR),
+    ]
+
+    monday_weeks = compute(intervals).weeks
+    sunday_weeks = compute(intervals, week_start=6).weeks
+
+    assert [week.start for week in monday_weeks] == [
+        datetime.date(2017, 12, 25),
+        datetime.date(2018, 1, 1),
+    ]
+    assert [week.start for week in sunday_weeks] == [
+        datetime.date(2017, 12, 31),
+    ]
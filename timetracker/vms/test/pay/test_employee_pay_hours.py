@@ -0,0 +1,80 @@
+import datetime
+
+import pytz
+
+from vms import pay
+
+
+def test_employee_pay_hours(time_record_factory):
+    """
+    The employee's completed records in the period should be bucketed
+    by day in the provided time zone.
+    """
+    tz = pytz.timezone('America/New_York')
+    start = tz.localize(datetime.datetime(2018, 1, 1, 22))
+    record = time_record_factory(
+        time_end=start + datetime.timedelta(hours=4),
+        time_start=start,
+    )
+    time_record_factory(employee=record.employee, time_start=start)
+    time_record_factory(
+        employee=record.employee,
+        time_end=start - datetime.timedelta(days=1, hours=-1),
+        time_start=start - datetime.timedelta(days=1),
+    )
+
+    result = pay.employee_pay_hours(
+        record.employee,
+        start - datetime.timedelta(hours=1),
+        start + datetime.timedelta(days=1),
+        tz=tz,
+        daily_overtime_hours=0,
+        weekly_overtime_hours=40,
+    )
+
+    assert [(day.date, day.worked) for day in result.days] == [
+        (datetime.date(2018, 1, 1), 2 * 60 * 60),
+        (datetime.date(2018, 1, 2), 2 * 60 * 60),
+    ]
+
+
+def test_employee_pay_hours_rounding_block(time_record_factory):
+    """
+    Billable time should be rounded to the rounding block of the
+    employee's client, matching the rounded total of the records.
+    """
+    start = pytz.utc.localize(datetime.datetime(2018, 1, 1, 9))
+    record = time_record_factory(
+        employee__client__rounding_block_minutes=30,
+        time_end=start + datetime.timedelta(minutes=50),
+        time_start=start,
+    )
+
+    result = pay.employee_pay_hours(
+        record.employee,
+        start,
+        start + datetime.timedelta(days=1),
+        tz=pytz.utc,
+    )
+    rounded = record.employee.time_records.total_time(rounded=True)
+
+    assert [day.billable for day in result.days] == [60 * 60]
+    assert rounded == datetime.timedelta(hours=1)
+
+
+def test_load_intervals(time_record_factory):
+    """
+    The loaded times should be seconds since the epoch, regardless of
+    the time zone days are determined in.
+    """
+    tz = pytz.timezone('America/New_York')
+    start = tz.localize(datetime.datetime(2018, 7, 1, 9))
+    record = time_record_factory(
+        time_end=start + datetime.timedelta(hours=1),
+        time_start=start,
+    )
+
+    starts, ends = pay.load_intervals(record.employee.time_records.all())
+
+    assert list(starts) == [start.timestamp()]
+    assert list(ends) == [start.timestamp() + 60 * 60]
@@ -0,0 +1,131 @@
+import json
+import logging
+
+import pytest
+from django.contrib.auth import get_user_model
+
+from vms import perf
+
+
+@pytest.fixture(autouse=True)
+def perf_caplog(caplog):
+    """
+    Fixture to capture the records of the performance logger, which does
+    not propagate to the root logger.
+    """
+    logger = logging.getLogger('vms.perf')
+    logger.addHandler(caplog.handler)
+    caplog.set_level(logging.INFO, logger='vms.perf')
+
+    yield caplog
+
+    logger.removeHandler(caplog.handler)
+
+
+@pytest.fixture
+def sample_all(settings):
+    """
+    Fixture to record every span.
+    """
+    settings.VMS_PERF_SAMPLE_RATE = 1
+
+
+def span_records(caplog):
+    """
+    Get the data of the spans that were logged.
+    """
+    return [
+        record.span for record in caplog.records
+        if record.name == 'vms.perf'
+    ]
+
+
+@pytest.mark.django_db
+def test_span_logged(caplog, sample_all):
+    """
+    A sampled span should log its duration, query count, and fields.
+    """
+    with perf.Span('operation', client_id=1) as fields:
+        get_user_model().objects.count()
+        get_user_model().objects.count()
+        fields['result'] = 'done'
+
+    (data,) = span_records(caplog)
+
+    assert data['name'] == 'operation'
+    assert data['client_id'] == 1
+    assert data['result'] == 'done'
+    assert data['queries'] == 2
+    assert data['status'] == 'ok'
+    assert data['duration_ms'] >= 0
+
+
+def test_span_error(caplog, sample_all):
+    """
+    A span whose operation fails should record the error and let it
+    propagate.
+    """
+    with pytest.raises(ValueError):
+        with perf.Span('operation'):
+            raise ValueError
+
+    (data,) = span_records(caplog)
+
+    assert data['status'] == 'error'
+    assert data['error'] == 'ValueError'
+
+
+def test_span_not_sampled(caplog, settings):
+    """
+    Spans should not be logged if sampling is disabled.
+    """
+    settings.VMS_PERF_SAMPLE_RATE = 0
+    with perf.Span('operation'):
+        pass
+
+    assert span_records(caplog) == []
+
+
+def test_nested_spans_follow_outer(caplog, settings):
+    """
+    Nested spans should follow the sampling decision of the outermost
+    span.
+    """
+    settings.VMS_PERF_SAMPLE_RATE = 1
+    with perf.Span('outer'):
+        settings.VMS_PERF_SAMPLE_RATE = 0
+        with perf.Span('inner'):
+            pass
+
+    assert [data['name'] for data in span_records(caplog)] == [
+        'inner',
+        'outer',
+    ]
+
+
+def test_timed(caplog, sample_all):
+    """
+    Decorated functions should be timed on each call.
+    """
+    @perf.timed('double')
+    def double(value):
+        return value * 2
+
+    assert double(2) == 4
+    assert [data['name'] for data in span_records(caplog)] == ['double']
+
+
+def test_json_formatter():
+    """
+    Span records should be formatted as a single JSON object.
+    """
+    record = logging.LogRecord(
+        'vms.perf', logging.INFO, __file__, 1, 'operation', (), None,
+    )
+    record.span = {'duration_ms': 1.5, 'name': 'operation'}
+
+    data = json.loads(perf.JSONFormatter().format(record))
+
+    assert data['duration_ms'] == 1.5
+    assert data['logger'] == 'vms.perf'
+    assert data['message'] == 'operation'
@@ -0,0 +1,79 @@
+import datetime
+import decimal
+
+import pytest
+from django.utils import timezone
+
+from vms import models, reports
+
+
+def test_billing_rows(settings, time_record_factory):
+    """
+    Records of the same client, job, and period should be combined into
+    a single row with the markup applied to their pay.
+    """
+    settings.VMS_ROUNDING_BLOCK_MINUTES = 15
+    start = timezone.make_aware(datetime.datetime(2018, 1, 1, 9))
+    record = time_record_factory(
+        pay_rate=10,
+        time_end=start + datetime.timedelta(hours=1, minutes=10),
+        time_start=start,
+    )
+    time_record_factory(
+        employee=record.employee,
+        job=record.job,
+        pay_rate=20,
+        time_end=start + datetime.timedelta(hours=3),
+        time_start=start + datetime.timedelta(hours=2),
+    )
+
+    rows = list(reports.billing_rows(
+        models.TimeRecord.objects.all(),
+        decimal.Decimal('10'),
+        'day',
+    ))
+
+    assert rows == [(
+        record.employee.client.name,
+        record.job.name,
+        '2018-01-01',
+        2,
+        decimal.Decimal('2.17'),
+        decimal.Decimal('2.25'),
+        decimal.Decimal('32.50'),
+        decimal.Decimal('10'),
+        decimal.Decimal('35.75'),
+    )]
+
+
+def test_billing_rows_query_count(
+        django_assert_num_queries,
+        time_record_factory):
+    """
+    The report should be computed in a single query regardless of the
+    number of clients and jobs.
+    """
+    for _ in range(3):
+        time_record_factory(time_end=timezone.now())
+
+    with django_assert_num_queries(1):
+        rows = list(reports.billing_rows(models.TimeRecord.objects.all(), 0))
+
+    assert len(rows) == 3
+
+
+def test_billing_rows_unknown_period(db):
+    """
+    Requesting an unknown period should raise an error.
+    """
+    with pytest.raises(ValueError):
+        list(reports.billing_rows(models.TimeRecord.objects.all(), 0, 'foo'))
+
+
+def test_stream_csv():
+    """
+    Each row should be yielded as a line of CSV.
+    """
+    lines = list(reports.stream_csv(('a', 'b'), [(1, 'x,y')]))
+
+    assert lines == ['a,b\r\n', '1,"x,y"\r\n']
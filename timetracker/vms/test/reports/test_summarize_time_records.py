@@ -0,0 +1,106 @@
+import datetime
+import decimal
+
+import pytest
+from django.utils import timezone
+
+from vms import models, reports
+
+
+def create_records(time_record_factory):
+    """
+    Create records for two jobs of one employee, one of which is worked
+    at two pay rates.
+    """
+    start = timezone.now() - datetime.timedelta(days=1)
+    first = time_record_factory(
+        pay_rate=10,
+        time_end=start + datetime.timedelta(hours=1),
+        time_start=start,
+    )
+    time_record_factory(
+        employee=first.employee,
+        job=first.job,
+        pay_rate=20,
+        time_end=start + datetime.timedelta(hours=3),
+        time_start=start + datetime.timedelta(hours=2),
+    )
+    second = time_record_factory(
+        employee=first.employee,
+        pay_rate=15,
+        time_end=start + datetime.timedelta(hours=4, minutes=8),
+        time_start=start + datetime.timedelta(hours=4),
+    )
+    # Open records are ignored.
+    time_record_factory(employee=first.employee, time_start=start)
+
+    return first, second
+
+
+def test_summarize_by_job(time_record_factory):
+    """
+    Rows of the same job at different pay rates should be combined.
+    """
+    first, second = create_records(time_record_factory)
+
+    rows = reports.summarize_time_records(
+        models.TimeRecord.objects.all(),
+        'job',
+    )
+    by_key = {row['key']: row for row in rows}
+
+    assert by_key[first.job_id]['earnings'] == decimal.Decimal('30.00')
+    assert by_key[first.job_id]['label'] == first.job.name
+    assert by_key[first.job_id]['record_count'] == 2
+    assert by_key[first.job_id]['total_time'] == datetime.timedelta(hours=2)
+    assert by_key[second.job_id]['billable_time'] == datetime.timedelta(
+        minutes=15,
+    )
+    # Earnings are paid on the rounded time, as in the billing report.
+    assert by_key[second.job_id]['earnings'] == decimal.Decimal('3.75')
+
+
+@pytest.mark.parametrize('grouping', reports.GROUPINGS.keys())
+def test_summarize_query_count(
+        django_assert_num_queries,
+        grouping,
+        time_record_factory):
+    """
+    Each grouping should be computed in a single query.
+    """
+    create_records(time_record_factory)
+
+    with django_assert_num_queries(1):
+        rows = reports.summarize_time_records(
+            models.TimeRecord.objects.all(),
+            grouping,
+        )
+
+    total = sum((row['total_time'] for row in rows), datetime.timedelta(0))
+
+    assert total == datetime.timedelta(hours=2, minutes=8)
+
+
+def test_summarize_by_week(time_record_factory):
+    """
+    Weeks should be labelled with the date they begin on.
+    """
+    record, _ = create_records(time_record_factory)
+
+    rows = reports.summarize_time_records(
+        models.TimeRecord.objects.filter(pk=record.pk),
+        'week',
+    )
+    local_start = timezone.localtime(record.time_start).date()
+
+    assert [row['label'] for row in rows] == [
+        local_start - datetime.timedelta(days=local_start.weekday()),
+    ]
+
+
+def test_summarize_unknown_grouping(db):
+    """
+    Requesting an unknown grouping should raise an error.
+    """
+    with pytest.raises(ValueError):
+        reports.summarize_time_records(models.TimeRecord.objects.all(), 'foo')
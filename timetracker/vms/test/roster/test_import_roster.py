@@ -0,0 +1,98 @@
+from django.contrib.auth import get_user_model
+
+from vms import models, roster
+
+
+def test_import_roster(
+        client_factory,
+        staffing_agency_admin_factory,
+        staffing_agency_employee_factory):
+    """
+    New users and agency employees should be created for new workers,
+    and every worker should apply to the client.
+    """
+    admin = staffing_agency_admin_factory()
+    client = client_factory()
+    existing = staffing_agency_employee_factory(agency=admin.agency)
+    rows = [
+        roster.RosterRow(2, 'Jane Doe', 'jdoe', 'UTC'),
+        roster.RosterRow(3, '', existing.user.username, ''),
+    ]
+
+    result = roster.import_roster(admin.agency, client, rows, admin=admin)
+
+    assert result.errors == []
+    assert len(result.employees) == 2
+
+    user = get_user_model().objects.get(username='jdoe')
+    agency_employee = models.StaffingAgencyEmployee.objects.get(user=user)
+
+    assert user.name == 'Jane Doe'
+    assert user.timezone == 'UTC'
+    assert not user.has_usable_password()
+    assert agency_employee.approved_by == admin
+    assert agency_employee.is_approved
+
+    employees = models.Employee.objects.filter(client=client)
+    employee_ids = {employee.employee_id for employee in employees}
+
+    assert {employee.user for employee in employees} == {user, existing.user}
+    assert len(employee_ids) == 2
+    assert all(not employee.is_active for employee in employees)
+
+
+def test_import_roster_errors(
+        client_factory,
+        employee_factory,
+        staffing_agency_admin_factory,
+        user_factory):
+    """
+    If any row is invalid, nothing should be imported and each problem
+    should be reported with its line.
+    """
+    admin = staffing_agency_admin_factory()
+    client = client_factory()
+    placed = employee_factory(client=client)
+    models.StaffingAgencyEmployee.objects.create(
+        agency=admin.agency,
+        user=placed.user,
+    )
+    outsider = user_factory()
+    rows = [
+        roster.RosterRow(2, 'Jane Doe', 'jdoe', ''),
+        roster.RosterRow(3, 'Jane Doe', 'jdoe', ''),
+        roster.RosterRow(4, 'Someone', outsider.username, ''),
+        roster.RosterRow(5, 'Someone', placed.user.username, ''),
+        roster.RosterRow(6, '', 'noname', ''),
+        roster.RosterRow(7, 'Bad Zone', 'badzone', 'Nowhere/Else'),
+        roster.RosterRow(8, 'No Username', '', ''),
+    ]
+    user_count = get_user_model().objects.count()
+
+    result = roster.import_roster(admin.agency, client, rows, admin=admin)
+
+    assert result.employees == []
+    assert [error.line for error in result.errors] == [3, 4, 5, 6, 7, 8]
+    assert get_user_model().objects.count() == user_count
+    assert models.Employee.objects.filter(client=client).count() == 1
+
+
+def test_import_roster_query_count(
+        client_factory,
+        django_assert_max_num_queries,
+        staffing_agency_admin_factory):
+    """
+    The number of queries should not depend on the size of the roster.
+    """
+    admin = staffing_agency_admin_factory()
+    client = client_factory()
+    rows = [
+        roster.RosterRow(i + 2, f'Worker {i}', f'worker{i}', '')
+        for i in range(50)
+    ]
+
+    with django_assert_max_num_queries(10):
+        result = roster.import_roster(admin.agency, client, rows, admin=admin)
+
+    assert len(result.employees) == 50
+    assert models.Employee.objects.filter(client=client).count() == 50
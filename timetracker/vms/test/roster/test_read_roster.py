@@ -0,0 +1,43 @@
+import io
+
+import pytest
+
+from vms import roster
+
+
+def test_read_roster():
+    """
+    Each non-blank row should be read, regardless of the case of the
+    column names.
+    """
+    roster_file = io.BytesIO(
+        b'\xef\xbb\xbfName,Username,Timezone\n'
+        b'Jane Doe,jdoe,UTC\n'
+        b',,\n'
+        b' John Smith , jsmith ,\n'
+    )
+
+    assert roster.read_roster(roster_file) == [
+        roster.RosterRow(2, 'Jane Doe', 'jdoe', 'UTC'),
+        roster.RosterRow(4, 'John Smith', 'jsmith', ''),
+    ]
+
+
+def test_read_roster_missing_column():
+    """
+    Rosters without a required column should be rejected.
+    """
+    roster_file = io.BytesIO(b'name\nJane Doe\n')
+
+    with pytest.raises(ValueError):
+        roster.read_roster(roster_file)
+
+
+def test_read_roster_invalid_encoding():
+    """
+    Rosters that are not encoded as UTF-8 should be rejected.
+    """
+    roster_file = io.BytesIO(b'name,username\n\xff\xfe,jdoe\n')
+
+    with pytest.raises(ValueError):
+        roster.read_roster(roster_file)
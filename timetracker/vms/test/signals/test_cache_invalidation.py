@@ -0,0 +1,99 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from vms import cache, models
+
+
+def client_key(client):
+    return cache.make_key(cache.CLIENT_NAMESPACE, client.pk, 'test')
+
+
+def employee_key(employee):
+    return cache.make_key(cache.EMPLOYEE_NAMESPACE, employee.pk, 'test')
+
+
+def test_client_save(client_factory):
+    """
+    Saving a client should invalidate its cache.
+    """
+    client = client_factory()
+    key = client_key(client)
+
+    client.save()
+
+    assert client_key(client) != key
+
+
+def test_client_job_delete(client_job_factory):
+    """
+    Deleting a job should invalidate its client's cache.
+    """
+    job = client_job_factory()
+    key = client_key(job.client)
+
+    job.delete()
+
+    assert client_key(job.client) != key
+
+
+def test_employee_save(employee_factory):
+    """
+    Saving an employee should invalidate the cache for the employee and
+    their client.
+    """
+    employee = employee_factory()
+    keys = (client_key(employee.client), employee_key(employee))
+
+    employee.save()
+
+    assert client_key(employee.client) != keys[0]
+    assert employee_key(employee) != keys[1]
+
+
+def test_time_record_save(time_record_factory):
+    """
+    Saving a time record should invalidate the cache for its employee
+    and their client.
+    """
+    record = time_record_factory()
+    keys = (client_key(record.employee.client), employee_key(record.employee))
+
+    record.save()
+
+    assert client_key(record.employee.client) != keys[0]
+    assert employee_key(record.employee) != keys[1]
+
+
+def test_time_record_approval_create(
+        time_record_approval_factory,
+        time_record_factory):
+    """
+    Approving a time record should invalidate the cache for the
+    record's employee.
+    """
+    record = time_record_factory()
+    key = employee_key(record.employee)
+
+    time_record_approval_factory(time_record=record)
+
+    assert employee_key(record.employee) != key
+
+
+def test_time_record_save_fetches_client_id(time_record_factory):
+    """
+    Saving a time record whose employee is not loaded should only fetch
+    the employee's client ID, once, for both the cache invalidation and
+    the change log.
+    """
+    record = models.TimeRecord.objects.get(pk=time_record_factory().pk)
+
+    with CaptureQueriesContext(connection) as context:
+        record.save()
+
+    employee_queries = [
+        query['sql'] for query in context.captured_queries
+        if 'FROM "vms_employee"' in query['sql']
+    ]
+
+    assert len(employee_queries) == 1
+    assert not models.TimeRecord.employee.is_cached(record)
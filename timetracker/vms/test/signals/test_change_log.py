@@ -0,0 +1,91 @@
+import datetime
+from unittest import mock
+
+import pytest
+from django.db import DatabaseError
+
+from vms import models
+
+
+def get_actions(time_record_id):
+    return list(
+        models.TimeRecordChange.objects.filter(
+            time_record_id=time_record_id,
+        ).values_list('action', flat=True),
+    )
+
+
+def test_approval(time_record_approval_factory):
+    """
+    Approving a time record and removing the approval should be logged.
+    """
+    approval = time_record_approval_factory()
+    record_id = approval.time_record.id
+    approval.delete()
+
+    assert get_actions(record_id) == [
+        models.TimeRecordChange.ACTION_CREATED,
+        models.TimeRecordChange.ACTION_APPROVED,
+        models.TimeRecordChange.ACTION_UNAPPROVED,
+    ]
+
+
+def test_create_update_delete(time_record_factory):
+    """
+    Creating, updating, and deleting a time record should each be
+    logged.
+    """
+    record = time_record_factory()
+    record.save()
+    record_id = record.id
+    record.delete()
+
+    assert get_actions(record_id) == [
+        models.TimeRecordChange.ACTION_CREATED,
+        models.TimeRecordChange.ACTION_UPDATED,
+        models.TimeRecordChange.ACTION_DELETED,
+    ]
+
+
+def test_log_failure_rolls_back_save(time_record_factory):
+    """
+    A time record should not be saved if its change cannot be logged.
+    """
+    record = time_record_factory(time_end=None)
+    record.time_end = record.time_start + datetime.timedelta(hours=1)
+
+    with mock.patch.object(
+            models.TimeRecordChange,
+            'log',
+            side_effect=DatabaseError,
+    ):
+        with pytest.raises(DatabaseError):
+            record.save()
+
+    record.refresh_from_db()
+
+    assert record.time_end is None
+
+
+def test_log_failure_rolls_back_approval(
+        time_record_factory,
+        user_factory):
+    """
+    An approval should not be saved if its change cannot be logged.
+    """
+    record = time_record_factory()
+
+    with mock.patch.object(
+            models.TimeRecordChange,
+            'log',
+            side_effect=DatabaseError,
+    ):
+        with pytest.raises(DatabaseError):
+            models.TimeRecordApproval.objects.create(
+                time_record=record,
+                user=user_factory(),
+            )
+
+    assert not models.TimeRecordApproval.objects.filter(
+        time_record=record,
+    ).exists()
@@ -0,0 +1,94 @@
+import json
+from unittest import mock
+
+import pytest
+from django.utils import timezone
+
+from vms import events, models
+
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture
+def subscriber(employee_factory):
+    """
+    Fixture providing an employee and a subscription to their client's
+    clock events. Events are only published once the saving transaction
+    commits, so these tests require a transactional database.
+    """
+    employee = employee_factory()
+    channel = events.client_channel(employee.client.id)
+
+    with events.clock_events.subscribe(channel) as queue:
+        yield employee, queue
+
+
+def test_clock_in(subscriber, time_record_factory):
+    """
+    Creating an open time record should publish a clock in event.
+    """
+    employee, queue = subscriber
+    record = time_record_factory(employee=employee)
+
+    event = queue.get_nowait()
+
+    assert event['type'] == events.CLOCK_IN
+    assert event['employee_id'] == employee.employee_id
+    assert event['time_record'] == record.id
+
+
+def test_clock_out(subscriber, time_record_factory):
+    """
+    Setting the end time of an open time record should publish a clock
+    out event.
+    """
+    employee, queue = subscriber
+    time_record_factory(employee=employee)
+    queue.get_nowait()
+
+    record = models.TimeRecord.objects.get(time_end=None)
+    record.time_end = timezone.now()
+    record.save()
+
+    event = queue.get_nowait()
+
+    assert event['type'] == events.CLOCK_OUT
+    assert event['time'] == record.time_end
+
+
+def test_update_closed_record(subscriber, time_record_factory):
+    """
+    Modifying a closed time record should not publish an event.
+    """
+    employee, queue = subscriber
+    time_record_factory(employee=employee, time_end=timezone.now())
+
+    record = models.TimeRecord.objects.get()
+    record.pay_rate = 20
+    record.save()
+
+    assert queue.empty()
+
+
+def test_clock_in_postgresql(employee_factory, time_record_factory):
+    """
+    On PostgreSQL the event should be sent as a notification so it
+    reaches the watchers connected to every process.
+    """
+    employee = employee_factory()
+    record = time_record_factory(employee=employee)
+    connection = mock.MagicMock(vendor='postgresql')
+    cursor = connection.cursor.return_value.__enter__.return_value
+
+    with mock.patch.object(events, 'connection', connection):
+        events.publish_clock_event(events.CLOCK_IN, record)
+
+    (sql, (channel, payload)), _ = cursor.execute.call_args
+    message = json.loads(payload)
+
+    assert sql == 'SELECT pg_notify(%s, %s)'
+    assert channel == events.NOTIFY_CHANNEL
+    assert message['channel'] == events.client_channel(employee.client.id)
+    assert message['event']['type'] == events.CLOCK_IN
+    assert message['event']['time_record'] == str(record.id)
@@ -0,0 +1,47 @@
+from vms import time_utils
+
+
+def test_find_overlaps_groups():
+    """
+    Intervals in different groups should not be compared.
+    """
+    intervals = [
+        ('a', 1, 0, 10),
+        ('b', 2, 5, 15),
+    ]
+
+    assert list(time_utils.find_overlaps(intervals)) == []
+
+
+def test_find_overlaps_nested():
+    """
+    An interval should be compared to the earlier interval that ends
+    last, even if intervals in between end earlier.
+    """
+    intervals = [
+        ('a', 1, 0, 10),
+        ('b', 1, 2, 3),
+        ('c', 1, 4, 5),
+        ('d', 1, 10, 12),
+    ]
+
+    assert list(time_utils.find_overlaps(intervals)) == [
+        ('b', 'a'),
+        ('c', 'a'),
+    ]
+
+
+def test_find_overlaps_open_interval():
+    """
+    An interval without an end should overlap every later interval.
+    """
+    intervals = [
+        ('a', 1, 0, None),
+        ('b', 1, 5, 6),
+        ('c', 1, 7, None),
+    ]
+
+    assert list(time_utils.find_overlaps(intervals)) == [
+        ('b', 'a'),
+        ('c', 'a'),
+    ]
@@ -0,0 +1,33 @@
+import datetime
+
+import pytz
+
+from vms import time_utils
+
+
+def test_split_by_local_day():
+    """
+    A period should be split at each local midnight, with days shortened
+    by daylight saving time measured in elapsed time.
+    """
+    tz = pytz.timezone('America/New_York')
+    start = tz.localize(datetime.datetime(2018, 3, 10, 22))
+    end = tz.localize(datetime.datetime(2018, 3, 12, 1))
+
+    assert list(time_utils.split_by_local_day(start, end, tz)) == [
+        (datetime.date(2018, 3, 10), datetime.timedelta(hours=2)),
+        (datetime.date(2018, 3, 11), datetime.timedelta(hours=23)),
+        (datetime.date(2018, 3, 12), datetime.timedelta(hours=1)),
+    ]
+
+
+def test_split_by_local_day_same_day():
+    """
+    A period within a single day should not be split.
+    """
+    start = pytz.utc.localize(datetime.datetime(2018, 1, 1, 9))
+    end = start + datetime.timedelta(hours=8)
+
+    assert list(time_utils.split_by_local_day(start, end, pytz.utc)) == [
+        (datetime.date(2018, 1, 1), datetime.timedelta(hours=8)),
+    ]
@@ -0,0 +1,37 @@
+from django.urls import reverse
+
+
+def test_GET_as_admin(client, client_admin_factory):
+    """
+    Client admins should receive an event stream starting with a
+    snapshot of the employees on shift.
+    """
+    admin = client_admin_factory()
+    url = reverse('vms:client-clock-events', kwargs={
+        'client_slug': admin.client.slug,
+    })
+
+    client.force_login(admin.user)
+    response = client.get(url)
+    first_message = next(iter(response.streaming_content))
+    response.close()
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'text/event-stream'
+    assert response['Cache-Control'] == 'no-cache'
+    assert first_message == b'event: snapshot\ndata: []\n\n'
+
+
+def test_GET_non_admin(client, client_factory, user_factory):
+    """
+    Users who are not admins of the client should receive a 404
+    response.
+    """
+    url = reverse('vms:client-clock-events', kwargs={
+        'client_slug': client_factory().slug,
+    })
+
+    client.force_login(user_factory())
+    response = client.get(url)
+
+    assert response.status_code == 404
@@ -34,3 +34,25 @@ def test_GET_other_user(client, client_factory, user_factory):
     response = client.get(url)
 
     assert response.status_code == 404
+
+
+def test_GET_new_job_after_cached(
+        client,
+        client_admin_factory,
+        client_job_factory):
+    """
+    Creating a new job should invalidate the cached job list.
+    """
+    admin = client_admin_factory()
+    client.force_login(admin.user)
+
+    client_company = admin.client
+    client_job_factory(client=client_company)
+
+    url = client_company.job_list_url
+    client.get(url)
+
+    job = client_job_factory(client=client_company)
+    response = client.get(url)
+
+    assert job.name in response.content.decode()
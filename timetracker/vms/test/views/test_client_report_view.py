@@ -0,0 +1,123 @@
+import datetime
+
+import pytest
+import pytz
+from django.urls import reverse
+from django.utils import timezone
+
+
+@pytest.mark.integration
+def test_get_as_admin(client, client_admin_factory, time_record_factory):
+    """
+    Client admins should see the report grouped by the requested
+    grouping.
+    """
+    admin = client_admin_factory()
+    start = timezone.now() - datetime.timedelta(hours=2)
+    record = time_record_factory(
+        employee__client=admin.client,
+        time_end=start + datetime.timedelta(hours=1),
+        time_start=start,
+    )
+    url = reverse('vms:client-report', kwargs={
+        'client_slug': admin.client.slug,
+    })
+
+    client.force_login(admin.user)
+    response = client.get(url, {'group_by': 'employee'})
+
+    assert response.status_code == 200
+    assert response.context_data['grouping'] == 'employee'
+    assert [row['key'] for row in response.context_data['rows']] == [
+        record.employee.pk,
+    ]
+    assert response.context_data['total_time'] == datetime.timedelta(hours=1)
+
+
+@pytest.mark.integration
+def test_get_invalidated(client, client_admin_factory, time_record_factory):
+    """
+    Cached reports should be invalidated when the client's time records
+    change.
+    """
+    admin = client_admin_factory()
+    start = timezone.now() - datetime.timedelta(hours=2)
+    record = time_record_factory(
+        employee__client=admin.client,
+        time_end=start + datetime.timedelta(hours=1),
+        time_start=start,
+    )
+    url = reverse('vms:client-report', kwargs={
+        'client_slug': admin.client.slug,
+    })
+    client.force_login(admin.user)
+    before = client.get(url).context_data['rows']
+    record.time_end = start + datetime.timedelta(hours=2)
+    record.save()
+    updated = client.get(url).context_data['rows']
+
+    assert before[0]['total_time'] == datetime.timedelta(hours=1)
+    assert updated[0]['total_time'] == datetime.timedelta(hours=2)
+
+
+@pytest.mark.integration
+def test_get_time_zones(client, client_admin_factory, time_record_factory):
+    """
+    Admins in different time zones should each see days bucketed in
+    their own time zone rather than a cached report for another zone.
+    """
+    admin = client_admin_factory(user__timezone='UTC')
+    other_admin = client_admin_factory(
+        client=admin.client,
+        user__timezone='America/New_York',
+    )
+    start = pytz.utc.localize(datetime.datetime(2018, 10, 1, 3))
+    time_record_factory(
+        employee__client=admin.client,
+        time_end=start + datetime.timedelta(hours=1),
+        time_start=start,
+    )
+    url = reverse('vms:client-report', kwargs={
+        'client_slug': admin.client.slug,
+    })
+
+    client.force_login(admin.user)
+    rows = client.get(url, {'group_by': 'day'}).context_data['rows']
+    client.logout()
+    client.force_login(other_admin.user)
+    other_rows = client.get(url, {'group_by': 'day'}).context_data['rows']
+
+    assert [row['key'] for row in rows] == [datetime.date(2018, 10, 1)]
+    assert [row['key'] for row in other_rows] == [
+        datetime.date(2018, 9, 30),
+    ]
+
+
+@pytest.mark.integration
+def test_get_as_other_user(client, client_factory, user_factory):
+    """
+    Users who are not admins of the client should receive a 404.
+    """
+    company = client_factory()
+    url = reverse('vms:client-report', kwargs={'client_slug': company.slug})
+
+    client.force_login(user_factory())
+    response = client.get(url)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_get_unknown_grouping(client, client_admin_factory):
+    """
+    An unknown grouping should fall back to the default.
+    """
+    admin = client_admin_factory()
+    url = reverse('vms:client-report', kwargs={
+        'client_slug': admin.client.slug,
+    })
+
+    client.force_login(admin.user)
+    response = client.get(url, {'group_by': 'foo'})
+
+    assert response.context_data['grouping'] == 'job'
@@ -0,0 +1,76 @@
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+
+def get_url(client_company):
+    return reverse('vms:on-shift-board', kwargs={
+        'client_slug': client_company.slug,
+    })
+
+
+@pytest.mark.integration
+def test_GET_as_other_user(client, client_factory, user_factory):
+    """
+    Users who are not admins of the client should receive a 404
+    response.
+    """
+    client.force_login(user_factory())
+
+    response = client.get(get_url(client_factory()))
+
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_GET_as_supervisor(
+        client,
+        client_admin_factory,
+        django_assert_max_num_queries,
+        time_record_factory):
+    """
+    The board should list the client's open time records using a
+    constant number of queries.
+    """
+    admin = client_admin_factory()
+    open_records = [
+        time_record_factory(employee__client=admin.client)
+        for _ in range(3)
+    ]
+    time_record_factory(employee__client=admin.client, time_end=timezone.now())
+    time_record_factory()
+
+    client.force_login(admin.user)
+    # The first request after logging in also updates the session.
+    client.get(get_url(admin.client))
+
+    # Session, user, ETag, client, and time records.
+    with django_assert_max_num_queries(5):
+        response = client.get(get_url(admin.client))
+
+    assert response.status_code == 200
+    assert list(response.context['time_records']) == open_records
+
+
+@pytest.mark.integration
+def test_GET_not_modified(client, client_admin_factory, time_record_factory):
+    """
+    Requesting the board with its current ETag should return a 304
+    response until a record changes.
+    """
+    admin = client_admin_factory()
+    record = time_record_factory(employee__client=admin.client)
+    url = get_url(admin.client)
+
+    client.force_login(admin.user)
+    etag = client.get(url)['ETag']
+
+    cached_response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    record.time_end = timezone.now()
+    record.save()
+    modified_response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    assert cached_response.status_code == 304
+    assert modified_response.status_code == 200
+    assert modified_response.context['time_records'].count() == 0
@@ -0,0 +1,162 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+
+
+@pytest.mark.integration
+def test_close_GET_as_other_user(client, pay_period_factory, user_factory):
+    """
+    Users who are not admins of the client should not be able to close
+    its pay periods.
+    """
+    pay_period = pay_period_factory()
+    url = reverse('vms:pay-period-close', kwargs={
+        'client_slug': pay_period.client.slug,
+        'pay_period_id': pay_period.id,
+    })
+
+    client.force_login(user_factory())
+    response = client.post(url)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_close_POST(
+        client,
+        client_admin_factory,
+        pay_period_factory,
+        time_record_factory):
+    """
+    Submitting the close form should close the pay period and redirect
+    to its details.
+    """
+    admin = client_admin_factory()
+    pay_period = pay_period_factory(client=admin.client)
+    url = reverse('vms:pay-period-close', kwargs={
+        'client_slug': pay_period.client.slug,
+        'pay_period_id': pay_period.id,
+    })
+
+    client.force_login(admin.user)
+    response = client.post(url)
+    pay_period.refresh_from_db()
+
+    assert response.status_code == 302
+    assert response.url == pay_period.get_absolute_url()
+    assert pay_period.is_closed
+
+
+@pytest.mark.integration
+def test_close_POST_open_records(
+        client,
+        client_admin_factory,
+        pay_period_factory,
+        time_record_factory):
+    """
+    If the pay period cannot be closed, the reason should be shown.
+    """
+    admin = client_admin_factory()
+    pay_period = pay_period_factory(client=admin.client)
+    time_record_factory(
+        employee__client=admin.client,
+        time_start=pay_period.start,
+    )
+    url = reverse('vms:pay-period-close', kwargs={
+        'client_slug': pay_period.client.slug,
+        'pay_period_id': pay_period.id,
+    })
+
+    client.force_login(admin.user)
+    response = client.post(url)
+    pay_period.refresh_from_db()
+
+    assert response.status_code == 200
+    assert response.context['form'].non_field_errors()
+    assert not pay_period.is_closed
+
+
+@pytest.mark.integration
+def test_create_POST(client, client_admin_factory):
+    """
+    Client admins should be able to create pay periods.
+    """
+    admin = client_admin_factory()
+    url = reverse('vms:pay-period-create', kwargs={
+        'client_slug': admin.client.slug,
+    })
+
+    client.force_login(admin.user)
+    response = client.post(url, {
+        'end_date': '2018-10-07',
+        'start_date': '2018-10-01',
+    })
+    pay_period = admin.client.pay_periods.get()
+
+    assert response.status_code == 302
+    assert response.url == pay_period.get_absolute_url()
+
+
+@pytest.mark.integration
+def test_detail_GET(
+        client,
+        client_admin_factory,
+        pay_period_factory,
+        time_record_factory):
+    """
+    The detail view should list the totals of the pay period.
+    """
+    admin = client_admin_factory()
+    pay_period = pay_period_factory(client=admin.client)
+    record = time_record_factory(
+        employee__client=admin.client,
+        pay_rate=10,
+        time_end=pay_period.start + datetime.timedelta(hours=2),
+        time_start=pay_period.start,
+    )
+
+    client.force_login(admin.user)
+    response = client.get(pay_period.get_absolute_url())
+    totals = response.context['totals']
+
+    assert response.status_code == 200
+    assert len(totals) == 1
+    assert totals[0]['employee'] == record.employee
+    assert totals[0]['job'] == record.job
+    assert response.context['total_earnings'] == 20
+
+
+@pytest.mark.integration
+def test_list_GET_as_other_user(client, client_factory, user_factory):
+    """
+    Users who are not admins of the client should receive a 404
+    response.
+    """
+    url = reverse('vms:pay-period-list', kwargs={
+        'client_slug': client_factory().slug,
+    })
+
+    client.force_login(user_factory())
+    response = client.get(url)
+
+    assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_list_GET(client, client_admin_factory, pay_period_factory):
+    """
+    The list view should show the client's pay periods.
+    """
+    admin = client_admin_factory()
+    pay_period = pay_period_factory(client=admin.client)
+    pay_period_factory()
+    url = reverse('vms:pay-period-list', kwargs={
+        'client_slug': admin.client.slug,
+    })
+
+    client.force_login(admin.user)
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert list(response.context['pay_periods']) == [pay_period]
@@ -0,0 +1,104 @@
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from vms import models, views
+
+
+def pending_url(client):
+    return reverse(
+        'vms:employee-pending',
+        kwargs={'client_slug': client.slug},
+    )
+
+
+def test_approve_selected(client, client_admin_factory, employee_factory):
+    """
+    Submitting the form should approve the selected employees and assign
+    them the chosen supervisor.
+    """
+    admin = client_admin_factory()
+    supervisor = client_admin_factory(client=admin.client)
+    selected = [
+        employee_factory(client=admin.client, is_active=False)
+        for _ in range(2)
+    ]
+    other = employee_factory(client=admin.client, is_active=False)
+    client.force_login(admin.user)
+
+    response = client.post(pending_url(admin.client), {
+        'employees': [employee.pk for employee in selected],
+        'supervisor': supervisor.pk,
+    })
+
+    assert response.status_code == 302
+
+    approved = models.Employee.objects.filter(pk__in=[e.pk for e in selected])
+    other.refresh_from_db()
+
+    assert all(employee.is_active for employee in approved)
+    assert {employee.approved_by for employee in approved} == {admin}
+    assert {employee.supervisor for employee in approved} == {supervisor}
+    assert other.time_approved is None
+
+
+def test_approve_other_client(client, client_admin_factory, employee_factory):
+    """
+    Employees of other clients should not be approved.
+    """
+    admin = client_admin_factory()
+    employee = employee_factory(is_active=False)
+    client.force_login(admin.user)
+
+    response = client.post(pending_url(admin.client), {
+        'employees': [employee.pk],
+        'supervisor': admin.pk,
+    })
+    employee.refresh_from_db()
+
+    assert response.status_code == 200
+    assert 'employees' in response.context['form'].errors
+    assert employee.time_approved is None
+
+
+def test_list_query_count(client, client_admin_factory, employee_factory):
+    """
+    The number of queries should not grow with the number of employees
+    listed.
+    """
+    admin = client_admin_factory()
+    employee_factory(client=admin.client, is_active=False)
+    client.force_login(admin.user)
+    url = pending_url(admin.client)
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as context:
+        client.get(url)
+    expected = len(context)
+
+    for _ in range(5):
+        employee_factory(client=admin.client, is_active=False)
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+
+    assert len(context) == expected
+    assert len(response.context['pending_employees']) == 6
+
+
+def test_list_paginated(client, client_admin_factory, employee_factory):
+    """
+    The pending employees should be split into pages.
+    """
+    admin = client_admin_factory()
+    for _ in range(3):
+        employee_factory(client=admin.client, is_active=False)
+    client.force_login(admin.user)
+
+    with mock.patch.object(views.PendingEmployeesView, 'paginate_by', 2):
+        response = client.get(pending_url(admin.client), {'page': 2})
+
+    assert response.status_code == 200
+    assert len(response.context['pending_employees']) == 1
@@ -0,0 +1,55 @@
+import datetime
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+
+@pytest.mark.integration
+def test_get_as_admin(
+        client,
+        staffing_agency_admin_factory,
+        time_record_factory):
+    """
+    Agency admins should receive a CSV file containing the time worked
+    by the agency's employees.
+    """
+    admin = staffing_agency_admin_factory()
+    start = timezone.now() - datetime.timedelta(hours=2)
+    record = time_record_factory(
+        employee__staffing_agency=admin.agency,
+        time_end=start + datetime.timedelta(hours=1),
+        time_start=start,
+    )
+    # Records of other agencies' employees are excluded.
+    time_record_factory(time_end=start + datetime.timedelta(hours=1))
+    url = reverse('vms:staffing-agency-billing-report', kwargs={
+        'staffing_agency_slug': admin.agency.slug,
+    })
+
+    client.force_login(admin.user)
+    response = client.get(url, {'period': 'month'})
+    lines = b''.join(response.streaming_content).decode().splitlines()
+
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'text/csv'
+    assert len(lines) == 2
+    assert lines[1].startswith(
+        f'{record.employee.client.name},{record.job.name},',
+    )
+
+
+@pytest.mark.integration
+def test_get_as_other_user(client, staffing_agency_factory, user_factory):
+    """
+    Users who are not admins of the agency should receive a 404.
+    """
+    agency = staffing_agency_factory()
+    url = reverse('vms:staffing-agency-billing-report', kwargs={
+        'staffing_agency_slug': agency.slug,
+    })
+
+    client.force_login(user_factory())
+    response = client.get(url)
+
+    assert response.status_code == 404
@@ -0,0 +1,170 @@
+from unittest import mock
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from vms import models, views
+
+
+def pending_url(agency):
+    return reverse(
+        'vms:staffing-agency-employee-pending',
+        kwargs={'staffing_agency_slug': agency.slug},
+    )
+
+
+def test_approve_selected(
+        client,
+        staffing_agency_admin_factory,
+        staffing_agency_employee_factory):
+    """
+    Submitting the form should approve only the selected employees.
+    """
+    admin = staffing_agency_admin_factory()
+    selected = staffing_agency_employee_factory(agency=admin.agency)
+    other = staffing_agency_employee_factory(agency=admin.agency)
+    client.force_login(admin.user)
+
+    response = client.post(pending_url(admin.agency), {
+        'employees': [selected.pk],
+    })
+    selected.refresh_from_db()
+    other.refresh_from_db()
+
+    assert response.status_code == 302
+    assert selected.is_approved
+    assert selected.approved_by == admin
+    assert not other.is_approved
+
+
+def test_approve_all(
+        client,
+        staffing_agency_admin_factory,
+        staffing_agency_employee_factory):
+    """
+    Approving all pending employees should only affect the admin's
+    agency.
+    """
+    admin = staffing_agency_admin_factory()
+    for _ in range(3):
+        staffing_agency_employee_factory(agency=admin.agency)
+    outsider = staffing_agency_employee_factory()
+    client.force_login(admin.user)
+
+    with CaptureQueriesContext(connection) as context:
+        response = client.post(pending_url(admin.agency), {
+            'approve_all': 'on',
+        })
+    outsider.refresh_from_db()
+
+    updates = [
+        query for query in context
+        if query['sql'].startswith('UPDATE')
+        and 'staffingagencyemployee' in query['sql']
+    ]
+
+    assert response.status_code == 302
+    assert not admin.agency.employees.filter(is_approved=False).exists()
+    assert not outsider.is_approved
+    assert len(updates) == 1
+
+
+def test_approve_other_agency(
+        client,
+        staffing_agency_admin_factory,
+        staffing_agency_employee_factory):
+    """
+    Applicants to other agencies should not be approved.
+    """
+    admin = staffing_agency_admin_factory()
+    outsider = staffing_agency_employee_factory()
+    client.force_login(admin.user)
+
+    response = client.post(pending_url(admin.agency), {
+        'employees': [outsider.pk],
+    })
+    outsider.refresh_from_db()
+
+    assert response.status_code == 200
+    assert not outsider.is_approved
+
+
+def test_approve_nothing_selected(
+        client,
+        staffing_agency_admin_factory,
+        staffing_agency_employee_factory):
+    """
+    Submitting the form without selecting anyone should show an error.
+    """
+    admin = staffing_agency_admin_factory()
+    staffing_agency_employee_factory(agency=admin.agency)
+    client.force_login(admin.user)
+
+    response = client.post(pending_url(admin.agency), {})
+
+    assert response.status_code == 200
+    assert response.context['form'].non_field_errors()
+    assert not models.StaffingAgencyEmployee.objects.filter(
+        is_approved=True,
+    ).exists()
+
+
+def test_list_paginated(
+        client,
+        staffing_agency_admin_factory,
+        staffing_agency_employee_factory):
+    """
+    The pending employees should be split into pages.
+    """
+    admin = staffing_agency_admin_factory()
+    for _ in range(3):
+        staffing_agency_employee_factory(agency=admin.agency)
+    client.force_login(admin.user)
+    view = views.StaffingAgencyEmployeePendingListView
+
+    with mock.patch.object(view, 'paginate_by', 2):
+        response = client.get(pending_url(admin.agency), {'page': 2})
+
+    assert response.status_code == 200
+    assert len(response.context['employees']) == 1
+
+
+def test_list_matches_approve_all(
+        client,
+        staffing_agency_admin_factory,
+        staffing_agency_employee_factory):
+    """
+    The list should show exactly the employees that approving all
+    pending employees would approve.
+    """
+    admin = staffing_agency_admin_factory()
+    # An employee whose approval was revoked keeps its approval time.
+    revoked = staffing_agency_employee_factory(
+        agency=admin.agency,
+        time_approved=timezone.now(),
+    )
+    staffing_agency_employee_factory(
+        agency=admin.agency,
+        is_approved=True,
+    )
+    client.force_login(admin.user)
+
+    response = client.get(pending_url(admin.agency))
+
+    assert list(response.context['employees']) == [revoked]
+    assert list(response.context['form'].pending_employees()) == [revoked]
+
+
+def test_list_not_admin(client, staffing_agency_factory, user_factory):
+    """
+    Users who do not administer the agency should receive a 404
+    response.
+    """
+    agency = staffing_agency_factory()
+    client.force_login(user_factory())
+
+    response = client.get(pending_url(agency))
+
+    assert response.status_code == 404
@@ -0,0 +1,73 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+from vms import models
+
+
+def roster_url(agency):
+    return reverse(
+        'vms:staffing-agency-roster-upload',
+        kwargs={'staffing_agency_slug': agency.slug},
+    )
+
+
+def test_upload_roster(client, client_factory, staffing_agency_admin_factory):
+    """
+    Uploading a valid roster should place its workers at the client and
+    redirect to the staffing agency.
+    """
+    admin = staffing_agency_admin_factory()
+    target = client_factory()
+    client.force_login(admin.user)
+
+    response = client.post(roster_url(admin.agency), {
+        'client': target.pk,
+        'roster': SimpleUploadedFile(
+            'roster.csv',
+            b'name,username\nJane Doe,jdoe\nJohn Smith,jsmith\n',
+        ),
+    })
+
+    assert response.status_code == 302
+    assert response.url == admin.agency.get_absolute_url()
+    assert models.Employee.objects.filter(client=target).count() == 2
+
+
+def test_upload_roster_errors(
+        client,
+        client_factory,
+        staffing_agency_admin_factory):
+    """
+    The problems with an invalid roster should be shown.
+    """
+    admin = staffing_agency_admin_factory()
+    target = client_factory()
+    client.force_login(admin.user)
+
+    response = client.post(roster_url(admin.agency), {
+        'client': target.pk,
+        'roster': SimpleUploadedFile(
+            'roster.csv',
+            b'name,username\nJane Doe,jdoe\nJane Doe,jdoe\n',
+        ),
+    })
+
+    assert response.status_code == 200
+    assert [e.line for e in response.context['roster_errors']] == [3]
+    assert not models.Employee.objects.filter(client=target).exists()
+
+
+def test_upload_roster_not_admin(
+        client,
+        staffing_agency_factory,
+        user_factory):
+    """
+    Users who do not administer the staffing agency should receive a
+    404 response.
+    """
+    agency = staffing_agency_factory()
+    client.force_login(user_factory())
+
+    response = client.get(roster_url(agency))
+
+    assert response.status_code == 404
@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 
 
@@ -33,3 +35,30 @@ def test_POST_as_other_user(client, time_record_factory, user_factory):
     response = client.post(url, {})
 
     assert response.status_code == 404
+
+
+@pytest.mark.integration
+def test_POST_locked(
+        client,
+        client_admin_factory,
+        pay_period_factory,
+        time_record_factory,
+        user_factory):
+    """
+    Time records in closed pay periods should not be approvable.
+    """
+    pay_period = pay_period_factory()
+    start = pay_period.start + datetime.timedelta(days=1)
+    time_record = time_record_factory(
+        employee__client=pay_period.client,
+        time_end=start + datetime.timedelta(hours=1),
+        time_start=start,
+    )
+    pay_period.close(user_factory())
+    admin = client_admin_factory(client=pay_period.client)
+    client.force_login(admin.user)
+
+    response = client.post(time_record.approval_url, {})
+
+    assert response.status_code == 404
+    assert not time_record.is_approved
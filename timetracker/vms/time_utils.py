@@ -1,3 +1,6 @@
+import datetime
+
+from django.utils import timezone
 
 
 def round_time_worked(time_worked, block_size=15 * 60):
@@ -20,3 +23,78 @@ def round_time_worked(time_worked, block_size=15 * 60):
     time_worked += block_size / 2
 
     return time_worked - (time_worked % block_size)
+
+
+def find_overlaps(intervals):
+    """
+    Find the overlapping intervals in a sorted sequence.
+
+    The intervals are swept in order while tracking the interval that
+    ends last, so each interval only has to be compared to that one.
+    This makes the search linear in the number of intervals and lets
+    the intervals be streamed rather than loaded into memory.
+
+    Args:
+        intervals:
+            An iterable of ``(key, group, start, end)`` tuples sorted by
+            ``group`` and then ``start``. Only intervals in the same
+            group are compared. An ``end`` of ``None`` indicates the
+            interval has not ended yet.
+
+    Yields:
+        A ``(key, other_key)`` tuple for each interval that overlaps an
+        earlier interval in the same group. ``other_key`` identifies the
+        earlier interval that ends last.
+    """
+    current_group = object()
+    latest_key = latest_end = None
+
+    for key, group, start, end in intervals:
+        if group != current_group:
+            current_group = group
+            latest_key, latest_end = key, end
+            continue
+
+        # Intervals sharing an endpoint, such as back to back shifts, do
+        # not overlap.
+        if latest_end is None or start < latest_end:
+            yield key, latest_key
+
+        if latest_end is not None and (end is None or end > latest_end):
+            latest_key, latest_end = key, end
+
+
+def split_by_local_day(start, end, tz):
+    """
+    Split a period between the local days it spans.
+
+    Args:
+        start:
+            The aware datetime the period begins at.
+        end:
+            The aware datetime the period ends at.
+        tz:
+            The time zone that days are determined in.
+
+    Yields:
+        A ``(date, duration)`` tuple for each local day the period
+        spans, in order, where ``duration`` is the elapsed time of the
+        period on that day as a ``datetime.timedelta``.
+    """
+    while start < end:
+        day = start.astimezone(tz).date()
+        # If midnight is skipped by a daylight saving time transition,
+        # the day begins at the transition.
+        midnight = timezone.make_aware(
+            datetime.datetime.combine(
+                day + datetime.timedelta(days=1),
+                datetime.time(),
+            ),
+            tz,
+            is_dst=False,
+        )
+        portion_end = min(end, midnight)
+
+        yield day, portion_end - start
+
+        start = portion_end
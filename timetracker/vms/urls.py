@@ -12,6 +12,11 @@ client_detail_urls = [
         views.ClientAdminInviteAcceptView.as_view(),
         name='client-admin-invite-accept',
     ),
+    path(
+        'clock-events/',
+        views.ClientClockEventStreamView.as_view(),
+        name='client-clock-events',
+    ),
     path(
         'employees/pending/',
         views.PendingEmployeesView.as_view(),
@@ -52,6 +57,36 @@ client_detail_urls = [
         views.ClientJobDetailView.as_view(),
         name='client-job-detail',
     ),
+    path(
+        'on-shift/',
+        views.OnShiftBoardView.as_view(),
+        name='on-shift-board',
+    ),
+    path(
+        'pay-periods/',
+        views.PayPeriodListView.as_view(),
+        name='pay-period-list',
+    ),
+    path(
+        'pay-periods/create/',
+        views.PayPeriodCreateView.as_view(),
+        name='pay-period-create',
+    ),
+    path(
+        'pay-periods/<uuid:pay_period_id>/',
+        views.PayPeriodDetailView.as_view(),
+        name='pay-period-detail',
+    ),
+    path(
+        'pay-periods/<uuid:pay_period_id>/close/',
+        views.PayPeriodCloseView.as_view(),
+        name='pay-period-close',
+    ),
+    path(
+        'report/',
+        views.ClientReportView.as_view(),
+        name='client-report',
+    ),
     path(
         'time-records/unapproved/',
         views.UnapprovedTimeRecordListView.as_view(),
@@ -71,11 +106,21 @@ staff_detail_urls = [
         views.StaffingAgencyDetailView.as_view(),
         name='staffing-agency-view',
     ),
+    path(
+        'billing.csv',
+        views.StaffingAgencyBillingReportView.as_view(),
+        name='staffing-agency-billing-report',
+    ),
     path(
         'employees/pending/',
         views.StaffingAgencyEmployeePendingListView.as_view(),
         name='staffing-agency-employee-pending',
     ),
+    path(
+        'employees/roster/',
+        views.StaffingAgencyRosterUploadView.as_view(),
+        name='staffing-agency-roster-upload',
+    ),
     path(
         'employees/<uuid:employee_id>/',
         views.StaffingAgencyEmployeeDetailView.as_view(),
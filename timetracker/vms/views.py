@@ -1,11 +1,19 @@
+import datetime
+
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.db.models import Q
+from django.core.exceptions import ValidationError
+from django.db.models import OuterRef, Q, Subquery
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from django.views import generic
 from django.views.generic import DetailView, FormView, ListView, TemplateView
 from django.urls import reverse_lazy
 
-from vms import forms, mixins, models, time_utils
+from vms import cache, events, forms, mixins, models, reports
 
 
 class ClientAdminInviteAcceptView(LoginRequiredMixin, generic.FormView):
@@ -83,6 +91,43 @@ class ClientCreateView(UserPassesTestMixin, generic.FormView):
         ).exists()
 
 
+class ClientClockEventStreamView(LoginRequiredMixin, generic.View):
+    """
+    Stream the clock in and clock out events of a client's employees as
+    server-sent events.
+
+    Each open stream occupies a worker thread for as long as it is
+    connected, so streams end after ``events.STREAM_DURATION`` seconds
+    and the client detail page only opens one when asked to. Deployments
+    serving many watchers should use a threaded or asynchronous worker
+    class.
+    """
+
+    def get(self, request, *args, **kwargs):
+        """
+        Open the event stream for the client in the URL.
+
+        Returns:
+            A streaming response of the client's clock events. Only
+            admins of the client may open the stream.
+        """
+        client = get_object_or_404(
+            models.Client,
+            admin__user=request.user,
+            slug=self.kwargs.get('client_slug'),
+        )
+
+        response = StreamingHttpResponse(
+            events.stream_clock_events(client),
+            content_type='text/event-stream',
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Prevent nginx from buffering the stream.
+        response['X-Accel-Buffering'] = 'no'
+
+        return response
+
+
 class ClientJobCreateView(LoginRequiredMixin, FormView):
     template_name = 'vms/client-job-create.html'
     form_class = forms.ClientJobCreate
@@ -147,7 +192,11 @@ class ClientJobDetailView(LoginRequiredMixin, generic.UpdateView):
         )
 
 
-class ClientJobListView(LoginRequiredMixin, generic.ListView):
+class ClientJobListView(
+    mixins.FragmentCacheMixin,
+    LoginRequiredMixin,
+    generic.ListView,
+):
     """
     List the jobs for a particular client.
     """
@@ -179,6 +228,10 @@ class ClientJobListView(LoginRequiredMixin, generic.ListView):
         context = super().get_context_data(object_list=object_list, **kwargs)
 
         context['client'] = self._client
+        context['client_cache_version'] = cache.get_version(
+            cache.CLIENT_NAMESPACE,
+            self._client.pk,
+        )
 
         return context
 
@@ -198,6 +251,69 @@ class ClientJobListView(LoginRequiredMixin, generic.ListView):
         return self._client.jobs.all()
 
 
+class ClientReportView(
+    LoginRequiredMixin,
+    mixins.DateRangeMixin,
+    generic.DetailView,
+):
+    """
+    Show a client's hours and earnings grouped by job, employee,
+    staffing agency, day, or week.
+    """
+    context_object_name = 'client'
+    grouping_param = 'group_by'
+    slug_url_kwarg = 'client_slug'
+    template_name = 'vms/client-report.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+
+        grouping = self.request.GET.get(self.grouping_param)
+        if grouping not in reports.GROUPINGS:
+            grouping = reports.DEFAULT_GROUPING
+
+        time_start, time_end = self.time_range
+        time_records = self.filter_by_date(
+            models.TimeRecord.objects.filter(employee__client=self.object),
+        )
+
+        rows = cache.get_or_set(
+            cache.CLIENT_NAMESPACE,
+            self.object.pk,
+            (
+                'report',
+                grouping,
+                time_start.isoformat() if time_start else '',
+                time_end.isoformat() if time_end else '',
+                # Days and weeks are bucketed in the active time zone.
+                timezone.get_current_timezone_name(),
+            ),
+            lambda: reports.summarize_time_records(time_records, grouping),
+        )
+
+        context['grouping'] = grouping
+        context['grouping_title'] = reports.GROUPINGS[grouping].title
+        context['groupings'] = [
+            (name, group_by.title)
+            for name, group_by in reports.GROUPINGS.items()
+        ]
+        context['rows'] = rows
+        context['total_billable_time'] = sum(
+            (row['billable_time'] for row in rows),
+            datetime.timedelta(0),
+        )
+        context['total_earnings'] = sum(row['earnings'] for row in rows)
+        context['total_time'] = sum(
+            (row['total_time'] for row in rows),
+            datetime.timedelta(0),
+        )
+
+        return context
+
+    def get_queryset(self):
+        return models.Client.objects.filter(admin__user=self.request.user)
+
+
 class ClockInView(LoginRequiredMixin, FormView):
     """
     View for clocking in.
@@ -206,7 +322,13 @@ class ClockInView(LoginRequiredMixin, FormView):
     template_name = 'vms/clock-in.html'
 
     def form_valid(self, form):
-        form.save()
+        try:
+            form.save()
+        except ValidationError as e:
+            form.add_error(None, e)
+
+            return self.form_invalid(form)
+
         return redirect(
             'vms:employee-dash',
             client_slug=form.employee.client.slug,
@@ -244,7 +366,12 @@ class ClockOutView(LoginRequiredMixin, FormView):
         Returns:
             A redirect response for the user.
         """
-        form.save()
+        try:
+            form.save()
+        except ValidationError as e:
+            form.add_error(None, e)
+
+            return self.form_invalid(form)
 
         return redirect(
             'vms:employee-dash',
@@ -294,15 +421,16 @@ class DashboardView(LoginRequiredMixin, TemplateView):
         clocked_in = any([e.is_clocked_in for e in employees])
         context['clocked_in'] = clocked_in
 
-        seconds_worked = sum([emp.total_time for emp in employees])
-        seconds_worked = time_utils.round_time_worked(seconds_worked)
-        total_hours = seconds_worked / (60 * 60)
+        total_time = models.TimeRecord.objects.filter(
+            employee__in=employees,
+        ).total_time(rounded=True)
+        total_hours = total_time.total_seconds() / (60 * 60)
         context['total_hours'] = total_hours
 
         return context
 
 
-class ClientDetailView(DetailView):
+class ClientDetailView(mixins.FragmentCacheMixin, DetailView):
     """
     Retrieve information about a specific client.
     """
@@ -509,9 +637,8 @@ class EmployeeDetailView(
         ).count()
         context['unapproved_count'] = unapproved_count
 
-        seconds_worked = shown_time_records.total_time().total_seconds()
-        seconds_worked = time_utils.round_time_worked(seconds_worked)
-        total_hours = seconds_worked / (60 * 60)
+        total_time = shown_time_records.total_time(rounded=True)
+        total_hours = total_time.total_seconds() / (60 * 60)
         context['total_hours'] = total_hours
 
         context['shown_time_records'] = shown_time_records
@@ -546,29 +673,397 @@ class EmployeeDetailView(
         )
 
 
-class PendingEmployeesView(LoginRequiredMixin, ListView):
+def on_shift_board_etag(request, client_slug):
     """
-    Can see the list of pending employees that need to be approved or stopped
+    Compute the entity tag of a client's on-shift board.
+
+    The board only changes when one of the client's time records does,
+    so the ID of the latest entry in the change log identifies its
+    state. Since the page also contains the user's navigation, the tag
+    is specific to the user.
+
+    Args:
+        request:
+            The request for the board.
+        client_slug:
+            The slug of the client whose board was requested.
+
+    Returns:
+        The entity tag of the board, or ``None`` if the requesting user
+        is not an admin of the client.
     """
-    context_object_name = 'pending_employees'
-    template_name = 'vms/employee-pending.html'
+    if not request.user.is_authenticated:
+        return None
+
+    latest_change = models.TimeRecordChange.objects.filter(
+        client_id=OuterRef('pk'),
+    ).order_by('-id').values('id')[:1]
+
+    client = models.Client.objects.filter(
+        admin__user=request.user,
+        slug=client_slug,
+    ).annotate(
+        latest_change=Subquery(latest_change),
+    ).values_list('latest_change', flat=True)
+
+    if not client:
+        return None
+
+    return f'{request.user.pk}-{client[0] or 0}'
+
+
+class OnShiftBoardView(LoginRequiredMixin, generic.ListView):
+    """
+    List the employees of a client who are currently clocked in.
+
+    The page is served with an entity tag so that browsers refreshing it
+    receive a "304 Not Modified" response until someone clocks in or
+    out.
+    """
+    context_object_name = 'time_records'
+    template_name = 'vms/on-shift.html'
+
+    @method_decorator(cache_control(no_cache=True, private=True))
+    @method_decorator(condition(etag_func=on_shift_board_etag))
+    def get(self, request, *args, **kwargs):
+        """
+        Render the board, or a "304 Not Modified" response if the
+        request's ``If-None-Match`` header matches its entity tag.
+
+        Returns:
+            A response containing the board, which must be revalidated
+            each time it is requested.
+        """
+        return super().get(request, *args, **kwargs)
+
+    def get_context_data(self, **kwargs):
+        """
+        Add the client to the template's context.
+
+        Returns:
+            A dictionary containing the context used to render the
+            view's template.
+        """
+        context = super().get_context_data(**kwargs)
+
+        context['client'] = self.client
+
+        return context
 
     def get_queryset(self):
         """
-        Get the jobs for the specified client.
+        Get the open time records of the client.
 
         Returns:
-            The jobs owned by the client whose slug is given in the URL.
+            A queryset containing the client's open time records along
+            with their employees and jobs.
         """
-        client = get_object_or_404(
+        self.client = get_object_or_404(
             models.Client,
+            admin__user=self.request.user,
             slug=self.kwargs.get('client_slug'),
+        )
+
+        return models.TimeRecord.objects.open().filter(
+            employee__client=self.client,
+        ).select_related(
+            'employee__user',
+            'job',
+        )
+
+
+class PayPeriodCloseView(LoginRequiredMixin, generic.FormView):
+    """
+    Close a pay period, freezing the totals of its time records.
+    """
+    form_class = forms.PayPeriodCloseForm
+    template_name = 'vms/pay-period-close.html'
+
+    def form_valid(self, form):
+        """
+        Close the pay period and redirect to its details.
+
+        Args:
+            form:
+                The valid form instance.
+
+        Returns:
+            A redirect response to the pay period.
+        """
+        try:
+            form.save()
+        except ValidationError as e:
+            form.add_error(None, e)
+
+            return self.form_invalid(form)
+
+        return redirect(form.pay_period)
+
+    def get_context_data(self, **kwargs):
+        """
+        Add the pay period being closed to the template's context.
+
+        Returns:
+            A dictionary containing the context used to render the
+            view's template.
+        """
+        context = super().get_context_data(**kwargs)
+
+        context['pay_period'] = context['form'].pay_period
+
+        return context
+
+    def get_form_kwargs(self):
+        """
+        Add the pay period and closing user to the form's arguments.
+
+        Returns:
+            The keyword arguments used to construct the form.
+        """
+        kwargs = super().get_form_kwargs()
+
+        kwargs['pay_period'] = get_object_or_404(
+            models.PayPeriod.objects.select_related('client'),
+            client__admin__user=self.request.user,
+            client__slug=self.kwargs.get('client_slug'),
+            id=self.kwargs.get('pay_period_id'),
+        )
+        kwargs['user'] = self.request.user
+
+        return kwargs
+
+
+class PayPeriodCreateView(LoginRequiredMixin, generic.FormView):
+    """
+    Create a pay period for a client.
+    """
+    form_class = forms.PayPeriodCreateForm
+    template_name = 'vms/pay-period-create.html'
+
+    def form_valid(self, form):
+        """
+        Create the pay period and redirect to its details.
+
+        Args:
+            form:
+                The valid form instance.
+
+        Returns:
+            A redirect response to the new pay period.
+        """
+        pay_period = form.save()
+
+        return redirect(pay_period)
+
+    def get_context_data(self, **kwargs):
+        """
+        Add the client to the template's context.
+
+        Returns:
+            A dictionary containing the context used to render the
+            view's template.
+        """
+        context = super().get_context_data(**kwargs)
+
+        context['client'] = self.client
+
+        return context
+
+    def get_form_kwargs(self):
+        """
+        Add the client from the URL to the form's arguments.
+
+        Returns:
+            The keyword arguments used to construct the form.
+        """
+        kwargs = super().get_form_kwargs()
+
+        self.client = get_object_or_404(
+            models.Client,
             admin__user=self.request.user,
+            slug=self.kwargs.get('client_slug'),
         )
-        return client.employees.filter(time_approved=None)
+        kwargs['client'] = self.client
+
+        return kwargs
+
 
+class PayPeriodDetailView(LoginRequiredMixin, generic.DetailView):
+    """
+    Show the totals of each employee and job in a pay period.
 
-class StaffingAgencyDetailView(generic.DetailView):
+    Closed periods are shown from their stored summaries rather than by
+    aggregating their time records.
+    """
+    context_object_name = 'pay_period'
+    pk_url_kwarg = 'pay_period_id'
+    template_name = 'vms/pay-period-detail.html'
+
+    def get_context_data(self, **kwargs):
+        """
+        Add the pay period's totals to the template's context.
+
+        Returns:
+            A dictionary containing the context used to render the
+            view's template, including the ``totals`` of each employee
+            and job with their objects attached, and the
+            ``total_earnings`` of the period.
+        """
+        context = super().get_context_data(**kwargs)
+
+        totals = self.object.get_totals()
+
+        employees = models.Employee.objects.select_related('user').in_bulk(
+            {row['employee_id'] for row in totals},
+        )
+        jobs = models.ClientJob.objects.in_bulk(
+            {row['job_id'] for row in totals if row['job_id']},
+        )
+        for row in totals:
+            row['employee'] = employees.get(row['employee_id'])
+            row['job'] = jobs.get(row['job_id'])
+
+        context['totals'] = totals
+        context['total_earnings'] = sum(row['earnings'] for row in totals)
+
+        return context
+
+    def get_queryset(self):
+        """
+        Get the pay periods that may be shown.
+
+        Returns:
+            A queryset containing the pay periods of the client in the
+            URL, if the requesting user administers it.
+        """
+        return models.PayPeriod.objects.filter(
+            client__admin__user=self.request.user,
+            client__slug=self.kwargs.get('client_slug'),
+        ).select_related('client', 'closed_by')
+
+
+class PayPeriodListView(LoginRequiredMixin, generic.ListView):
+    """
+    List the pay periods of a client.
+    """
+    context_object_name = 'pay_periods'
+    template_name = 'vms/pay-period-list.html'
+
+    def get_context_data(self, **kwargs):
+        """
+        Add the client to the template's context.
+
+        Returns:
+            A dictionary containing the context used to render the
+            view's template.
+        """
+        context = super().get_context_data(**kwargs)
+
+        context['client'] = self.client
+
+        return context
+
+    def get_queryset(self):
+        """
+        Get the pay periods to list.
+
+        Returns:
+            A queryset containing the pay periods of the client in the
+            URL, if the requesting user administers it.
+        """
+        self.client = get_object_or_404(
+            models.Client,
+            admin__user=self.request.user,
+            slug=self.kwargs.get('client_slug'),
+        )
+
+        return self.client.pay_periods.all()
+
+
+class PendingEmployeesView(
+    LoginRequiredMixin,
+    mixins.BulkApprovalMixin,
+    ListView,
+):
+    """
+    List the employees waiting to be approved by a client, and approve
+    several of them at once.
+    """
+    admin_model = models.ClientAdmin
+    context_object_name = 'pending_employees'
+    form_class = forms.EmployeeBulkApprovalForm
+    organization_field = 'client'
+    organization_slug_url_kwarg = 'client_slug'
+    paginate_by = 50
+    success_url_name = 'vms:employee-pending'
+    template_name = 'vms/employee-pending.html'
+
+    def get_queryset(self):
+        """
+        Returns:
+            The pending employees of the client whose slug is given in
+            the URL.
+        """
+        return self.admin.client.employees.filter(
+            time_approved=None,
+        ).select_related(
+            'client',
+            'staffing_agency',
+            'user',
+        ).order_by(
+            'time_created',
+            'id',
+        )
+
+
+class StaffingAgencyBillingReportView(
+    LoginRequiredMixin,
+    mixins.DateRangeMixin,
+    generic.View,
+):
+    """
+    Download a CSV file billing the clients of a staffing agency for the
+    time worked by the agency's employees.
+    """
+    period_param = 'period'
+
+    def get(self, request, *args, **kwargs):
+        agency = get_object_or_404(
+            models.StaffingAgency,
+            admin__user=request.user,
+            slug=kwargs.get('staffing_agency_slug'),
+        )
+
+        period = request.GET.get(self.period_param)
+        if period not in reports.BILLING_PERIODS:
+            period = reports.DEFAULT_BILLING_PERIOD
+
+        time_records = self.filter_by_date(
+            models.TimeRecord.objects.filter(
+                employee__staffing_agency=agency,
+            ),
+        )
+        rows = reports.billing_rows(
+            time_records,
+            agency.markup_percent,
+            period,
+        )
+
+        response = StreamingHttpResponse(
+            reports.stream_csv(reports.BILLING_HEADER, rows),
+            content_type='text/csv',
+        )
+        response['Content-Disposition'] = (
+            f'attachment; filename="{agency.slug}-billing.csv"'
+        )
+
+        return response
+
+
+class StaffingAgencyDetailView(
+    mixins.FragmentCacheMixin,
+    generic.DetailView,
+):
     """
     Retrieve information about a specific staffing agency.
     """
@@ -621,7 +1116,7 @@ class StaffingAgencyEmployeeApproveView(LoginRequiredMixin, generic.FormView):
 
         return redirect(
             'vms:staffing-agency-employee-pending',
-            staffing_agency_slug=form.employee.agency.slug,
+            staffing_agency_slug=self.kwargs.get('staffing_agency_slug'),
         )
 
     def get_form_kwargs(self):
@@ -724,19 +1219,22 @@ class StaffingAgencyEmployeeDetailView(LoginRequiredMixin, generic.DetailView):
 
 class StaffingAgencyEmployeePendingListView(
     LoginRequiredMixin,
+    mixins.BulkApprovalMixin,
     generic.ListView,
 ):
     """
-    List the pending employees for a staffing agency.
+    List the pending employees for a staffing agency, and approve
+    several of them at once.
     """
+    admin_model = models.StaffingAgencyAdmin
     context_object_name = 'employees'
+    form_class = forms.StaffingAgencyEmployeeBulkApprovalForm
+    organization_field = 'agency'
+    organization_slug_url_kwarg = 'staffing_agency_slug'
+    paginate_by = 50
+    success_url_name = 'vms:staffing-agency-employee-pending'
     template_name = 'vms/staffing-agency-employee-pending.html'
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self._agency = None
-
     def get_context_data(self, *args, **kwargs):
         """
         Returns:
@@ -744,7 +1242,7 @@ class StaffingAgencyEmployeePendingListView(
         """
         context = super().get_context_data(*args, **kwargs)
 
-        context['agency'] = self._agency
+        context['agency'] = self.admin.agency
 
         return context
 
@@ -754,13 +1252,70 @@ class StaffingAgencyEmployeePendingListView(
             A queryset containing the pending employees for the staffing
             agency whose slug is given in the URL.
         """
-        self._agency = get_object_or_404(
-            models.StaffingAgency,
-            admin__user=self.request.user,
-            slug=self.kwargs.get('staffing_agency_slug'),
+        return self.admin.agency.employees.pending().select_related(
+            'agency',
+            'user',
+        ).order_by(
+            'time_created',
+            'id',
+        )
+
+
+class StaffingAgencyRosterUploadView(LoginRequiredMixin, generic.FormView):
+    """
+    Place the workers listed in a roster file at a client.
+    """
+    form_class = forms.StaffingAgencyRosterUploadForm
+    template_name = 'vms/staffing-agency-roster-upload.html'
+
+    def form_valid(self, form):
+        """
+        Import the roster and redirect back to the staffing agency.
+
+        Args:
+            form:
+                The valid form containing the roster.
+
+        Returns:
+            A response redirecting the user to the staffing agency's
+            detail view if the roster was imported. Otherwise the form
+            is rendered again with the problems found in the roster.
+        """
+        result = form.save()
+
+        if result.errors:
+            return self.render_to_response(
+                self.get_context_data(form=form, roster_errors=result.errors),
+            )
+
+        return redirect(form.admin.agency.get_absolute_url())
+
+    def get_context_data(self, **kwargs):
+        """
+        Returns:
+            The context used to render the view's template.
+        """
+        context = super().get_context_data(**kwargs)
+
+        context['agency'] = context['form'].admin.agency
+
+        return context
+
+    def get_form_kwargs(self):
+        """
+        Returns:
+            A dictionary containing the keyword arguments used to
+            instantiate the view's form class.
+        """
+        kwargs = super().get_form_kwargs()
+
+        kwargs['admin'] = get_object_or_404(
+            models.StaffingAgencyAdmin.objects.select_related('agency'),
+            agency__slug=self.kwargs.get('staffing_agency_slug'),
+            user=self.request.user,
         )
 
-        return self._agency.employees.filter(time_approved=None)
+        return kwargs
 
 
 class TimeRecordApproveView(LoginRequiredMixin, generic.FormView):
@@ -807,7 +1362,7 @@ class TimeRecordApproveView(LoginRequiredMixin, generic.FormView):
 
         kwargs['approving_user'] = self.request.user
         kwargs['time_record'] = get_object_or_404(
-            models.TimeRecord,
+            models.TimeRecord.objects.unlocked(),
             employee__client__admin__user=self.request.user,
             id=self.kwargs.get('time_record_id'),
         )
@@ -828,7 +1383,8 @@ class UnapprovedTimeRecordListView(LoginRequiredMixin, generic.ListView):
 
         Returns:
             A queryset containing the unapproved time records for the
-            client specified in the URL.
+            client specified in the URL, excluding records in closed
+            pay periods.
         """
         client = get_object_or_404(
             models.Client,
@@ -836,7 +1392,7 @@ class UnapprovedTimeRecordListView(LoginRequiredMixin, generic.ListView):
             slug=self.kwargs.get('client_slug'),
         )
 
-        return models.TimeRecord.objects.exclude(
+        return models.TimeRecord.objects.unlocked().exclude(
             time_end=None,
         ).filter(
             approval=None,